@@ -37,6 +37,7 @@ from .driver import energy, properties, hessian, gradient, frequency
 from .driver import optking, geometric, optimize
 from .driver import vpt2
 from .driver import diatomic
+from .driver import scan
 from .driver.cbs_driver import cbs
 from .driver.cbs_helpers import *
 from .driver.driver_helpers import get_variable, has_variable, print_variables, variable
@@ -44,6 +45,7 @@ from .driver.driver_helpers import set_keywords, set_options, get_active_options
 from .driver.driver_helpers import set_molecule, activate
 from .driver.yaml import yaml_run
 from .driver.compute import compute
+from .driver.result_cache import enable_result_cache, disable_result_cache
 from .exceptions import *
 
 from .basisset import BasisSet, basishorde
@@ -2,8 +2,10 @@ import collections
 import hashlib
 import itertools
 import os
+import threading
 from typing import Callable, Dict, Union
 
+import numpy as np
 import qcelemental as qcel
 
 from ..driver import pe
@@ -12,10 +14,15 @@ from ..molecule import Molecule
 from ..util import search_file
 from .basislist import corresponding_basis, corresponding_zeta
 from .libmintsbasissetparser import Gaussian94BasisSetParser
-from .libmintsgshell import ShellInfo
+from .libmintsgshell import ShellInfo, cartesian_exponents, cartesian_to_pure
 
 basishorde = {}
 
+# Rendered text of the shells on a center, by format and shell content, most recently used last
+_center_text_cache = collections.OrderedDict()
+_center_text_cache_size = 1024
+_center_text_cache_lock = threading.Lock()
+
 
 class BasisSet(object):
     """Basis set container class
@@ -85,6 +92,10 @@ class BasisSet(object):
         self.center_to_nshell = None
         # What's the first shell on each center?
         self.center_to_shell = None
+        # Which label and basis in the shell map does each center take its shells from?
+        self.center_to_source = None
+        # Digest of the shell content per label and basis
+        self.source_fingerprint = None
 
         # The flattened lists of unique exponents
         self.uexponents = None
@@ -269,6 +280,7 @@ class BasisSet(object):
         self.shell_center = [0] * self.n_shells
         self.center_to_nshell = [0] * natom
         self.center_to_shell = [0] * natom
+        self.center_to_source = [None] * natom
 
         # Now loop over all atoms, and point to the appropriate unique data
         shell_count = 0
@@ -288,6 +300,7 @@ class BasisSet(object):
             nshells = len(shells)
             self.center_to_nshell[n] = nshells
             self.center_to_shell[n] = shell_count
+            self.center_to_source[n] = (label, basis)
             atom_nprim = 0
             for i in range(nshells):
                 thisshell = shells[i]
@@ -836,17 +849,19 @@ class BasisSet(object):
                     if fullfilename is None:
                         # -- Else skip to next bas
                         continue
-                    # Store contents so not reloading files
+                    # Contents not stored, as parse_file reads only an entry's blocks through the file index
                     index = 'file %s' % (fullfilename)
-                    if index not in names:
-                        names[index] = parser.load_file(fullfilename)
+                    names[index] = None
 
                 lines = names[index]
 
                 for entry in seek['entry']:
 
                     # Seek entry in lines, else skip to next entry
-                    shells, msg, ecp_shells, ecp_msg, ecp_ncore = parser.parse(entry, lines)
+                    if lines is None:
+                        shells, msg, ecp_shells, ecp_msg, ecp_ncore = parser.parse_file(entry, fullfilename)
+                    else:
+                        shells, msg, ecp_shells, ecp_msg, ecp_ncore = parser.parse(entry, lines)
                     if shells is None:
                         continue
 
@@ -899,11 +914,14 @@ class BasisSet(object):
         # Construct all the one-atom BasisSet-s for mol's CoordEntry-s
         atom_basis_list = []
         for at in range(mol.natom()):
-            oneatombasis = BasisSet(basisset, at)
-            oneatombasishash = hashlib.sha1(oneatombasis.print_detail(numbersonly=True).encode('utf-8')).hexdigest()
             if return_atomlist:
+                oneatombasis = BasisSet(basisset, at)
+                oneatombasishash = hashlib.sha1(oneatombasis.print_detail(numbersonly=True).encode('utf-8')).hexdigest()
                 oneatombasis.molecule.set_shell_by_number(0, oneatombasishash, role=key)
                 atom_basis_list.append(oneatombasis)
+            else:
+                # same hash, without constructing the one-atom BasisSet
+                oneatombasishash = basisset.rendered_center(at, 'hash', BasisSet._one_atom_hash)
             mol.set_shell_by_number(at, oneatombasishash, role=key)
 
         mol.update_geometry()  # re-evaluate symmetry taking basissets into account
@@ -1079,6 +1097,54 @@ class BasisSet(object):
 
     # <<< Methods for Printing >>>
 
+    def center_fingerprint(self, center):
+        """Returns a digest of the shells on *center*, the same for any center
+        of any BasisSet bearing the same shells. Computed once per label and
+        basis of the shell map for BasisSets constructed from one.
+
+        """
+        source = center if self.center_to_source is None else self.center_to_source[center]
+        if self.source_fingerprint is None:
+            self.source_fingerprint = {}
+        if source not in self.source_fingerprint:
+            first_shell = self.center_to_shell[center]
+            content = [(shell.am(), shell.is_pure(), shell.PYexp, shell.PYoriginal_coef)
+                       for shell in self.shells[first_shell:first_shell + self.center_to_nshell[center]]]
+            self.source_fingerprint[source] = hashlib.sha1(repr(content).encode('utf-8')).hexdigest()
+        return self.source_fingerprint[source]
+
+    def rendered_center(self, center, fmt, render):
+        """Returns *render* of the list of shells on *center*. Memoized by
+        format *fmt* and shell content across BasisSets (LRU), so a basis for
+        an element is formatted once rather than once per atom and job.
+
+        """
+        key = (fmt, self.center_fingerprint(center))
+        with _center_text_cache_lock:
+            if key in _center_text_cache:
+                _center_text_cache.move_to_end(key)
+                return _center_text_cache[key]
+
+        first_shell = self.center_to_shell[center]
+        text = render(self.shells[first_shell:first_shell + self.center_to_nshell[center]])
+
+        with _center_text_cache_lock:
+            _center_text_cache[key] = text
+            if len(_center_text_cache) > _center_text_cache_size:
+                _center_text_cache.popitem(last=False)
+        return text
+
+    @staticmethod
+    def _one_atom_hash(shells):
+        """Hash of print_detail(numbersonly=True) of the one-atom BasisSet of *shells*."""
+        puream = shells[-1].is_pure() if shells else False
+        text = """    spherical\n""" if puream else """    cartesian\n"""
+        text += """    ****\n"""
+        text += ''.join(shell.pyprint(outfile=None) for shell in shells)
+        text += """    ****\n"""
+        text += """\n"""
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
     def print_by_level(self, out=None, level=2):
         """Print basis set information according to the level of detail in print_level
         @param out The file stream to use for printing. Defaults to outfile.
@@ -1201,11 +1267,8 @@ class BasisSet(object):
             A = self.molecule.unique(uA)
             if not numbersonly:
                 text += """   %2s %3d\n""" % (self.molecule.symbol(A), A + 1)
-            first_shell = self.center_to_shell[A]
-            n_shell = self.center_to_nshell[A]
-
-            for Q in range(n_shell):
-                text += self.shells[Q + first_shell].pyprint(outfile=None)
+            text += self.rendered_center(A, 'psi4',
+                                         lambda shells: ''.join(shell.pyprint(outfile=None) for shell in shells))
             text += """    ****\n"""
         text += """\n"""
 
@@ -1265,11 +1328,8 @@ class BasisSet(object):
             A = self.molecule.unique(uA)
             if not numbersonly:
                 text += """%s\n""" % (qcel.periodictable.to_symbol(self.molecule.Z(A)))
-            first_shell = self.center_to_shell[A]
-            n_shell = self.center_to_nshell[A]
-
-            for Q in range(n_shell):
-                text += self.shells[Q + first_shell].pyprint_gamess(outfile=None)
+            text += self.rendered_center(A, 'gamess',
+                                         lambda shells: ''.join(shell.pyprint_gamess(outfile=None) for shell in shells))
             #text += """    ****\n"""
             if return_list:
                 blst.append(text)
@@ -1297,79 +1357,85 @@ class BasisSet(object):
             text += """qcdb basis %s for element %s atom %d\n\n""" % \
                 (self.name.upper(), self.molecule.symbol(A), A + 1)
 
-            first_shell = self.center_to_shell[A]
-            n_shell = self.center_to_nshell[A]
+            text += self.rendered_center(A, 'cfour', BasisSet._print_center_cfour)
 
-            max_am_center = 0
-            for Q in range(n_shell):
-                if self.shells[Q + first_shell].am() > max_am_center:
-                    max_am_center = self.shells[Q + first_shell].am()
+        if out is None:
+            return text
+        else:
+            with open(out, mode='w') as handle:
+                handle.write(text)
 
-                #max_am_center = self.shells[Q + first_shell].am() if \
-                #self.shells[Q + first_shell].am() > max_am_center else max_am_center
+    @staticmethod
+    def _print_center_cfour(shells):
+        """Returns the CFOUR-style entry of *shells* of a center after its title lines."""
+        text = ''
 
-            shell_per_am = [[] for i in range(max_am_center + 1)]
-            for Q in range(n_shell):
-                shell_per_am[self.shells[Q + first_shell].am()].append(Q)
+        max_am_center = 0
+        for Q in range(len(shells)):
+            if shells[Q].am() > max_am_center:
+                max_am_center = shells[Q].am()
 
-            # Write number of shells in the basis set
-            text += """%3d\n""" % (max_am_center + 1)
+            #max_am_center = shells[Q].am() if \
+            #shells[Q].am() > max_am_center else max_am_center
 
-            # Write angular momentum for each shell
-            for am in range(max_am_center + 1):
-                text += """%5d""" % (am)
-            text += '\n'
+        shell_per_am = [[] for i in range(max_am_center + 1)]
+        for Q in range(len(shells)):
+            shell_per_am[shells[Q].am()].append(Q)
 
-            # Write number of contracted basis functions for each shell
-            for am in range(max_am_center + 1):
-                text += """%5d""" % (len(shell_per_am[am]))
-            text += '\n'
+        # Write number of shells in the basis set
+        text += """%3d\n""" % (max_am_center + 1)
 
-            exp_per_am = [[] for i in range(max_am_center + 1)]
-            coef_per_am = [[] for i in range(max_am_center + 1)]
-            for am in range(max_am_center + 1):
-                # Collect unique exponents among all functions
-                for Q in range(len(shell_per_am[am])):
-                    for K in range(self.shells[shell_per_am[am][Q] + first_shell].nprimitive()):
-                        if self.shells[shell_per_am[am][Q] + first_shell].exp(K) not in exp_per_am[am]:
-                            exp_per_am[am].append(self.shells[shell_per_am[am][Q] + first_shell].exp(K))
-
-                # Collect coefficients for each exp among all functions, zero otherwise
-                for Q in range(len(shell_per_am[am])):
-                    K = 0
-                    for ep in range(len(exp_per_am[am])):
-                        if abs(exp_per_am[am][ep] - self.shells[shell_per_am[am][Q] + first_shell].exp(K)) < 1.0e-8:
-                            coef_per_am[am].append(self.shells[shell_per_am[am][Q] + first_shell].original_coef(K))
-                            if (K + 1) != self.shells[shell_per_am[am][Q] + first_shell].nprimitive():
-                                K += 1
-                        else:
-                            coef_per_am[am].append(0.0)
-
-            # Write number of exponents for each shell
-            for am in range(max_am_center + 1):
-                text += """%5d""" % (len(exp_per_am[am]))
-            text += '\n\n'
-
-            for am in range(max_am_center + 1):
-                # Write exponents for each shell
-                for ep in range(len(exp_per_am[am])):
-                    text += """%14.7f""" % (exp_per_am[am][ep])
-                    if ((ep + 1) % 5 == 0) or ((ep + 1) == len(exp_per_am[am])):
-                        text += '\n'
-                text += '\n'
+        # Write angular momentum for each shell
+        for am in range(max_am_center + 1):
+            text += """%5d""" % (am)
+        text += '\n'
 
-                # Write contraction coefficients for each shell
+        # Write number of contracted basis functions for each shell
+        for am in range(max_am_center + 1):
+            text += """%5d""" % (len(shell_per_am[am]))
+        text += '\n'
+
+        exp_per_am = [[] for i in range(max_am_center + 1)]
+        coef_per_am = [[] for i in range(max_am_center + 1)]
+        for am in range(max_am_center + 1):
+            # Collect unique exponents among all functions
+            for Q in range(len(shell_per_am[am])):
+                for K in range(shells[shell_per_am[am][Q]].nprimitive()):
+                    if shells[shell_per_am[am][Q]].exp(K) not in exp_per_am[am]:
+                        exp_per_am[am].append(shells[shell_per_am[am][Q]].exp(K))
+
+            # Collect coefficients for each exp among all functions, zero otherwise
+            for Q in range(len(shell_per_am[am])):
+                K = 0
                 for ep in range(len(exp_per_am[am])):
-                    for bf in range(len(shell_per_am[am])):
-                        text += """%10.7f """ % (coef_per_am[am][bf * len(exp_per_am[am]) + ep])
+                    if abs(exp_per_am[am][ep] - shells[shell_per_am[am][Q]].exp(K)) < 1.0e-8:
+                        coef_per_am[am].append(shells[shell_per_am[am][Q]].original_coef(K))
+                        if (K + 1) != shells[shell_per_am[am][Q]].nprimitive():
+                            K += 1
+                    else:
+                        coef_per_am[am].append(0.0)
+
+        # Write number of exponents for each shell
+        for am in range(max_am_center + 1):
+            text += """%5d""" % (len(exp_per_am[am]))
+        text += '\n\n'
+
+        for am in range(max_am_center + 1):
+            # Write exponents for each shell
+            for ep in range(len(exp_per_am[am])):
+                text += """%14.7f""" % (exp_per_am[am][ep])
+                if ((ep + 1) % 5 == 0) or ((ep + 1) == len(exp_per_am[am])):
                     text += '\n'
+            text += '\n'
+
+            # Write contraction coefficients for each shell
+            for ep in range(len(exp_per_am[am])):
+                for bf in range(len(shell_per_am[am])):
+                    text += """%10.7f """ % (coef_per_am[am][bf * len(exp_per_am[am]) + ep])
                 text += '\n'
+            text += '\n'
 
-        if out is None:
-            return text
-        else:
-            with open(out, mode='w') as handle:
-                handle.write(text)
+        return text
 
     def print_detail_nwchem(self, out=None, numbersonly=False):
         """Prints a detailed NWChem-style summary of the basis (per-atom)
@@ -1383,14 +1449,15 @@ class BasisSet(object):
             text += """# qcdb basis %s for element %s atom %d\n""" % \
                 (self.name.upper(), self.molecule.symbol(A), A + 1)
 
-            first_shell = self.center_to_shell[A]
-            n_shell = self.center_to_nshell[A]
+            shell_texts = self.rendered_center(A, 'nwchem',
+                                               lambda shells: tuple(shell.pyprint_nwchem(outfile=None) for shell in shells))
 
-            for Q in range(n_shell):
-                if not numbersonly:
-                    text += """%s%s%d """ % ("" if self.molecule.Z(A) > 0 else "bq", self.molecule.symbol(A).capitalize(), A + 1)
-                    # TODO revisit and figure out right mixture of unique/numbered for mixed basis sets incl. ghost
-                text += self.shells[Q + first_shell].pyprint_nwchem(outfile=None)
+            if numbersonly:
+                text += ''.join(shell_texts)
+            else:
+                label = """%s%s%d """ % ("" if self.molecule.Z(A) > 0 else "bq", self.molecule.symbol(A).capitalize(), A + 1)
+                # TODO revisit and figure out right mixture of unique/numbered for mixed basis sets incl. ghost
+                text += ''.join(label + shell_text for shell_text in shell_texts)
         text += """\n"""
 
         if out is None:
@@ -1508,36 +1575,69 @@ class BasisSet(object):
         """Returns the vector of sorted shell list. Defunct"""
         raise FeatureNotImplemented('BasisSet::get_ao_sorted_list')
 
-    def compute_phi(self, phi_ao, x, y, z):
-        """Returns the values of the basis functions at a point"""
+    def compute_phi(self, points, deriv=0, chunk_size=16384):
+        """Evaluate the basis functions at many points at once.
+
+        Parameters
+        ----------
+        points : array-like
+            (N, 3) Cartesian coordinates [a0] at which to evaluate, in the frame of the molecule.
+        deriv : {0, 1}
+            Also return the first derivatives of the basis functions if 1.
+        chunk_size : int
+            Largest number of points evaluated together, bounding scratch memory to a few
+            (chunk_size, nprimitive) arrays per shell.
+
+        Returns
+        -------
+        numpy.ndarray
+            (N, nbf) values of the basis functions, spherical if has_puream() and Cartesian otherwise.
+            Spherical functions are ordered m = 0, 1, -1, 2, -2, ... within each shell.
+            If `deriv` is 1, (4, N, nbf) values and x, y, z derivatives.
+
+        """
+        if deriv not in [0, 1]:
+            raise ValidationError(f"BasisSet::compute_phi: deriv must be 0 or 1, not {deriv}")
+
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        npoints = points.shape[0]
+        nbf = self.nbf() if self.puream else self.nao()
+        phi = np.zeros((1 + 3 * deriv, npoints, nbf))
 
-        phi_ao = [0.0] * self.nao()
-        ao = 0
-        for ns in range(self.nshell()):
-            shell = self.shells[ns]
+        for shell, first, center in zip(self.shells, self.shell_first_basis_function, self.shell_center):
             am = shell.am()
-            nprim = shell.nprimitive()
-            a = shell.exps()
-            c = shell.coefs()
-
-            xyz = shell.center()
-            dx = x - xyz[0]
-            dy = y - xyz[1]
-            dz = z - xyz[2]
-            rr = dx * dx + dy * dy + dz * dz
-
-            cexpr = 0
-            for np in range(nprim):
-                cexpr += c[np] * math.exp(-a[np] * rr)
-
-            for l in range(INT_NCART(am)):
-                components = exp_ao[am][l]
-                phi_ao[ao + l] += pow(dx, components[0]) * \
-                                pow(dy, components[1]) * \
-                                pow(dz, components[2]) * \
-                                cexpr
-
-            ao += INT_NCART(am)
+            exps = np.asarray(shell.exps())
+            coefs = np.asarray(shell.coefs())
+            powers = np.array(cartesian_exponents(am))  # (ncart, 3)
+            xyz = self.molecule.xyz(center, np_out=True)
+            tfm = np.array(cartesian_to_pure(am)).T if self.puream else None
+
+            for p0 in range(0, npoints, chunk_size):
+                dr = points[p0:p0 + chunk_size] - xyz
+                gaussians = np.exp(-np.outer(np.einsum("pi,pi->p", dr, dr), exps))
+                radial = gaussians @ coefs
+
+                # monomials[k, p, i] = dr[p, i]**k
+                monomials = np.ones((am + 2, dr.shape[0], 3))
+                for k in range(1, am + 2):
+                    monomials[k] = monomials[k - 1] * dr
+                angular = monomials[powers, :, [0, 1, 2]].prod(axis=1)  # (ncart, chunk)
+
+                block = [(angular * radial).T]
+                if deriv:
+                    dradial = gaussians @ (-2.0 * exps * coefs)
+                    for i in range(3):
+                        lowered = powers.copy()
+                        lowered[:, i] = np.maximum(lowered[:, i] - 1, 0)
+                        dangular = powers[:, i, None] * monomials[lowered, :, [0, 1, 2]].prod(axis=1)
+                        block.append((dangular * radial + angular * dr[:, i] * dradial).T)
+
+                for n, values in enumerate(block):
+                    if tfm is not None:
+                        values = values @ tfm
+                    phi[n, p0:p0 + chunk_size, first:first + values.shape[1]] = values
+
+        return phi if deriv else phi[0]
 
     def concatenate(self, b):
         """Concatenates two basis sets together into a new basis without
@@ -1,9 +1,98 @@
+import functools
+import mmap
 import os
 import re
 
-from ..exceptions import ValidationError
+from ..exceptions import BasisSetFileNotFound, ValidationError
 from .libmintsgshell import ShellInfo
 
+# atom line opening a basis or ECP block, e.g., 'H     0' or 'C  N  O  0'. Same as in parse()
+_ATOM = r'(([A-Z]{1,3}\d*)|([A-Z]{1,3}_\w+))'
+_atom_array = re.compile(r'^\s*((' + _ATOM + r'\s+)+)0\s*$', re.IGNORECASE)
+_cartesian = re.compile(r'^\s*cartesian\s*', re.IGNORECASE)
+_spherical = re.compile(r'^\s*spherical\s*', re.IGNORECASE)
+
+# gbs filename -> ((mtime_ns, size), {entry: [(start byte, end byte, first line number, puream), ...]})
+_gbs_index = {}
+
+
+def _file_stamp(filename):
+    stat = os.stat(filename)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def gbs_index(filename):
+    """Locate the blocks of each atom entry in gbs file *filename*.
+    The index is built by one pass over the file and kept until the
+    file's modification time or size changes.
+
+    Returns
+    -------
+    dict
+        Uppercase entry (e.g., 'H', 'RB') to list of (start byte, end byte,
+        number of line preceding block, puream in effect) for each basis or
+        ECP block naming it, in file order. Puream is None if the file hasn't
+        said "cartesian" or "spherical" by then.
+
+    """
+    stamp = _file_stamp(filename)
+    if filename in _gbs_index and _gbs_index[filename][0] == stamp:
+        return _gbs_index[filename][1]
+
+    index = {}
+    blocks = []  # (names, start, lineno, puream)
+    puream = None
+    offset = 0
+    with open(filename, 'rb') as handle:
+        for lineno, bline in enumerate(handle):
+            line = bline.decode('utf-8', errors='replace')
+            if _cartesian.match(line):
+                puream = False
+            elif _spherical.match(line):
+                puream = True
+            elif _atom_array.match(line):
+                blocks.append((_atom_array.match(line).group(1).upper().split(), offset, lineno, puream))
+            offset += len(bline)
+
+    ends = [start for _, start, _, _ in blocks[1:]] + [offset]
+    for (names, start, lineno, puream), end in zip(blocks, ends):
+        for name in names:
+            index.setdefault(name, []).append((start, end, lineno, puream))
+
+    _gbs_index[filename] = (stamp, index)
+    return index
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_entry(filename, stamp, symbol, forced_puream):
+    """Parse only the blocks for *symbol* of gbs file *filename*, read through mmap.
+    *stamp* keys the cache to the file's state, see :py:func:`gbs_index`."""
+
+    blocks = gbs_index(filename).get(symbol)
+    if not blocks:
+        return None, None, None, None, None
+
+    lines = []
+    linenos = []
+    with open(filename, 'rb') as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for start, end, lineno, puream in blocks:
+            block = mm[start:end].decode('utf-8', errors='replace').splitlines()
+            lines.extend(line.strip() for line in block)
+            linenos.extend(range(lineno, lineno + len(block)))
+
+    if forced_puream is None:
+        forced_puream = blocks[0][3]
+    shells, msg, ecp_shells, ecp_msg, ncore = Gaussian94BasisSetParser(forced_puream).parse(symbol, lines)
+    if shells is None:
+        return None, None, None, None, None
+
+    # report line numbers of the whole file
+    msg = """line %5d""" % (linenos[int(msg.split()[1]) - 1] + 1)
+    if ecp_msg:
+        ecp_msg = """line %5d""" % (linenos[int(ecp_msg.split()[1]) - 1] + 1)
+
+    return tuple(shells), msg, tuple(ecp_shells), ecp_msg, ncore
+
 
 class Gaussian94BasisSetParser(object):
     """Class for parsing basis sets from a text file in Gaussian 94
@@ -65,6 +154,28 @@ class Gaussian94BasisSetParser(object):
 
         return lines
 
+    def parse_file(self, symbol, filename):
+        """Parse gbs file *filename* for the basis set of atom *symbol*, as
+        ``parse(symbol, self.load_file(filename))`` would. Only the blocks for
+        *symbol* are read, and results are cached per file, symbol, and any
+        forced puream, so the returned ShellInfo-s are shared and not to be modified.
+
+        """
+        self.filename = filename
+        try:
+            stamp = _file_stamp(filename)
+        except OSError:
+            raise BasisSetFileNotFound("""BasisSetParser::parse: Unable to open basis set file: %s""" % (filename))
+        if stamp[1] == 0:
+            raise ValidationError("""BasisSetParser::parse: given filename '%s' is blank.""" % (filename))
+
+        forced_puream = self.forced_is_puream if self.force_puream_or_cartesian else None
+        shells, msg, ecp_shells, ecp_msg, ncore = _parse_entry(filename, stamp, symbol, forced_puream)
+        if shells is None:
+            return None, None, None, None, None
+
+        return list(shells), msg, list(ecp_shells), ecp_msg, ncore
+
     def parse(self, symbol, dataset):
         """Given a string, parse for the basis set needed for atom.
         * @param symbol atom symbol to look for in dataset
@@ -1,3 +1,4 @@
+import functools
 import math
 
 #MAX_IOFF = 30000
@@ -102,6 +103,56 @@ def INT_IPURE(l, m):
     return l + m
 
 
+@functools.lru_cache()
+def cartesian_exponents(am):
+    """Gives the x, y, z exponents of each cartesian function for an angular momentum,
+    in the order of BasisSet.exp_ao: xx, xy, xz, yy, yz, zz for d.
+
+    """
+    return [(am - i, i - j, j) for i in range(am + 1) for j in range(i + 1)]
+
+
+@functools.lru_cache()
+def pure_ordering(am):
+    """Gives the m of each spherical function for an angular momentum: 0, 1, -1, 2, -2, ..."""
+    return [0] + [sign * m for m in range(1, am + 1) for sign in [1, -1]]
+
+
+@functools.lru_cache()
+def cartesian_to_pure(am):
+    """Gives the (INT_NPURE(am), INT_NCART(am)) matrix expressing each real solid harmonic of
+    pure_ordering() in the cartesian functions of cartesian_exponents(). Rows are normalized to
+    the x^am function, whose normalization is the one carried by the contraction coefficients.
+
+    """
+    carts = {abc: i for i, abc in enumerate(cartesian_exponents(am))}
+    tfm = [[0.0] * len(carts) for m in range(INT_NPURE(am))]
+    for row, m in enumerate(pure_ordering(am)):
+        # Helgaker, Jorgensen, Olsen, Molecular Electronic-Structure Theory, Eq. 6.4.47
+        vm = 0.0 if m >= 0 else 0.5
+        for t in range((am - abs(m)) // 2 + 1):
+            for u in range(t + 1):
+                for iv in range(int(abs(m) / 2 - vm) + 1):
+                    v = iv + vm
+                    coef = ((-1)**(t + iv) * 0.25**t * math.comb(am, t) * math.comb(am - t, abs(m) + t) *
+                            math.comb(t, u) * math.comb(abs(m), int(2 * v)))
+                    abc = (int(2 * t + abs(m) - 2 * (u + v)), int(2 * (u + v)), am - 2 * t - abs(m))
+                    tfm[row][carts[abc]] += coef
+
+    # overlap of x^a y^b z^c with x^a' y^b' z^c' over a common radial part, relative to x^am with x^am
+    def overlap(abc1, abc2):
+        if any((p1 + p2) % 2 for p1, p2 in zip(abc1, abc2)):
+            return 0.0
+        return math.prod(df(p1 + p2 - 1) for p1, p2 in zip(abc1, abc2)) / df(2 * am - 1)
+
+    for row in tfm:
+        norm = math.sqrt(sum(row[i] * row[j] * overlap(abc1, abc2) for abc1, i in carts.items()
+                             for abc2, j in carts.items()))
+        row[:] = [coef / norm for coef in row]
+
+    return tfm
+
+
 # Lookup array that when you index the angular momentum it returns the corresponding letter
 PrimitiveType = ['Normalized', 'Unnormalized']
 GaussianType = ['Cartesian', 'Pure']  # Cartesian = 0, Pure = 1
@@ -168,7 +219,7 @@ class ShellInfo(object):
         tmp1 = self.l + 1.5
         g = 2.0 * self.PYexp[p]
         z = pow(g, tmp1)
-        return math.sqrt((pow(2.0, self.l) * z) / (math.pi * math.sqrt(math.pi) * df(2 * self.l)))
+        return math.sqrt((pow(2.0, self.l) * z) / (math.pi * math.sqrt(math.pi) * df(2 * self.l - 1)))
 
     def contraction_normalization(self):
         """Normalizes an entire contraction set. Applies the normalization to the coefficients
@@ -181,7 +232,7 @@ class ShellInfo(object):
                 z = pow(g, self.l + 1.5)
                 e_sum += self.PYcoef[i] * self.PYcoef[j] / z
 
-        tmp = ((2.0 * math.pi / (2.0 / math.sqrt(math.pi))) * df(2 * self.l)) / pow(2.0, self.l)
+        tmp = ((2.0 * math.pi / (2.0 / math.sqrt(math.pi))) * df(2 * self.l - 1)) / pow(2.0, self.l)
         try:
             norm = math.sqrt(1.0 / (tmp * e_sum))
         except ZeroDivisionError:
@@ -219,7 +270,7 @@ class ShellInfo(object):
                 tsum += temp
                 if j != k:
                     tsum += temp
-        prefac = pow(2.0, 2 * self.l) / df(2 * self.l) if self.l > 1 else 1.0
+        prefac = pow(2.0, 2 * self.l) / df(2 * self.l - 1) if self.l > 1 else 1.0
         norm = math.sqrt(prefac / tsum)
         self.PYerd_coef = [j * norm for j in self.PYoriginal_coef]
 
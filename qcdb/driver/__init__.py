@@ -7,3 +7,4 @@ from .gradient import gradient
 from .hessian import frequency, hessian
 from .optimize import geometric, optimize, optking
 from .properties import properties
+from .scan_driver import scan, scan_iter
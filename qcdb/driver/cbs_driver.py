@@ -3,14 +3,16 @@ import pprint
 import re
 import sys
 
+from typing import Dict, List, Tuple
+
 import numpy as np
 from qcelemental import Datum
 
 from ..exceptions import ValidationError
 from ..keywords import register_kwds
-from ..qcvars import VARH
+from ..qcvars import VARH, VARH_PROVIDERS
 from ..util import banner
-from . import driver_helpers, driver_util, pe
+from . import driver_helpers, driver_util, executor, pe
 from .cbs_helpers import *
 
 pp = pprint.PrettyPrinter(width=120)
@@ -68,6 +70,9 @@ def _cbs_gufunc(func, total_method_name, molecule, **kwargs):
     kwargs.pop("dertype", None)
     cbs_verbose = kwargs.pop("cbs_verbose", False)
     ptype = kwargs.pop("ptype", None)
+    plan_only = kwargs.pop("plan_only", False)
+    execopts = executor.pop_executor_kwargs(kwargs)
+    keywords = kwargs.pop("keywords", None)
 
     #    # Make sure the molecule the user provided is the active one
     #    molecule = kwargs.pop('molecule') #, core.get_active_molecule())
@@ -84,6 +89,7 @@ def _cbs_gufunc(func, total_method_name, molecule, **kwargs):
     single_call = len(method_list) == 1
     single_call &= "[" not in basis_list[0]
     single_call &= "]" not in basis_list[0]
+    single_call &= not plan_only
 
     if single_call:
         method_name = method_list[0]
@@ -97,11 +103,12 @@ def _cbs_gufunc(func, total_method_name, molecule, **kwargs):
         # core.set_global_option('BASIS', basis)
         # pe.active_options['GLOBALS']['BASIS']['value'] = basis
         # pe.nu_options.scroll['QCDB']['BASIS'].value = basis
-        pe.nu_options.require("QCDB", "BASIS", basis, accession=1234)
+        options = (pe.nu_options if keywords is None else keywords).fork()
+        options.require("QCDB", "BASIS", basis, accession=1234)
 
         # print('\n gufunc_calling', func, method_name, return_wfn, 'OPT', pe.active_options, 'KW', kwargs)
         # print('\n gufunc_calling', func, method_name, return_wfn, 'OPT', 'KW', kwargs)
-        ptype_value, wfn = func(method_name, return_wfn=True, molecule=molecule, **kwargs)
+        ptype_value, wfn = func(method_name, return_wfn=True, molecule=molecule, keywords=options, **kwargs)
         #        core.clean()
 
         #        optstash.restore()
@@ -117,6 +124,11 @@ def _cbs_gufunc(func, total_method_name, molecule, **kwargs):
     cbs_kwargs["return_wfn"] = True
     cbs_kwargs["molecule"] = molecule
     cbs_kwargs["verbose"] = cbs_verbose
+    cbs_kwargs.update(execopts)
+    if keywords is not None:
+        cbs_kwargs["keywords"] = keywords
+    if plan_only:
+        cbs_kwargs["plan_only"] = True
 
     # Find method and basis
     pkgmtd = method_list[0].split("-", 1)
@@ -146,6 +158,9 @@ def _cbs_gufunc(func, total_method_name, molecule, **kwargs):
         if "delta_scheme" in kwargs:
             cbs_kwargs["delta_scheme"] = kwargs["delta_scheme"]
 
+    if plan_only:
+        return cbs(func, label, **cbs_kwargs)
+
     ptype_value, wfn = cbs(func, label, **cbs_kwargs)
 
     if return_wfn:
@@ -154,6 +169,100 @@ def _cbs_gufunc(func, total_method_name, molecule, **kwargs):
         return ptype_value
 
 
+def _cbs_job(func, wfn, basis, cbsbanners, kwgs, keywords=None, **kwargs):
+    """Run a single computation of the cbs() job list against a private copy of `keywords` (default global)."""
+
+    print(cbsbanners)
+
+    # Build string of molecule and commands that are dependent on the database
+    options = (pe.nu_options if keywords is None else keywords).fork()
+    options.require("QCDB", "BASIS", basis, **kwgs)
+    options.require(
+        "QCDB",
+        "WRITER_FILE_LABEL",
+        "-".join(
+            filter(
+                None,
+                [
+                    options.scroll["QCDB"]["WRITER_FILE_LABEL"].value,
+                    wfn.lower(),
+                    basis.lower(),
+                ],
+            )
+        )[:60],
+        **kwgs,
+    )
+
+    # Make energy(), etc. call
+    return func(name=wfn, keywords=options, **kwargs)
+
+
+def _strip_pkgprefix(wfn: str) -> str:
+    pkgmtd = wfn.split("-", 1)
+    if (pkgmtd[0] + "-") in driver_util.pkgprefix:
+        return pkgmtd[1]
+    return wfn
+
+
+def _plan_cbs_jobs(modelchem: List[Dict], grand_need: List[Dict], ptype: str) -> Tuple[List[Dict], Dict]:
+    """Choose the minimal computations that fulfill `modelchem`.
+
+    Parameters
+    ----------
+    modelchem
+        All method/basis levels required by the stages, possibly repeated.
+    grand_need
+        Stages of the CBS definition, whose ``d_need`` levels make up `modelchem`.
+    ptype
+        {'energy', 'gradient', 'hessian'}. Only energies are collected as byproducts of other computations.
+
+    Returns
+    -------
+    jobs
+        Unique entries of `modelchem`, in order, less those whose energy is computed en route by
+        another job in the same basis, as found through :py:data:`~qcdb.qcvars.VARH_PROVIDERS`.
+    provenance
+        Map of each job's (method, basis) to the stages it satisfies.
+
+    """
+    unique = {}
+    for mc in modelchem:
+        unique.setdefault((mc["f_wfn"], mc["f_basis"]), mc)
+
+    # Consider most comprehensive methods first so a job is dropped only in favor of one that is kept
+    kept = {}
+    if ptype == "energy":
+        for wfn, basis in sorted(unique, key=lambda job: -len(VARH[job[0]])):
+            providers = VARH_PROVIDERS[VARH[wfn][wfn]] & kept.setdefault(basis, set())
+            if not providers:
+                kept[basis].add(wfn)
+    else:
+        for wfn, basis in unique:
+            kept.setdefault(basis, set()).add(wfn)
+
+    jobs = [mc for (wfn, basis), mc in unique.items() if wfn in kept[basis]]
+
+    # Index what each job yields, preferring a job of the same method to one that obtains it as byproduct
+    yields = {}
+    for job in jobs:
+        yields.setdefault((_strip_pkgprefix(job["f_wfn"]), job["f_basis"]), job)
+    if ptype == "energy":
+        for job in jobs:
+            for wfn in VARH[job["f_wfn"]]:
+                yields.setdefault((_strip_pkgprefix(wfn), job["f_basis"]), job)
+
+    provenance = {(job["f_wfn"], job["f_basis"]): [] for job in jobs}
+    for stage in grand_need:
+        for lvl in stage["d_need"].values():
+            job = yields.get((_strip_pkgprefix(lvl["f_wfn"]), lvl["f_basis"]))
+            if job is not None:
+                stages = provenance[(job["f_wfn"], job["f_basis"])]
+                if stage["d_stage"] not in stages:
+                    stages.append(stage["d_stage"])
+
+    return jobs, provenance
+
+
 ###################################
 ##  Start of Complete Basis Set  ##
 ###################################
@@ -443,6 +552,38 @@ def cbs(func, label, **kwargs):
 
         The target molecule, if not the last molecule defined.
 
+    * Concurrency
+        Each computation in the enlightened job list runs against its own copy
+        of the keywords, so the list may be dispatched to a worker pool. Results
+        are merged into the full listing as computations complete.
+
+    :type executor: str
+    :param executor: |dl| ``'serial'`` |dr| || ``'thread'`` || ``'process'`` || :py:class:`concurrent.futures.Executor`
+
+        Pool through which to run the computations of the job list.
+
+    :type max_workers: int
+    :param max_workers: ``4`` || etc.
+
+        Maximum simultaneous computations. Defaults to as many as fit the node.
+
+    :type memory_per_job: float
+    :param memory_per_job: ``2.0`` || etc.
+
+        Memory [GiB] allotted to each computation.
+
+    :type ncores_per_job: int
+    :param ncores_per_job: ``2`` || etc.
+
+        Cores allotted to each computation.
+
+    :type plan_only: :ref:`boolean <op_py_boolean>`
+    :param plan_only: ``'on'`` || |dl| ``'off'`` |dr|
+
+        Return without computing a dictionary of the plan: the minimal ``jobs``
+        to run, the ``jobs_ext`` their results fill in, and the ``provenance``
+        map of each job's (method, basis) to the stages it satisfies.
+
     :examples:
 
 
@@ -476,6 +617,9 @@ def cbs(func, label, **kwargs):
     return_wfn = kwargs.pop("return_wfn", False)
     verbose = kwargs.pop("verbose", 0)
     ptype = kwargs.pop("ptype")
+    plan_only = kwargs.pop("plan_only", False)
+    execopts = executor.pop_executor_kwargs(kwargs)
+    keywords = kwargs.pop("keywords", None)
 
     kwgs = {"accession": kwargs["accession"], "verbose": verbose}
 
@@ -500,7 +644,8 @@ def cbs(func, label, **kwargs):
     do_delta4 = False
     do_delta5 = False
 
-    user_writer_file_label = pe.nu_options.scroll["QCDB"][
+    user_keywords = pe.nu_options if keywords is None else keywords
+    user_writer_file_label = user_keywords.scroll["QCDB"][
         "WRITER_FILE_LABEL"
     ].value  # core.get_global_option('WRITER_FILE_LABEL')
 
@@ -961,13 +1106,10 @@ def cbs(func, label, **kwargs):
         for lvl in stage["d_need"].items():
             MODELCHEM.append(lvl[1])
 
-    # Apply chemical reasoning to choose the minimum computations to run
-    JOBS = MODELCHEM[:]
-
     addlremark = {"energy": "", "gradient": ", GRADIENT", "hessian": ", HESSIAN"}
     instructions = ""
     instructions += """    Naive listing of computations required.\n"""
-    for mc in JOBS:
+    for mc in MODELCHEM:
         instructions += """   %12s / %-24s for  %s%s\n""" % (
             mc["f_wfn"],
             mc["f_basis"],
@@ -975,26 +1117,8 @@ def cbs(func, label, **kwargs):
             addlremark[ptype],
         )
 
-    #     Remove duplicate modelchem portion listings
-    for mc in MODELCHEM:
-        dups = -1
-        for indx_job, job in enumerate(JOBS):
-            if (job["f_wfn"] == mc["f_wfn"]) and (job["f_basis"] == mc["f_basis"]):
-                dups += 1
-                if dups >= 1:
-                    del JOBS[indx_job]
-
-    #     Remove chemically subsumed modelchem portion listings
-    if ptype == "energy":
-        for mc in MODELCHEM:
-            for wfn in VARH[mc["f_wfn"]]:
-                for indx_job, job in enumerate(JOBS):
-                    if (
-                        (VARH[mc["f_wfn"]][wfn] == VARH[job["f_wfn"]][job["f_wfn"]])
-                        and (mc["f_basis"] == job["f_basis"])
-                        and not (mc["f_wfn"] == job["f_wfn"])
-                    ):
-                        del JOBS[indx_job]
+    # Apply chemical reasoning to choose the minimum computations to run
+    JOBS, provenance = _plan_cbs_jobs(MODELCHEM, GRAND_NEED, ptype)
 
     instructions += """\n    Enlightened listing of computations required.\n"""
     for mc in JOBS:
@@ -1035,22 +1159,29 @@ def cbs(func, label, **kwargs):
         )
     print(instructions)
 
+    if plan_only:
+        return {
+            "ptype": ptype,
+            "natom": natom,
+            "jobs": [{"f_wfn": mc["f_wfn"], "f_basis": mc["f_basis"], "f_zeta": mc["f_zeta"]} for mc in JOBS],
+            "jobs_ext": [(job["f_wfn"], job["f_basis"]) for job in JOBS_EXT],
+            "provenance": provenance,
+        }
+
     #    psioh = core.IOManager.shared_object()
     #    psioh.set_specific_retention(constants.PSIF_SCF_MOS, True)
     # projection across point groups not allowed and cbs() usually a mix of symm-enabled and symm-tol calls
     #   needs to be communicated to optimize() so reset by that optstash
     #    core.set_local_option('SCF', 'GUESS_PERSIST', True)
 
-    Njobs = 0
-    # Run necessary computations
-    for mc in JOBS:
-        kwargs["name"] = mc["f_wfn"]
-
+    # Run necessary computations, each against its own copy of the keywords so they may run concurrently
+    safe_kwargs = {k: v for k, v in kwargs.items() if k not in ["name", "scf_scheme", "corl_scheme", "delta_scheme"]}
+    tasks = {}
+    for indx_job, mc in enumerate(JOBS):
         # Build string of title banner
         cbsbanners = banner(
             " CBS Computation: {} / {}{} ".format(mc["f_wfn"].upper(), mc["f_basis"].upper(), addlremark[ptype])
         )
-        print(cbsbanners)
         #        cbsbanners = ''
         #        cbsbanners += """core.print_out('\\n')\n"""
         #        cbsbanners += """p4util.banner(' CBS Computation: %s / %s%s ')\n""" % \
@@ -1058,34 +1189,15 @@ def cbs(func, label, **kwargs):
         #        cbsbanners += """core.print_out('\\n')\n\n"""
         #        exec(cbsbanners)
 
-        # Build string of molecule and commands that are dependent on the database
-        pe.nu_options.require("QCDB", "BASIS", mc["f_basis"], **kwgs)
-        pe.nu_options.require(
-            "QCDB",
-            "WRITER_FILE_LABEL",
-            "-".join(
-                filter(
-                    None,
-                    [
-                        pe.nu_options.scroll["QCDB"]["WRITER_FILE_LABEL"].value,
-                        mc["f_wfn"].lower(),
-                        mc["f_basis"].lower(),
-                    ],
-                )
-            )[:60],
-            **kwgs,
+        tasks[indx_job] = (
+            (func, mc["f_wfn"], mc["f_basis"], cbsbanners, kwgs, keywords),
+            {"molecule": molecule, "return_wfn": True, **safe_kwargs},
         )
 
-        #        commands = '\n'
-        #        commands += """\ncore.set_global_option('BASIS', '%s')\n""" % (mc['f_basis'])
-        #        commands += """core.set_global_option('WRITER_FILE_LABEL', '%s')\n""" % \
-        #            (user_writer_file_label + ('' if user_writer_file_label == '' else '-') + mc['f_wfn'].lower() + '-' + mc['f_basis'].lower())
-        #        exec(commands)
+    Njobs = 0
+    for indx_job, (response, jrec) in executor.fan_out(_cbs_job, tasks, **execopts):
+        mc = JOBS[indx_job]
 
-        # Make energy(), etc. call
-        safe_kwargs = {k: v for k, v in kwargs.items() if k not in ["scf_scheme", "corl_scheme", "delta_scheme"]}
-        response, jrec = func(molecule=molecule, return_wfn=True, **safe_kwargs)
-        # response = func(molecule=molecule, **kwargs)
         if ptype == "energy":
             mc["f_energy"] = response
 
@@ -0,0 +1,606 @@
+"""Finite difference derivatives in NumPy. Displacements are generated along
+symmetry-adapted, mass-weighted Cartesian displacement coordinates (CdSALCs)
+built from the molecule's D2h-subgroup point group, and gradients or Hessians
+are assembled from the energies or gradients computed at those displacements.
+
+All functions exchange plain ``findif_meta_dict`` dictionaries, which carry
+everything assembly needs (SALCs, masses, stencil), so that assembly does not
+require the molecule and the dictionary may be stored as JSON.
+
+"""
+import itertools
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..exceptions import ValidationError
+from ..molecule.libmintsmolecule import compute_atom_map
+
+# stencil points (in units of step) and first-derivative weights
+_first_derivative_stencils = {
+    3: ([-1, 1], [-0.5, 0.5]),
+    5: ([-2, -1, 1, 2], [1.0 / 12.0, -8.0 / 12.0, 8.0 / 12.0, -1.0 / 12.0]),
+}
+
+# pair displacements (in units of step) for off-diagonal Hessian from energies, all irreps then
+#   those needed for a non-totally-symmetric irrep, where E(a, b) = E(-a, -b)
+_off_diagonal_stencils = {
+    3: ([(-1, -1), (1, 1)], [(-1, -1)]),
+    5: (
+        [(-1, -2), (-2, -1), (-1, -1), (1, -1), (-1, 1), (1, 1), (2, 1), (1, 2)],
+        [(-1, -2), (-2, -1), (-1, -1), (1, -1)],
+    ),
+}
+
+
+# order of each full point group labeled by Molecule.set_full_point_group, given its n
+_full_point_group_orders = {
+    "C1": lambda n: 1,
+    "Ci": lambda n: 2,
+    "Cs": lambda n: 2,
+    "Cn": lambda n: n,
+    "Sn": lambda n: n,
+    "Cnv": lambda n: 2 * n,
+    "Cnh": lambda n: 2 * n,
+    "Dn": lambda n: 2 * n,
+    "Dnh": lambda n: 4 * n,
+    "Dnd": lambda n: 4 * n,
+    "Td": lambda n: 24,
+    "Oh": lambda n: 48,
+    "Ih": lambda n: 120,
+}
+
+
+def _orthonormalize(vectors: List[np.ndarray], tol: float = 1.0e-6) -> List[np.ndarray]:
+    """Gram-Schmidt `vectors` in order, dropping any linearly dependent on those before."""
+
+    basis = []
+    for vec in vectors:
+        vec = np.array(vec, dtype=float)
+        for bvec in basis:
+            vec -= np.dot(bvec, vec) * bvec
+        norm = np.linalg.norm(vec)
+        if norm > tol:
+            basis.append(vec / norm)
+
+    return basis
+
+
+def cdsalcs(
+    molecule: "Molecule",
+    irreps: Optional[List[int]] = None,
+    project_translations: bool = True,
+    project_rotations: bool = True,
+    masses: Optional[np.ndarray] = None,
+) -> List[Tuple[int, np.ndarray]]:
+    """Form the Cartesian displacement SALCs of `molecule` in mass-weighted coordinates.
+
+    Parameters
+    ----------
+    molecule
+        Molecule in its symmetry frame, as after ``update_geometry()``.
+    irreps
+        Indices (0-based, Cotton ordering) of the irreps for which to form SALCs. Default all.
+    project_translations
+        Whether to project out the translations.
+    project_rotations
+        Whether to project out the rotations.
+    masses
+        (nat, ) masses [u] weighting the translations and rotations. Default those of `molecule`.
+        Must be alike for symmetry-equivalent atoms.
+
+    Returns
+    -------
+    list of (int, numpy.ndarray)
+        Irrep index and (3 * nat, ) unit coefficient vector of each SALC, grouped by irrep.
+
+    """
+    natom = molecule.natom()
+    geom = molecule.geometry(np_out=True)
+    if masses is None:
+        masses = [molecule.mass(at) for at in range(natom)]
+    sqmass = np.sqrt(np.asarray(masses, dtype=float))
+    ct = molecule.point_group().char_table()
+    atom_map = np.array(compute_atom_map(molecule), dtype=int).reshape(natom, -1)
+    ops = np.array([ct.symm_operation(g).d for g in range(ct.order())])
+
+    constraints = []
+    if project_translations:
+        for xyz in range(3):
+            trans = np.zeros((natom, 3))
+            trans[:, xyz] = sqmass
+            constraints.append(trans.ravel())
+    if project_rotations:
+        com = np.dot(sqmass**2, geom) / np.sum(sqmass**2)
+        for xyz in range(3):
+            rot = np.cross(np.eye(3)[xyz], geom - com) * sqmass[:, None]
+            constraints.append(rot.ravel())
+    constraints = np.array(_orthonormalize(constraints)).reshape(-1, 3 * natom)
+    projector = np.identity(3 * natom) - constraints.T @ constraints
+
+    salcs = []
+    for h in range(ct.nirrep()):
+        if irreps is not None and h not in irreps:
+            continue
+
+        # projection of each unique atom's x, y, z displacement onto irrep h
+        chi = np.array([ct.gamma(h).character(g) for g in range(ct.order())]) / ct.order()
+        candidates = []
+        for uatom in range(molecule.nunique()):
+            salc = np.zeros((3, natom, 3))
+            np.add.at(salc, (slice(None), atom_map[molecule.unique(uatom)]), np.einsum("g,gij->jgi", chi, ops))
+            candidates.extend(salc.reshape(3, -1) @ projector)
+
+        salcs.extend((h, salc) for salc in _orthonormalize(candidates))
+
+    return salcs
+
+
+def symmetry_operations(molecule: "Molecule", tol: float = 1.0e-4) -> List[Tuple[np.ndarray, List[int]]]:
+    """Find the operations of the full point group of `molecule`, not just its D2h subgroup.
+
+    Operations are found by mapping a frame of two off-axis atoms onto all
+    equivalent pairs and keeping those transformations that carry every atom onto
+    a like atom. Atoms and linear molecules, with infinite groups, get the operations
+    of the D2h subgroup.
+
+    Parameters
+    ----------
+    molecule
+        Molecule, as after ``update_geometry()``.
+    tol
+        Largest distance [a0] between an atom's image and a like atom.
+
+    Returns
+    -------
+    list of (numpy.ndarray, list of int)
+        Each (3, 3) operation acting about the center of mass and the atom into which it carries each atom.
+        Identity first.
+
+    """
+    natom = molecule.natom()
+    com = np.asarray(molecule.center_of_mass())
+    rel = molecule.geometry(np_out=True) - com
+    dist = np.linalg.norm(rel, axis=1)
+    species = [(molecule.Z(at), molecule.mass(at)) for at in range(natom)]
+
+    order = _full_point_group_orders.get(molecule.full_point_group_with_n())
+    if order is None:
+        ct = molecule.point_group().char_table()
+        atom_map = compute_atom_map(molecule)
+        return [
+            (np.array([[ct.symm_operation(g)[i][j] for j in range(3)] for i in range(3)]), [m[g] for m in atom_map])
+            for g in range(ct.order())
+        ]
+    order = order(molecule.full_pg_n())
+
+    def atom_map(R):
+        amap = []
+        for at in range(natom):
+            image = molecule.atom_at_position(com + R @ rel[at], tol)
+            if image < 0 or species[image] != species[at]:
+                return None
+            amap.append(image)
+        return amap
+
+    def alike(at):
+        return [at2 for at2 in range(natom) if species[at2] == species[at] and abs(dist[at2] - dist[at]) < tol]
+
+    ops = [(np.identity(3), list(range(natom)))]
+    offaxis = [at for at in range(natom) if dist[at] > tol]
+    if len(offaxis) > 1:
+        # frame atoms with fewest alike atoms, so fewest candidate images
+        offaxis.sort(key=lambda at: len(alike(at)))
+        a = offaxis[0]
+        b = next((at for at in offaxis if np.linalg.norm(np.cross(rel[a], rel[at])) > tol * dist[a] * dist[at]), None)
+        if b is not None:
+            frame = np.linalg.inv(np.column_stack([rel[a], rel[b], np.cross(rel[a], rel[b])]))
+            for a2, b2 in itertools.product(alike(a), alike(b)):
+                if abs(np.dot(rel[a2], rel[b2]) - np.dot(rel[a], rel[b])) > tol * (dist[a] + dist[b]):
+                    continue
+                for proper in [1, -1]:
+                    R = np.column_stack([rel[a2], rel[b2], proper * np.cross(rel[a2], rel[b2])]) @ frame
+                    U, _, Vt = np.linalg.svd(R)
+                    R = U @ Vt
+                    if any(np.allclose(R, R2, atol=1.0e-6) for R2, _ in ops):
+                        continue
+                    amap = atom_map(R)
+                    if amap is not None:
+                        ops.append((R, amap))
+
+    if len(ops) < order:
+        print(
+            f"""  Warning: found {len(ops)} of {order} operations of {molecule.get_full_point_group()} within {tol}."""
+        )
+
+    return ops
+
+
+def _operate(op: Tuple[np.ndarray, List[int]], vec: np.ndarray) -> np.ndarray:
+    """Apply symmetry operation `op` to a (3 * nat, ) displacement or gradient vector."""
+
+    R, amap = op
+    vec = np.reshape(vec, (-1, 3))
+    image = np.zeros_like(vec)
+    image[amap] = vec @ R.T
+
+    return image.ravel()
+
+
+def _displace_cart(findif_meta_dict: Dict[str, Any], steps: Dict[int, int]) -> List[float]:
+    """Reference geometry displaced `steps[i]` stencil steps along each SALC ``i``."""
+
+    geom = np.array(findif_meta_dict["reference"]["geometry"], dtype=float)
+    sqmass3 = np.repeat(np.sqrt(findif_meta_dict["masses"]), 3)
+    for i, nstep in steps.items():
+        salc = np.asarray(findif_meta_dict["salcs"][i]["coef"])
+        geom += nstep * findif_meta_dict["step"]["size"] * salc / sqmass3
+
+    return geom.tolist()
+
+
+def _label(steps: Dict[int, int]) -> str:
+    return ", ".join(f"{i}: {nstep}" for i, nstep in steps.items())
+
+
+def _geom_generator(
+    molecule: "Molecule",
+    freq_irrep_only: int,
+    mode: str,
+    *,
+    stencil_size: int = 3,
+    step_size: float = 0.005,
+    project_translations: bool = True,
+    project_rotations: bool = True,
+    displacement_space: str = "cdsalc",
+) -> Dict[str, Any]:
+    """Generate the displacements of a finite difference computation.
+
+    Parameters
+    ----------
+    molecule
+        Molecule in its symmetry frame, as after ``update_geometry()``.
+    freq_irrep_only
+        Index (0-based, Cotton ordering) of the only irrep for which to compute the Hessian, or -1 for all.
+    mode
+        ``"1_0"`` for gradient from energies, ``"2_1"`` for Hessian from gradients, or
+        ``"2_0"`` for Hessian from energies.
+    stencil_size
+        Number of points, 3 or 5, in the stencil along each coordinate.
+    step_size
+        Displacement [a0 u^1/2] in mass-weighted coordinates, or [a0] for ``"unique"`` `displacement_space`.
+    displacement_space
+        ``"cdsalc"`` to displace along the SALCs of the D2h subgroup, or ``"unique"`` to displace
+        only symmetry-unique Cartesian coordinates of the full point group (Hessian from gradients only).
+
+    Returns
+    -------
+    dict
+        Finite difference plan with ``reference`` and ``displacements`` entries, each holding a
+        flat ``geometry`` [a0], plus the SALCs, masses, and stencil to assemble derivatives.
+
+    """
+    if mode not in ["1_0", "2_1", "2_0"]:
+        raise ValidationError(f"Finite difference mode not understood: {mode}")
+    if stencil_size not in _first_derivative_stencils:
+        raise ValidationError(f"Finite difference stencil_size must be 3 or 5, not {stencil_size}")
+
+    if displacement_space.lower() == "unique":
+        if mode != "2_1" or freq_irrep_only != -1:
+            raise ValidationError("Finite difference displacement_space 'unique' is for full Hessians from gradients.")
+        return _unique_geom_generator(molecule, stencil_size=stencil_size, step_size=step_size)
+    elif displacement_space.lower() != "cdsalc":
+        raise ValidationError(f"Finite difference displacement_space not understood: {displacement_space}")
+
+    if mode == "1_0":
+        irreps = [0]  # gradient of totally symmetric molecule is totally symmetric
+    elif freq_irrep_only == -1:
+        irreps = None
+    else:
+        irreps = [freq_irrep_only]
+
+    salcs = cdsalcs(molecule, irreps, project_translations, project_rotations)
+
+    findif_meta_dict = {
+        "mode": mode,
+        "irrep": freq_irrep_only,
+        "stencil_size": stencil_size,
+        "step": {"units": "bohr", "size": step_size},
+        "displacement_space": "CdSALC",
+        "project_translations": project_translations,
+        "project_rotations": project_rotations,
+        "masses": [molecule.mass(at) for at in range(molecule.natom())],
+        "salcs": [{"irrep": h, "coef": salc.tolist()} for h, salc in salcs],
+        "reference": {"geometry": molecule.geometry(np_out=True).ravel().tolist()},
+        "displacements": {},
+    }
+
+    points = _first_derivative_stencils[stencil_size][0]
+    disps = []
+    for i, (h, salc) in enumerate(salcs):
+        # only half the stencil needed for non-totally-symmetric irreps, as E(+) = E(-) and g(+) = R g(-)
+        for nstep in points if (h == 0 or mode == "1_0") else [p for p in points if p < 0]:
+            disps.append({i: nstep})
+
+    if mode == "2_0":
+        sym_pairs, asym_pairs = _off_diagonal_stencils[stencil_size]
+        for (i, (hi, _)), (j, (hj, _)) in itertools.combinations(enumerate(salcs), 2):
+            if hi == hj:
+                for si, sj in sym_pairs if hi == 0 else asym_pairs:
+                    disps.append({i: si, j: sj})
+
+    for steps in disps:
+        findif_meta_dict["displacements"][_label(steps)] = {"geometry": _displace_cart(findif_meta_dict, steps)}
+
+    return findif_meta_dict
+
+
+def _unique_label(column: Dict[str, int], nstep: int) -> str:
+    return f"""{column["atom"]}{"xyz"[column["xyz"]]}: {nstep}"""
+
+
+def _unique_geom_generator(molecule: "Molecule", *, stencil_size: int, step_size: float) -> Dict[str, Any]:
+    """Generate displacements of only those Cartesian coordinates of symmetry-unique atoms
+    whose Hessian columns can't be had from symmetry images of columns already chosen or from
+    translational and rotational invariance. Coordinates that some operation reverses need
+    only half the stencil.
+
+    """
+    natom = molecule.natom()
+    geom = molecule.geometry(np_out=True)
+    com = np.asarray(molecule.center_of_mass())
+    ops = symmetry_operations(molecule)
+
+    # Hessian columns along translations and rotations follow from the reference gradient
+    known = []
+    for xyz in range(3):
+        trans = np.zeros((natom, 3))
+        trans[:, xyz] = 1.0
+        known.append(trans.ravel())
+        known.append(np.cross(np.eye(3)[xyz], geom - com).ravel())
+    known = _orthonormalize(known)
+
+    columns = []
+    for atom in range(natom):
+        if any(amap[atom] < atom for _, amap in ops):
+            continue  # not symmetry-unique
+
+        for xyz in range(3):
+            cart = np.zeros(3 * natom)
+            cart[3 * atom + xyz] = 1.0
+            if np.linalg.norm(cart - sum(np.dot(kvec, cart) * kvec for kvec in known)) < 1.0e-6:
+                continue
+
+            flip = next(
+                (g for g, (R, amap) in enumerate(ops) if amap[atom] == atom and R[xyz, xyz] < -1.0 + 1.0e-6), None
+            )
+            columns.append({"atom": atom, "xyz": xyz, "flip": flip})
+            known = _orthonormalize(known + [_operate(op, cart) for op in ops])
+
+    print(
+        f"""  {len(ops)} operations of {molecule.get_full_point_group()} reduce displaced coordinates"""
+        f""" from {3 * natom} to {len(columns)}."""
+    )
+
+    findif_meta_dict = {
+        "mode": "2_1",
+        "irrep": -1,
+        "stencil_size": stencil_size,
+        "step": {"units": "bohr", "size": step_size},
+        "displacement_space": "unique",
+        "full_point_group": molecule.get_full_point_group(),
+        "masses": [molecule.mass(at) for at in range(natom)],
+        "com": com.tolist(),
+        "operations": [{"R": R.tolist(), "atom_map": amap} for R, amap in ops],
+        "columns": columns,
+        "reference": {"geometry": geom.ravel().tolist()},
+        "displacements": {},
+    }
+
+    points = _first_derivative_stencils[stencil_size][0]
+    for column in columns:
+        for nstep in points if column["flip"] is None else [p for p in points if p > 0]:
+            disp = geom.copy()
+            disp[column["atom"], column["xyz"]] += nstep * step_size
+            findif_meta_dict["displacements"][_unique_label(column, nstep)] = {"geometry": disp.ravel().tolist()}
+
+    return findif_meta_dict
+
+
+def gradient_from_energies_geometries(molecule: "Molecule", **kwargs) -> Dict[str, Any]:
+    """Generate the displacements for a gradient by finite difference of energies.
+    See :py:func:`_geom_generator` for `kwargs`."""
+
+    return _geom_generator(molecule, -1, "1_0", **kwargs)
+
+
+def hessian_from_gradients_geometries(molecule: "Molecule", irrep: int = -1, **kwargs) -> Dict[str, Any]:
+    """Generate the displacements for a Hessian by finite difference of gradients.
+    See :py:func:`_geom_generator` for `kwargs`."""
+
+    return _geom_generator(molecule, irrep, "2_1", **kwargs)
+
+
+def hessian_from_energies_geometries(molecule: "Molecule", irrep: int = -1, **kwargs) -> Dict[str, Any]:
+    """Generate the displacements for a Hessian by finite difference of energies.
+    See :py:func:`_geom_generator` for `kwargs`."""
+
+    return _geom_generator(molecule, irrep, "2_0", **kwargs)
+
+
+def _salc_blocks(findif_meta_dict: Dict[str, Any]) -> Dict[int, Tuple[List[int], np.ndarray]]:
+    """SALC indices and (nsalc_h, 3 * nat) coefficient matrix of each irrep present."""
+
+    blocks = {}
+    for i, salc in enumerate(findif_meta_dict["salcs"]):
+        blocks.setdefault(salc["irrep"], []).append(i)
+
+    return {h: (idx, np.array([findif_meta_dict["salcs"][i]["coef"] for i in idx])) for h, idx in blocks.items()}
+
+
+def _displaced(findif_meta_dict: Dict[str, Any], steps: Dict[int, int], field: str, irrep: int) -> Tuple[Any, int]:
+    """Return `field` computed at displacement `steps`, or, for a non-totally-symmetric `irrep`,
+    at its symmetry-equivalent opposite displacement, together with the sign relating them."""
+
+    if not steps:
+        return findif_meta_dict["reference"][field], 1
+
+    displacements = findif_meta_dict["displacements"]
+    label = _label(steps)
+    if label in displacements:
+        return displacements[label][field], 1
+
+    if irrep != 0:
+        label = _label({i: -nstep for i, nstep in steps.items()})
+        if label in displacements:
+            return displacements[label][field], -1
+
+    raise ValidationError(f"Finite difference displacement missing: {label}")
+
+
+def assemble_gradient_from_energies(findif_meta_dict: Dict[str, Any]) -> np.ndarray:
+    """Assemble the (nat, 3) gradient [Eh/a0] from the ``energy`` of each displacement."""
+
+    natom = len(findif_meta_dict["masses"])
+    sqmass3 = np.repeat(np.sqrt(findif_meta_dict["masses"]), 3)
+    points, weights = _first_derivative_stencils[findif_meta_dict["stencil_size"]]
+    step = findif_meta_dict["step"]["size"]
+
+    gradient = np.zeros(3 * natom)
+    for h, (idx, B) in _salc_blocks(findif_meta_dict).items():
+        g_q = np.zeros(len(idx))
+        for row, i in enumerate(idx):
+            for nstep, weight in zip(points, weights):
+                g_q[row] += weight * _displaced(findif_meta_dict, {i: nstep}, "energy", h)[0] / step
+        gradient += g_q @ B
+
+    return (gradient * sqmass3).reshape(natom, 3)
+
+
+def assemble_hessian_from_gradients(findif_meta_dict: Dict[str, Any], irrep: int = -1) -> np.ndarray:
+    """Assemble the (3 * nat, 3 * nat) Hessian [Eh/a0/a0] from the ``gradient`` of each displacement.
+    If `irrep` is not -1, only that irrep's block is formed."""
+
+    if findif_meta_dict.get("displacement_space") == "unique":
+        return _assemble_hessian_from_unique_gradients(findif_meta_dict)
+
+    natom = len(findif_meta_dict["masses"])
+    sqmass3 = np.repeat(np.sqrt(findif_meta_dict["masses"]), 3)
+    points, weights = _first_derivative_stencils[findif_meta_dict["stencil_size"]]
+    step = findif_meta_dict["step"]["size"]
+
+    hessian = np.zeros((3 * natom, 3 * natom))
+    for h, (idx, B) in _salc_blocks(findif_meta_dict).items():
+        if irrep not in [-1, h]:
+            continue
+
+        H_q = np.zeros((len(idx), len(idx)))
+        for row, i in enumerate(idx):
+            for nstep, weight in zip(points, weights):
+                # projected onto irrep h, the gradient at the opposite displacement flips sign
+                grad, sign = _displaced(findif_meta_dict, {i: nstep}, "gradient", h)
+                H_q[row] += sign * weight * (B @ (np.ravel(grad) / sqmass3)) / step
+
+        H_q = 0.5 * (H_q + H_q.T)
+        hessian += B.T @ H_q @ B
+
+    return hessian * np.outer(sqmass3, sqmass3)
+
+
+def _assemble_hessian_from_unique_gradients(findif_meta_dict: Dict[str, Any]) -> np.ndarray:
+    """Assemble the Hessian from displacements of :py:func:`_unique_geom_generator` by fitting it
+    to every symmetry image of each computed column plus the invariance columns."""
+
+    natom = len(findif_meta_dict["masses"])
+    points, weights = _first_derivative_stencils[findif_meta_dict["stencil_size"]]
+    step = findif_meta_dict["step"]["size"]
+    ops = [(np.array(op["R"]), op["atom_map"]) for op in findif_meta_dict["operations"]]
+    displacements = findif_meta_dict["displacements"]
+    geom = np.reshape(findif_meta_dict["reference"]["geometry"], (-1, 3))
+    grad = np.reshape(findif_meta_dict["reference"]["gradient"], (-1, 3))
+    com = np.asarray(findif_meta_dict["com"])
+
+    # H t = 0 for translation t and H (w x r) = w x g for rotation about w
+    dcols, hcols = [], []
+    for xyz in range(3):
+        trans = np.zeros((natom, 3))
+        trans[:, xyz] = 1.0
+        dcols.extend([trans.ravel(), np.cross(np.eye(3)[xyz], geom - com).ravel()])
+        hcols.extend([np.zeros(3 * natom), np.cross(np.eye(3)[xyz], grad).ravel()])
+
+    for column in findif_meta_dict["columns"]:
+        hcol = np.zeros(3 * natom)
+        for nstep, weight in zip(points, weights):
+            label = _unique_label(column, nstep)
+            if label in displacements:
+                hcol += weight * np.ravel(displacements[label]["gradient"]) / step
+            else:
+                # gradient at the reversed displacement is the operation's image of that at this one
+                reverse = np.ravel(displacements[_unique_label(column, -nstep)]["gradient"])
+                hcol += weight * _operate(ops[column["flip"]], reverse) / step
+
+        cart = np.zeros(3 * natom)
+        cart[3 * column["atom"] + column["xyz"]] = 1.0
+        for op in ops:
+            dcols.append(_operate(op, cart))
+            hcols.append(_operate(op, hcol))
+
+    hessian = np.linalg.lstsq(np.array(dcols), np.array(hcols), rcond=None)[0].T
+
+    return 0.5 * (hessian + hessian.T)
+
+
+def assemble_hessian_from_energies(findif_meta_dict: Dict[str, Any], irrep: int = -1) -> np.ndarray:
+    """Assemble the (3 * nat, 3 * nat) Hessian [Eh/a0/a0] from the ``energy`` of each displacement.
+    If `irrep` is not -1, only that irrep's block is formed."""
+
+    natom = len(findif_meta_dict["masses"])
+    sqmass3 = np.repeat(np.sqrt(findif_meta_dict["masses"]), 3)
+    stencil_size = findif_meta_dict["stencil_size"]
+    step = findif_meta_dict["step"]["size"]
+
+    hessian = np.zeros((3 * natom, 3 * natom))
+    for h, (idx, B) in _salc_blocks(findif_meta_dict).items():
+        if irrep not in [-1, h]:
+            continue
+
+        def E(steps):
+            return _displaced(findif_meta_dict, steps, "energy", h)[0]
+
+        E0 = E({})
+        H_q = np.zeros((len(idx), len(idx)))
+        for row, i in enumerate(idx):
+            if stencil_size == 3:
+                H_q[row, row] = (E({i: -1}) + E({i: 1}) - 2.0 * E0) / step**2
+            else:
+                H_q[row, row] = (-E({i: -2}) + 16.0 * E({i: -1}) - 30.0 * E0 + 16.0 * E({i: 1}) - E({i: 2})) / (
+                    12.0 * step**2
+                )
+
+        for (row, i), (col, j) in itertools.combinations(enumerate(idx), 2):
+            if stencil_size == 3:
+                H_q[row, col] = (
+                    E({i: 1, j: 1}) + E({i: -1, j: -1}) - E({i: 1}) - E({i: -1}) - E({j: 1}) - E({j: -1}) + 2.0 * E0
+                ) / (2.0 * step**2)
+            else:
+                H_q[row, col] = (
+                    -E({i: -1, j: -2})
+                    - E({i: -2, j: -1})
+                    + 9.0 * E({i: -1, j: -1})
+                    - E({i: 1, j: -1})
+                    - E({i: -1, j: 1})
+                    + 9.0 * E({i: 1, j: 1})
+                    - E({i: 2, j: 1})
+                    - E({i: 1, j: 2})
+                    + E({i: -2})
+                    + E({i: 2})
+                    + E({j: -2})
+                    + E({j: 2})
+                    - 7.0 * (E({i: -1}) + E({i: 1}) + E({j: -1}) + E({j: 1}))
+                    + 12.0 * E0
+                ) / (12.0 * step**2)
+            H_q[col, row] = H_q[row, col]
+
+        hessian += B.T @ H_q @ B
+
+    return hessian * np.outer(sqmass3, sqmass3)
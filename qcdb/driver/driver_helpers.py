@@ -210,8 +210,8 @@ def activate(mol):
     pe.active_molecule = mol
 
 
-def set_options(options_dict: Dict[str, Any]) -> None:
-    """Set QCDB keywords from input dictionary."""
+def set_options(options_dict: Dict[str, Any], keywords: "Keywords" = None) -> None:
+    """Set QCDB keywords from input dictionary into the global keywords or, if given, private `keywords`."""
 
     optionre = re.compile(
         r"\A((?P<domain>(qcdb|cfour|psi4|nwchem|gamess|dftd3|resp))_)?(?P<module>\w+__)?(?P<option>[\w\(\)]+)\Z",
@@ -221,6 +221,8 @@ def set_options(options_dict: Dict[str, Any]) -> None:
     if len(pe.nu_options.scroll) == 0:
         # print('EMPTY OPT')
         pe.load_options()
+    if keywords is None:
+        keywords = pe.nu_options
 
     for k, v in options_dict.items():
         mobj = optionre.match(k.strip())
@@ -235,7 +237,7 @@ def set_options(options_dict: Dict[str, Any]) -> None:
             option = mobj.group("option").upper()
 
             print(f"SET_OPTIONS: [{domain}][{module + option}] = {v}")
-            pe.nu_options.require(domain, module + option, v, accession=pe.nu_options.mark_of_the_user)
+            keywords.require(domain, module + option, v, accession=keywords.mark_of_the_user)
         else:
             raise ValidationError(f"Keyword not in {{domain}}?_{{module}}?__{{option}} format: {k}")
 
@@ -38,7 +38,8 @@ from qcelemental import Datum, constants
 # from psi4.driver.p4util.exceptions import *
 # from psi4 import core
 # from psi4.driver import p4util
-from . import driver_nbody_helper, driver_util, pe
+from ..exceptions import ValidationError
+from . import driver_nbody_helper, driver_util, executor, pe
 
 pp = pprint.PrettyPrinter(width=120)
 
@@ -199,6 +200,28 @@ def nbody_gufunc(func: Union[str, Callable], method_string: str, **kwargs):
     :param charge_type: ``MULLIKEN_CHARGES`` || ``LOWDIN_CHARGES``
 
         Default is ``MULLIKEN_CHARGES``
+
+    :type executor: str or :py:class:`concurrent.futures.Executor`
+    :param executor: |dl| ``'serial'`` |dr| || ``'thread'`` || ``'process'`` || etc.
+
+        How to run the independent N-body component calculations. Pools run
+        up to **max_workers** components at once.
+
+    :type max_workers: int
+    :param max_workers: ``4`` || etc.
+
+        Maximum simultaneous component calculations. Defaults to as many as fit
+        the node's cores and memory given **ncores_per_job** and **memory_per_job**.
+
+    :type memory_per_job: float
+    :param memory_per_job: ``2.0`` || etc.
+
+        Memory [GiB] allotted to each component calculation.
+
+    :type ncores_per_job: int
+    :param ncores_per_job: ``2`` || etc.
+
+        Cores allotted to each component calculation.
     """
 
     # Initialize dictionaries for easy data passing
@@ -217,6 +240,7 @@ def nbody_gufunc(func: Union[str, Callable], method_string: str, **kwargs):
     metadata["molecule"].fix_orientation(True)
     metadata["molecule"].update_geometry()  # MM
     metadata["embedding_charges"] = kwargs.get("embedding_charges", False)
+    metadata["executor"] = executor.pop_executor_kwargs(kwargs)
     metadata["kwargs"] = kwargs
     #    core.clean_variables()
 
@@ -470,6 +494,11 @@ def compute_nbody_components(func, method_string, metadata):
         ``'kwargs'``: dict
             Arbitrary keyword arguments to be passed to function `func`.
 
+        Optional ``'key': value`` pairs:
+        ``'executor'``: dict
+            Arguments to :py:func:`~qcdb.driver.executor.fan_out` controlling how the independent
+            components are run. Default is serially in this process.
+
     Returns
     -------
     dict of str: dict
@@ -500,55 +529,44 @@ def compute_nbody_components(func, method_string, metadata):
         metadata["embedding_charges"] = driver_nbody_helper.compute_charges(
             kwargs["charge_method"], kwargs.get("charge_type", "MULLIKEN_CHARGES").upper(), molecule
         )
+    # Build all the fragment molecules up front so components can run concurrently
+    tasks = {}
     for count, n in enumerate(compute_list.keys()):
-        print("\n   ==> N-Body: Now computing %d-body complexes <==\n\n" % n)
-        total = len(compute_list[n])
         for num, pair in enumerate(compute_list[n]):
             work_molecule = molecule.clone()
-            print(
-                "\n       N-Body: Computing complex (%d/%d) with fragments %s in the basis of fragments %s.\n\n"
-                % (num + 1, total, str(pair[0]), str(pair[1]))
-            )
             ghost = list(set(pair[1]) - set(pair[0]))
-
-            #            print(count, n, list(pair[0]), ghost, work_molecule.print_in_input_format())
-            #            import pprint
-            #            pprint.pprint(work_molecule.__dict__, width=200)
-            #            for at in work_molecule.atoms:
-            #                print("CoordEntry")
-            #                pprint.pprint(at.__dict__, width=200)
-            #                if at.rto is not None:
-            #                    print("rto")
-            #                    pprint.pprint(at.rto.__dict__, width=200)
             current_mol = work_molecule.extract_fragments(list(pair[0]), ghost)
             current_mol.update_geometry()  # MM
             current_mol.set_name("%s_%i_%i" % (current_mol.name(), count, num))
             if metadata["embedding_charges"]:
                 print("manybody embedding_charges NYI")
                 # driver_nbody_helper.electrostatic_embedding(metadata, pair=pair)
-            # Save energies info
-            ptype_dict[pair], jrec = func(method_string, molecule=current_mol, return_wfn=True, **kwargs)
-
-            #            core.set_global_option_python('EXTERN', None)
-            energies_dict[pair] = float(jrec["qcvars"]["CURRENT ENERGY"].data)
-            if "CURRENT GRADIENT" in jrec["qcvars"]:
-                gradients_dict[pair] = jrec["qcvars"]["CURRENT GRADIENT"].data
-            else:
-                gradients_dict[pair] = None
-            var_key = "N-BODY (%s)@(%s) TOTAL ENERGY" % (
-                ", ".join([str(i) for i in pair[0]]),
-                ", ".join([str(i) for i in pair[1]]),
-            )
-            intermediates_dict[var_key] = float(jrec["qcvars"]["CURRENT ENERGY"].data)
-            print(
-                "\n       N-Body: Complex Energy (fragments = %s, basis = %s: %20.14f)\n"
-                % (str(pair[0]), str(pair[1]), energies_dict[pair])
-            )
-            # Flip this off for now, needs more testing
-            # if 'cp' in bsse_type_list and (len(bsse_type_list) == 1):
-            #    core.set_global_option('DF_INTS_IO', 'LOAD')
-
-    #            core.clean()
+            tasks[pair] = ((method_string,), {"molecule": current_mol, "return_wfn": True, **kwargs})
+
+    print("\n   ==> N-Body: Now computing %d complexes <==\n\n" % len(tasks))
+
+    # Save energies info as components arrive
+    for num, (pair, (ptype_value, jrec)) in enumerate(
+        executor.fan_out(func, tasks, **metadata.get("executor", {})), start=1
+    ):
+        ptype_dict[pair] = ptype_value
+        energies_dict[pair] = float(jrec["qcvars"]["CURRENT ENERGY"].data)
+        if "CURRENT GRADIENT" in jrec["qcvars"]:
+            gradients_dict[pair] = jrec["qcvars"]["CURRENT GRADIENT"].data
+        else:
+            gradients_dict[pair] = None
+        var_key = "N-BODY (%s)@(%s) TOTAL ENERGY" % (
+            ", ".join([str(i) for i in pair[0]]),
+            ", ".join([str(i) for i in pair[1]]),
+        )
+        intermediates_dict[var_key] = float(jrec["qcvars"]["CURRENT ENERGY"].data)
+        print(
+            "\n       N-Body: Complex (%d/%d) Energy (fragments = %s, basis = %s: %20.14f)\n"
+            % (num, len(tasks), str(pair[0]), str(pair[1]), energies_dict[pair])
+        )
+        # Flip this off for now, needs more testing
+        # if 'cp' in bsse_type_list and (len(bsse_type_list) == 1):
+        #    core.set_global_option('DF_INTS_IO', 'LOAD')
 
     return {
         "energies": energies_dict,
@@ -1,5 +1,6 @@
 from ..exceptions import ValidationError
 from ..util import der0th, der1st, der2nd, find_approximate_string_matches, no, yes
+from .executor import executor_kwargs
 from .proc_table import procedures
 
 pkgprefix = {
@@ -10,6 +11,20 @@ pkgprefix = {
     "gms-": "gamess",
 }
 
+# kwargs passed along as-is rather than interpreted as booleans
+verbatim_kwargs = [
+    "irrep",
+    "check_bsse",
+    "linkage",
+    "bsse_type",
+    "local_options",
+    "keywords",
+    "findif_checkpoint",
+    "findif_stencil_size",
+    "findif_step_size",
+    "sowreap_dir",
+]
+
 
 def kwargs_lower(kwargs):
     """Sanitize user's `kwargs`.
@@ -23,7 +38,7 @@ def kwargs_lower(kwargs):
     caseless_kwargs = {}
     for key, value in kwargs.items():
         lkey = key.lower()
-        if lkey in ["subset", "banner"]:  # only kw for which case matters
+        if lkey in ["subset", "banner", "findif_checkpoint", "sowreap_dir"]:  # only kw for which case matters
             lvalue = value
         else:
             try:
@@ -31,7 +46,7 @@ def kwargs_lower(kwargs):
             except (AttributeError, KeyError):
                 lvalue = value
 
-        if lkey in ["irrep", "check_bsse", "linkage", "bsse_type", "local_options"]:
+        if lkey in verbatim_kwargs + executor_kwargs:
             caseless_kwargs[lkey] = lvalue
 
         elif "dertype" in lkey:
@@ -152,7 +167,7 @@ def _process_displacement(derivfunc, method, molecule, displacement, n, ndisp, *
         The function computing the target derivative.
     method : str
        A string specifying the method to be used for the computation.
-    molecule: psi4.core.molecule or qcdb.molecule
+    molecule: qcdb.molecule
        The molecule for the computation. All processing is handled internally.
        molecule must not be modified!
     displacement : dict
@@ -165,39 +180,36 @@ def _process_displacement(derivfunc, method, molecule, displacement, n, ndisp, *
 
     Returns
     -------
-    wfn: :py:class:`~psi4.core.Wavefunction`
-        The wavefunction computed.
+    wfn: dict
+        The job record computed.
     """
     import sys
 
     import numpy as np
-    import psi4
 
-    # print progress to file and screen
-    psi4.core.print_out("\n")
-    # p4util.banner('Loading displacement %d of %d' % (n, ndisp))
+    from ..molecule.libmintspointgrp import PointGroup
+
+    # print progress to screen
     print(""" %d""" % (n), end=("\n" if (n == ndisp) else ""))
     sys.stdout.flush()
 
     parent_group = molecule.point_group()
     clone = molecule.clone()
     clone.reinterpret_coordentry(False)
+    clone.fix_com(True)
     clone.fix_orientation(True)
 
     # Load in displacement (flat list) into the active molecule
     geom_array = np.reshape(displacement["geometry"], (-1, 3))
-    clone.set_geometry(psi4.core.Matrix.from_array(geom_array))
+    clone.set_geometry(geom_array)
 
     # If the user insists on symmetry, weaken it if some is lost when displacing.
     if molecule.symmetry_from_input():
         disp_group = clone.find_highest_point_group()
         new_bits = parent_group.bits() & disp_group.bits()
-        new_symm_string = qcdb.PointGroup.bits_to_full_name(new_bits)
+        new_symm_string = PointGroup.bits_to_full_name(new_bits)
         clone.reset_point_group(new_symm_string)
 
-    # clean possibly necessary for n=1 if its irrep (unsorted in displacement list) different from initial G0 for freq
-    psi4.core.clean()
-
     # Perform the derivative calculation
     derivative, wfn = derivfunc(method, return_wfn=True, molecule=clone, **kwargs)
     displacement["energy"] = wfn["qcvars"]["CURRENT ENERGY"].data
@@ -206,7 +218,4 @@ def _process_displacement(derivfunc, method, molecule, displacement, n, ndisp, *
     if derivfunc.__name__ == "gradient":
         displacement["gradient"] = wfn["qcvars"]["CURRENT GRADIENT"].data
 
-    # clean may be necessary when changing irreps of displacements
-    psi4.core.clean()
-
     return wfn
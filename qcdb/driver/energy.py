@@ -320,12 +320,16 @@ def energy(name, **kwargs):
 
     kwargs = driver_util.kwargs_lower(kwargs)
 
+    # Private keywords (e.g., a cbs() component) in place of the global ones, passed along on any bounce
+    keywords = kwargs.pop("keywords", pe.nu_options)
+    private = {} if keywords is pe.nu_options else {"keywords": keywords}
+
     if "options" in kwargs:
-        driver_helpers.set_options(kwargs.pop("options"))
+        driver_helpers.set_options(kwargs.pop("options"), keywords=keywords)
 
     # Bounce if name is function
     if hasattr(name, "__call__"):
-        return name(energy, kwargs.pop("label", "custom function"), ptype="energy", **kwargs)
+        return name(energy, kwargs.pop("label", "custom function"), ptype="energy", **private, **kwargs)
 
     # Allow specification of methods to arbitrary order
     lowername = name.lower()
@@ -344,11 +348,11 @@ def energy(name, **kwargs):
     # Bounce to CP if bsse kwarg
     if kwargs.get("bsse_type", None) is not None:
         # return nbody_driver.nbody_gufunc(energy, name, ptype="energy", molecule=molecule, **kwargs)
-        return nbody_gufunc(energy, name, ptype="energy", molecule=molecule, **kwargs)
+        return nbody_gufunc(energy, name, ptype="energy", molecule=molecule, **private, **kwargs)
 
     # Bounce to CBS if "method/basis" name
     if "/" in lowername:
-        return cbs_driver._cbs_gufunc(energy, name, ptype="energy", molecule=molecule, **kwargs)
+        return cbs_driver._cbs_gufunc(energy, name, ptype="energy", molecule=molecule, **private, **kwargs)
 
     # Commit to procedures['energy'] call hereafter
     return_wfn = kwargs.pop("return_wfn", False)
@@ -396,7 +400,7 @@ def energy(name, **kwargs):
     # print('\nENE calling', 'procedures', package, lowername, 'with', lowername, molecule, pe.nu_options, kwargs)
     # jobrec = procedures['energy'][package][lowername](lowername, molecule=molecule, options=pe.active_options, **kwargs)
     jobrec = procedures["energy"][package][lowername](
-        lowername, molecule=molecule, options=pe.nu_options, ptype="energy", **kwargs
+        lowername, molecule=molecule, options=keywords, ptype="energy", **kwargs
     )
 
     #    for postcallback in hooks['energy']['post']:
@@ -0,0 +1,158 @@
+"""Executors to fan out the independent subcalculations of composite driver
+procedures (many-body, CBS, finite difference) over the cores of a node.
+
+"""
+import concurrent.futures
+import math
+import multiprocessing
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple, Union
+
+import qcengine as qcng
+
+from ..exceptions import ValidationError
+
+executor_kwargs = ["executor", "max_workers", "memory_per_job", "ncores_per_job"]
+
+
+class SerialExecutor(concurrent.futures.Executor):
+    """Local task queue stand-in that runs each task in the calling process
+    as soon as it is submitted. Same interface as the pool executors, so
+    drivers need only one code path."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = concurrent.futures.Future()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as err:
+            future.set_exception(err)
+        else:
+            future.set_result(result)
+        return future
+
+
+def default_max_workers(memory_per_job: Optional[float] = None, ncores_per_job: Optional[int] = None) -> int:
+    """Number of simultaneous jobs that fit on this node's cores and, if
+    `memory_per_job` [GiB] given, its memory."""
+
+    node = qcng.config.get_global()
+    nworkers = max(1, node["ncores"] // (ncores_per_job or 1))
+    if memory_per_job:
+        nworkers = min(nworkers, max(1, math.floor(node["memory"] / memory_per_job)))
+
+    return nworkers
+
+
+def get_executor(
+    executor: Union[None, str, concurrent.futures.Executor] = None, max_workers: Optional[int] = None
+) -> concurrent.futures.Executor:
+    """Build executor from `executor` in {None, 'serial', 'thread', 'process'} or pass through an Executor instance.
+
+    Process pools are forked so that workers inherit the driver's global keywords and procedures table.
+
+    """
+    if isinstance(executor, concurrent.futures.Executor):
+        return executor
+
+    if executor in [None, "serial"]:
+        return SerialExecutor()
+    elif executor == "thread":
+        return concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    elif executor == "process":
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("fork")
+        )
+    else:
+        raise ValidationError(f"Executor '{executor}' not recognized. Try 'serial', 'thread', or 'process'.")
+
+
+def pop_executor_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Remove and return the executor-control entries of driver `kwargs`."""
+
+    return {k: kwargs.pop(k) for k in executor_kwargs if k in kwargs}
+
+
+def _call_in_worker(fn: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Any:
+    """Run task in a worker process and strip the per-job keywords object from any jobrec returned."""
+
+    ret = fn(*args, **kwargs)
+    if isinstance(ret, tuple) and isinstance(ret[-1], dict):
+        ret[-1].get("extras", {}).pop("qcdb:options", None)
+
+    return ret
+
+
+def fan_out(
+    fn: Callable,
+    tasks: Dict[Hashable, Tuple[Tuple, Dict[str, Any]]],
+    *,
+    executor: Union[None, str, concurrent.futures.Executor] = None,
+    max_workers: Optional[int] = None,
+    memory_per_job: Optional[float] = None,
+    ncores_per_job: Optional[int] = None,
+    follow: Optional[Callable[[Hashable, Any], Optional[Tuple[Hashable, Tuple[Tuple, Dict[str, Any]]]]]] = None,
+) -> Iterator[Tuple[Hashable, Any]]:
+    """Run `fn` on each of the independent `tasks` and yield results as they complete.
+
+    Parameters
+    ----------
+    fn
+        Function to call for each task, usually a driver function like ``energy``.
+    tasks
+        Map of task label to ``(args, kwargs)`` for each call of `fn`.
+    executor
+        Executor instance or one of {None, 'serial', 'thread', 'process'}. An instance is left running for reuse.
+    max_workers
+        Maximum simultaneous jobs. Defaults to as many as fit the node's cores and memory.
+    memory_per_job
+        Memory [GiB] allotted each job. Passed to QCEngine through ``local_options``.
+    ncores_per_job
+        Cores allotted each job. Passed to QCEngine through ``local_options``.
+    follow
+        Called with the label and result of each completed task to return a further
+        ``(label, (args, kwargs))`` task that depended upon it, or None.
+
+    Yields
+    ------
+    label, result
+        Task label and return value of `fn` in order of completion.
+
+    """
+    if max_workers is None and executor not in [None, "serial"]:
+        max_workers = default_max_workers(memory_per_job, ncores_per_job)
+
+    resources = {}
+    if memory_per_job:
+        resources["memory"] = memory_per_job
+    if ncores_per_job:
+        resources["ncores"] = ncores_per_job
+
+    pool = get_executor(executor, max_workers=max_workers)
+    runner = _call_in_worker if isinstance(pool, concurrent.futures.ProcessPoolExecutor) else None
+
+    def submit(label, args, kwargs):
+        if resources:
+            kwargs = {**kwargs, "local_options": {**(kwargs.get("local_options") or {}), **resources}}
+        if runner:
+            futures[pool.submit(runner, fn, args, kwargs)] = label
+        else:
+            futures[pool.submit(fn, *args, **kwargs)] = label
+
+    try:
+        futures = {}
+        for label, (args, kwargs) in tasks.items():
+            submit(label, args, kwargs)
+
+        while futures:
+            done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                label = futures.pop(future)
+                result = future.result()
+                if follow:
+                    task = follow(label, result)
+                    if task is not None:
+                        submit(task[0], *task[1])
+                yield label, result
+
+    finally:
+        if pool is not executor:
+            pool.shutdown(wait=True, cancel_futures=True)
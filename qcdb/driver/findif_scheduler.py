@@ -0,0 +1,206 @@
+"""Scheduler running the independent displaced computations of a finite
+difference derivative concurrently, with optional on-disk checkpointing so
+that an interrupted set of displacements may resume.
+
+"""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from . import driver_util, executor, pe, result_cache
+
+
+class DisplacementCheckpoint:
+    """Directory of completed finite difference displacements.
+
+    Each displacement is stored under its position in the displacement list alongside
+    its geometry and the signature of the computation, both of which must match on
+    reload for the record to be reused.
+
+    Parameters
+    ----------
+    directory
+        Where to store displacement records. Created if absent.
+    signature
+        Digest of what determines each displacement's result besides its geometry, as from :py:func:`signature`.
+    geometry_tolerance
+        Largest coordinate difference [a0] for a stored record to match a requested displacement.
+
+    """
+
+    def __init__(self, directory: str, signature: str = None, geometry_tolerance: float = 1.0e-8):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        os.makedirs(self.directory, exist_ok=True)
+        self.signature = signature
+        self.geometry_tolerance = geometry_tolerance
+
+    def _path(self, n: int) -> str:
+        return os.path.join(self.directory, f"disp{n:05d}.pkl")
+
+    def load(self, n: int, geometry: np.ndarray) -> Optional[Dict[str, Any]]:
+        """Return record of displacement `n` if present and computed at `geometry` to `signature`, else None."""
+
+        try:
+            with open(self._path(n), "rb") as handle:
+                record = pickle.load(handle)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+
+        if record.get("signature") != self.signature:
+            return None
+
+        stored = np.asarray(record["geometry"])
+        geometry = np.asarray(geometry)
+        if stored.shape != geometry.shape or not np.allclose(stored, geometry, atol=self.geometry_tolerance, rtol=0.0):
+            return None
+
+        return record
+
+    def save(self, n: int, record: Dict[str, Any]) -> None:
+        """Write record of displacement `n` atomically."""
+
+        record = {**record, "signature": self.signature}
+        fd, tmppath = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(record, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmppath, self._path(n))
+
+
+def signature(
+    derivfunc: Callable, method: str, package: str, keywords: "Keywords", molecule: Optional["Molecule"] = None
+) -> str:
+    """Digest of the derivative function, method, package, disputed `keywords`, and all but the geometry of
+    `molecule` of a set of displacements."""
+
+    canon = {
+        "derivfunc": derivfunc.__name__,
+        "method": method,
+        "package": package,
+        "keywords": result_cache.canonical_keywords(keywords),
+    }
+
+    if molecule is not None:
+        molrec = molecule.to_schema(dtype=2)
+        canon["molecule"] = {
+            "symbols": list(molrec["symbols"]),
+            "masses": np.round(np.asarray(molrec["masses"]), 6).tolist(),
+            "real": list(molrec["real"]),
+            "charge": round(molrec["molecular_charge"], 6),
+            "multiplicity": molrec["molecular_multiplicity"],
+            "fragments": [list(map(int, frag)) for frag in molrec["fragments"]],
+            "fragment_charges": [round(chg, 6) for chg in molrec["fragment_charges"]],
+            "fragment_multiplicities": list(molrec["fragment_multiplicities"]),
+        }
+
+    text = json.dumps(canon, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _guarded_displacement(*args, **kwargs):
+    """Run _process_displacement, returning rather than raising any error so that
+    the remaining displacements are still collected and checkpointed."""
+
+    try:
+        return None, driver_util._process_displacement(*args, **kwargs)
+    except Exception as err:
+        return err, None
+
+
+def run_displacements(
+    derivfunc: Callable,
+    method: str,
+    molecule: "Molecule",
+    findif_meta_dict: Dict[str, Any],
+    *,
+    checkpoint: Optional[str] = None,
+    execopts: Optional[Dict[str, Any]] = None,
+    **kwargs,
+) -> Dict[str, Any]:
+    """Compute the reference and all displacements of `findif_meta_dict`, filling in their
+    ``energy`` and, if `derivfunc` is ``gradient``, ``gradient`` entries.
+
+    Parameters
+    ----------
+    derivfunc
+        The function computing the target derivative at each geometry.
+    method
+        Method to be used for each computation.
+    molecule
+        Undisplaced molecule. Not modified.
+    findif_meta_dict
+        Finite difference plan with ``reference`` and ``displacements`` entries.
+    checkpoint
+        Directory in which to record each completed displacement. Displacements
+        already recorded there at the same geometry by the same derivative
+        function, method, package, keywords, and molecular charge, multiplicity,
+        and fragmentation are not recomputed.
+    execopts
+        Pool and per-job resources as for :py:func:`~qcdb.driver.executor.fan_out`.
+
+    Returns
+    -------
+    dict
+        Job record of the reference computation.
+
+    """
+    if checkpoint:
+        package = driver_util.get_package2(method, kwargs.get("package"))
+        keywords = kwargs.get("keywords", pe.nu_options)
+        ckpt = DisplacementCheckpoint(checkpoint, signature(derivfunc, method, package, keywords, molecule))
+    else:
+        ckpt = None
+
+    # number displacements as _process_displacement does, reference first
+    plan = {1: findif_meta_dict["reference"]}
+    plan.update(enumerate(findif_meta_dict["displacements"].values(), start=2))
+    ndisp = len(plan)
+
+    reference = None
+    tasks = {}
+    for n, displacement in plan.items():
+        record = ckpt.load(n, displacement["geometry"]) if ckpt else None
+        if record is None:
+            dkwargs = {} if n == 1 else {"write_orbitals": False}
+            tasks[n] = ((derivfunc, method, molecule, displacement, n, ndisp), {**dkwargs, **kwargs})
+            continue
+
+        displacement["energy"] = record["energy"]
+        if "gradient" in record:
+            displacement["gradient"] = record["gradient"]
+        if n == 1:
+            reference = record["jobrec"]
+
+    if len(tasks) < ndisp:
+        print(f""" {ndisp - len(tasks)} of {ndisp} displacements recovered from checkpoint.""")
+
+    failed = []
+    for n, (err, wfn) in executor.fan_out(_guarded_displacement, tasks, **(execopts or {})):
+        if err is not None:
+            failed.append((n, err))
+            continue
+
+        displacement = plan[n]
+        record = {"geometry": displacement["geometry"]}
+
+        # in a process pool, _process_displacement filled only a copy of `displacement`
+        displacement["energy"] = record["energy"] = wfn["qcvars"]["CURRENT ENERGY"].data
+        if derivfunc.__name__ == "gradient":
+            displacement["gradient"] = record["gradient"] = wfn["qcvars"]["CURRENT GRADIENT"].data
+        if n == 1:
+            reference = wfn
+            record["jobrec"] = {k: v for k, v in wfn.items() if k != "extras"}
+
+        if ckpt:
+            ckpt.save(n, record)
+
+    if failed:
+        n, err = min(failed, key=lambda fail: fail[0])
+        print(f""" {len(failed)} of {ndisp} displacements failed.""")
+        raise err
+
+    return reference
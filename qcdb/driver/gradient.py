@@ -7,9 +7,11 @@ properties, and vibrational frequency calculations.
 import copy
 import pprint
 
-from ..exceptions import FeatureNotImplemented
+import qcelemental as qcel
+
 from ..keywords import register_kwds
-from . import cbs_driver, driver_helpers, driver_util, pe
+from . import cbs_driver, driver_findif, driver_helpers, driver_util, executor, findif_scheduler, pe
+from .energy import energy
 from .proc_table import procedures
 
 pp = pprint.PrettyPrinter(width=120)
@@ -39,8 +41,12 @@ def gradient(name, **kwargs):
     kwargs = driver_util.kwargs_lower(kwargs)
     text = ""
 
+    # Private keywords (e.g., a cbs() component) in place of the global ones, passed along on any bounce
+    keywords = kwargs.pop("keywords", pe.nu_options)
+    private = {} if keywords is pe.nu_options else {"keywords": keywords}
+
     if "options" in kwargs:
-        driver_helpers.set_options(kwargs.pop("options"))
+        driver_helpers.set_options(kwargs.pop("options"), keywords=keywords)
 
     #       # Bounce to CP if bsse kwarg (someday)
     #       if kwargs.get('bsse_type', None) is not None:
@@ -106,7 +112,7 @@ def gradient(name, **kwargs):
         molecule = kwargs.pop("molecule", driver_helpers.get_active_molecule())
         if dertype == 1:
             # Bounce to CBS in pure-gradient mode if "method/basis" name and all parts have analytic grad. avail.
-            return cbs_driver._cbs_gufunc(gradient, name, ptype="gradient", molecule=molecule, **kwargs)
+            return cbs_driver._cbs_gufunc(gradient, name, ptype="gradient", molecule=molecule, **private, **kwargs)
     #        else:
     #            # Set method-dependent scf convergence criteria (test on procedures['energy'] since that's guaranteed)
     #            optstash = driver_util._set_convergence_criterion('energy', cbs_methods[0], 8, 10, 8, 10, 8)
@@ -130,6 +136,11 @@ def gradient(name, **kwargs):
     # Commit to procedures[] call hereafter
     #  lowername = name.lower()
     return_wfn = kwargs.pop("return_wfn", False)
+    execopts = executor.pop_executor_kwargs(kwargs)  # controls for running findif displacements
+    findif_checkpoint = kwargs.pop("findif_checkpoint", None)
+    findif_options = {
+        key: kwargs.pop(f"findif_{key}") for key in ["stencil_size", "step_size"] if f"findif_{key}" in kwargs
+    }
     package = driver_util.get_package2(lowername, kwargs.get("package", None))
     #    core.clean_variables()
     #
@@ -162,7 +173,7 @@ def gradient(name, **kwargs):
 
         # Perform the gradient calculation
         jobrec = procedures["gradient"][package][lowername](
-            lowername, molecule=molecule, options=pe.nu_options, ptype="gradient", **kwargs
+            lowername, molecule=molecule, options=keywords, ptype="gradient", **kwargs
         )
 
         # print('GRADIENT() JOBREC (j@io) <<<')
@@ -178,7 +189,36 @@ def gradient(name, **kwargs):
             return jobrec["qcvars"]["CURRENT GRADIENT"].data
 
     else:
-        raise FeatureNotImplemented("""gradient(dertype=0)""" + package + lowername)
+        print("""gradient() will perform gradient computation by finite difference of analytic energies.\n""")
+
+        # Obtain list of displacements
+        findif_meta_dict = driver_findif.gradient_from_energies_geometries(molecule, **findif_options)
+        ndisp = len(findif_meta_dict["displacements"]) + 1
+
+        print(""" %d displacements needed.""" % ndisp)
+
+        # Run reference and displaced energies, concurrently if so directed, resuming from any checkpoint
+        jobrec = findif_scheduler.run_displacements(
+            energy,
+            lowername,
+            molecule,
+            findif_meta_dict,
+            checkpoint=findif_checkpoint,
+            execopts=execopts,
+            keywords=keywords,
+            **kwargs,
+        )
+
+        # Assemble gradient from energies
+        G = driver_findif.assemble_gradient_from_energies(findif_meta_dict)
+        jobrec["qcvars"]["CURRENT GRADIENT"] = qcel.Datum("CURRENT GRADIENT", "Eh/a0", G)
+
+        pe.active_qcvars = copy.deepcopy(jobrec["qcvars"])
+
+        if return_wfn:
+            return (jobrec["qcvars"]["CURRENT GRADIENT"].data, jobrec)
+        else:
+            return jobrec["qcvars"]["CURRENT GRADIENT"].data
 
 
 #        core.print_out("""gradient() will perform gradient computation by finite difference of analytic energies.\n""")
@@ -9,11 +9,14 @@ import copy
 import pprint
 
 import numpy as np
+import qcelemental as qcel
 
 from .. import vib
+from ..exceptions import ValidationError
 from ..keywords import register_kwds
 from ..molecule import Molecule
-from . import cbs_driver, driver_helpers, driver_util, pe
+from . import cbs_driver, driver_findif, driver_helpers, driver_util, executor, findif_scheduler, pe, sowreap
+from .energy import energy
 from .gradient import gradient
 from .proc_table import procedures
 
@@ -48,6 +51,13 @@ def hessian(name, **kwargs):
     kwargs = driver_util.kwargs_lower(kwargs)
     text = ""
 
+    # Private keywords (e.g., a cbs() component) in place of the global ones, passed along on any bounce
+    keywords = kwargs.pop("keywords", pe.nu_options)
+    private = {} if keywords is pe.nu_options else {"keywords": keywords}
+
+    if "options" in kwargs:
+        driver_helpers.set_options(kwargs.pop("options"), keywords=keywords)
+
     #    # Bounce to CP if bsse kwarg (someday)
     #    if kwargs.get('bsse_type', None) is not None:
     #        raise ValidationError("Hessian: Cannot specify bsse_type for hessian yet.")
@@ -73,9 +83,16 @@ def hessian(name, **kwargs):
     # Check if this is a CBS extrapolation
     if "/" in lowername:
         molecule = kwargs.pop("molecule", driver_helpers.get_active_molecule())
-        return cbs_driver._cbs_gufunc(hessian, lowername, ptype="hessian", molecule=molecule, **kwargs)
+        return cbs_driver._cbs_gufunc(hessian, lowername, ptype="hessian", molecule=molecule, **private, **kwargs)
 
     return_wfn = kwargs.pop("return_wfn", False)
+    execopts = executor.pop_executor_kwargs(kwargs)  # controls for running findif displacements
+    findif_checkpoint = kwargs.pop("findif_checkpoint", None)
+    findif_options = {
+        key: kwargs.pop(f"findif_{key}")
+        for key in ["stencil_size", "step_size", "displacement_space"]
+        if f"findif_{key}" in kwargs
+    }
     #    core.clean_variables()
     dertype = 2
 
@@ -94,9 +111,8 @@ def hessian(name, **kwargs):
     #        kwargs['level'] = level
     # NOTE TODO kwargs getting overwitten by cbs_gufunc and dertype lost
 
-    dertype = driver_util.find_derivative_type(
-        "hessian", lowername, kwargs.pop("hess_dertype", kwargs.pop("dertype", None)), kwargs.get("package")
-    )
+    user_dertype = kwargs.pop("hess_dertype", kwargs.pop("dertype", None))
+    dertype = driver_util.find_derivative_type("hessian", lowername, user_dertype, kwargs.get("package"))
 
     # Make sure the molecule the user provided is the active one
     molecule = kwargs.pop("molecule", driver_helpers.get_active_molecule())
@@ -106,19 +122,21 @@ def hessian(name, **kwargs):
         print("EMPTY OPT")
         pe.load_options()
 
-    #    # S/R: Mode of operation- whether finite difference freq run in one job or files farmed out
-    #    freq_mode = kwargs.pop('mode', 'continuous').lower()
-    #    if freq_mode == 'continuous':
-    #        pass
-    #    elif freq_mode == 'sow':
-    #        if dertype == 2:
-    #            raise ValidationError("""Frequency execution mode 'sow' not valid for analytic Hessian calculation.""")
-    #    elif freq_mode == 'reap':
-    #        freq_linkage = kwargs.get('linkage', None)
-    #        if freq_linkage is None:
-    #            raise ValidationError("""Frequency execution mode 'reap' requires a linkage option.""")
-    #    else:
-    #        raise ValidationError("""Frequency execution mode '%s' not valid.""" % (freq_mode))
+    # S/R: Mode of operation- whether finite difference freq run in one job or files farmed out
+    freq_mode = kwargs.pop("mode", "continuous")
+    sowreap_dir = kwargs.pop("sowreap_dir", "findif_sowreap")
+    if freq_mode == "continuous":
+        pass
+    elif freq_mode == "sow":
+        if dertype == 2:
+            raise ValidationError("""Frequency execution mode 'sow' not valid for analytic Hessian calculation.""")
+    elif freq_mode == "reap":
+        if user_dertype is None:
+            dertype = {"gradient": 1, "energy": 0}[sowreap.load_manifest(sowreap_dir)["driver"]]
+        elif dertype == 2:
+            raise ValidationError("""Frequency execution mode 'reap' not valid for analytic Hessian calculation.""")
+    else:
+        raise ValidationError("""Frequency execution mode '%s' not valid.""" % (freq_mode))
 
     # Set method-dependent scf convergence criteria (test on procedures['energy'] since that's guaranteed)
     #    optstash_conv = driver_util._set_convergence_criterion('energy', lowername, 8, 10, 8, 10, 8)
@@ -149,7 +167,7 @@ def hessian(name, **kwargs):
 
         # We have the desired method. Do it.
         jobrec = procedures["hessian"][package][lowername](
-            lowername, molecule=molecule, options=pe.nu_options, ptype="hessian", **kwargs
+            lowername, molecule=molecule, options=keywords, ptype="hessian", **kwargs
         )
         #        wfn.set_gradient(G0)
         #        optstash.restore()
@@ -167,134 +185,65 @@ def hessian(name, **kwargs):
         else:
             return jobrec["qcvars"]["CURRENT HESSIAN"].data
 
-    elif dertype == 1:
-        # raise FeatureNotImplemented("""hessian({}, dertype=1)""".format(lowername))
-
-        print("""hessian() will perform frequency computation by finite difference of analytic gradients.\n""")
-        print("IRREP", irrep)
-        import psi4
-
-        # Shifting the geometry so need to copy the active molecule
-        # moleculeclone = molecule.clone()
-        moleculeclone = psi4.core.Molecule.from_dict(molecule.to_dict())
-
-        #####
-        #        # Obtain list of displacements
-        #        findif_meta_dict = driver_findif.hessian_from_energies_geometries(molecule, irrep)
-        #
-        #        # Record undisplaced symmetry for projection of diplaced point groups
-        #        core.set_global_option("PARENT_SYMMETRY", molecule.schoenflies_symbol())
-        #
-        #        ndisp = len(findif_meta_dict["displacements"]) + 1
-        #
-        #        print(' %d displacements needed.' % ndisp)
-        #
-        #        wfn = _process_displacement(energy, lowername, molecule, findif_meta_dict["reference"], 1, ndisp,
-        #                                    **kwargs)
-        #        var_dict = core.variables()
-        #
-        #        for n, displacement in enumerate(findif_meta_dict["displacements"].values(), start=2):
-        #            _process_displacement(
-        #                energy, lowername, molecule, displacement, n, ndisp, write_orbitals=False, **kwargs)
-        #
-        #        # Reset variables
-        #        for key, val in var_dict.items():
-        #            core.set_variable(key, val)
-        #
-        #        # Assemble Hessian from energies
-        #        H = driver_findif.assemble_hessian_from_energies(findif_meta_dict, irrep)
-        #        wfn.set_hessian(core.Matrix.from_array(H))
-        #        wfn.set_gradient(G0)
-        #
-        #####
-
-        # Obtain list of displacements
-        findif_meta_dict = psi4.driver.driver_findif.hessian_from_gradients_geometries(moleculeclone, irrep)
-
-        # Record undisplaced symmetry for projection of displaced point groups
-        psi4.core.set_global_option("PARENT_SYMMETRY", moleculeclone.schoenflies_symbol())
-
-        ndisp = len(findif_meta_dict["displacements"]) + 1
-
-        print(""" %d displacements needed.""" % ndisp)
-
-        # wfn = psi4.driver._process_displacement(gradient, lowername, moleculeclone, findif_meta_dict["reference"], 1, ndisp, **kwargs)
-        subjobrec = driver_util._process_displacement(
-            gradient, lowername, moleculeclone, findif_meta_dict["reference"], 1, ndisp, **kwargs
-        )
-        var_dict = psi4.core.variables()
-
-        for n, displacement in enumerate(findif_meta_dict["displacements"].values(), start=2):
-            # psi4.driver._process_displacement(gradient, lowername, moleculeclone, displacement, n, ndisp, write_orbitals=False, **kwargs)
-            driver_util._process_displacement(
-                gradient, lowername, moleculeclone, displacement, n, ndisp, write_orbitals=False, **kwargs
+    else:
+        if dertype == 1:
+            print("""hessian() will perform frequency computation by finite difference of analytic gradients.\n""")
+            derivfunc = gradient
+            geometries = driver_findif.hessian_from_gradients_geometries
+            assemble = driver_findif.assemble_hessian_from_gradients
+        else:
+            print("""hessian() will perform frequency computation by finite difference of analytic energies.\n""")
+            derivfunc = energy
+            geometries = driver_findif.hessian_from_energies_geometries
+            assemble = driver_findif.assemble_hessian_from_energies
+
+        # S/R: Derivatives were computed elsewhere, so just collect them with the displacements they belong to
+        if freq_mode == "reap":
+            findif_meta_dict, subjobrec = sowreap.reap(
+                sowreap_dir, lowername, molecule, package=package, derivfunc=derivfunc.__name__, irrep=irrep
             )
 
-        # Reset variables
-        for key, val in var_dict.items():
-            psi4.core.set_variable(key, val)
+        else:
+            # Obtain list of displacements
+            findif_meta_dict = geometries(molecule, irrep, **findif_options)
+
+            ndisp = len(findif_meta_dict["displacements"]) + 1
+
+            print(""" %d displacements needed.""" % ndisp)
+
+        # S/R: Write each displaced geometry to an input file and quit
+        if freq_mode == "sow":
+            sowreap.sow(
+                lowername,
+                molecule,
+                findif_meta_dict,
+                sowreap_dir,
+                keywords=keywords,
+                package=package,
+                derivfunc=derivfunc.__name__,
+                irrep=irrep,
+            )
+            if return_wfn:
+                return (None, None)
+            else:
+                return None
+
+        elif freq_mode == "continuous":
+            # Run reference and displaced derivatives, concurrently if so directed, resuming from any checkpoint
+            subjobrec = findif_scheduler.run_displacements(
+                derivfunc,
+                lowername,
+                molecule,
+                findif_meta_dict,
+                checkpoint=findif_checkpoint,
+                execopts=execopts,
+                keywords=keywords,
+                **kwargs,
+            )
 
-        # Assemble Hessian from gradients
-        #   Final disp is undisp, so wfn has mol, G, H general to freq calc
-        H = psi4.driver.driver_findif.assemble_hessian_from_gradients(findif_meta_dict, irrep)
-        #        wfn.set_hessian(core.Matrix.from_array(H))
-        #        wfn.set_gradient(G0)
-        ####
-        #        # Obtain list of displacements
-        #        displacements = psi4.core.fd_geoms_freq_1(moleculeclone, irrep)
-        #        moleculeclone.reinterpret_coordentry(False)
-        #        moleculeclone.fix_orientation(True)
-        #
-        #        # Record undisplaced symmetry for projection of displaced point groups
-        #        psi4.core.set_parent_symmetry(molecule.schoenflies_symbol())
-        #
-        #        ndisp = len(displacements)
-        #        print(""" %d displacements needed.""" % ndisp)
-        #        gradients = []
-        #        energies = []
-        #
-        #
-        #        for n, displacement in enumerate(displacements):
-        #            # Build string of title banner
-        #            banners = util.banner(' Hessian Computation: Gradient Displacement %d '.format(n + 1))
-        #
-        #            if True:
-        #                # Load in displacement into the active molecule (xyz coordinates only)
-        #                moleculeclone.set_geometry(displacement)
-        #
-        #                # Perform the gradient calculation
-        #                G, subjobrec = gradient(lowername, molecule=moleculeclone, return_wfn=True, **kwargs)
-        #
-        #                gradients.append(psi4.core.Matrix.from_array(subjobrec['qcvars']['CURRENT GRADIENT'].data))
-        #                energies.append(float(subjobrec['qcvars']['CURRENT ENERGY'].data))
-        #
-        #                # clean may be necessary when changing irreps of displacements
-        #                psi4.core.clean()
-        #
-        #
-        #        # Assemble Hessian from gradients
-        #        #   Final disp is undisp, so wfn has mol, G, H general to freq calc
-        #        #H = psi4.core.fd_freq_1(molecule, gradients, irrep)  # TODO or moleculeclone?
-        #        for gr in gradients:
-        #            print(np.array(gr))
-        #        H = psi4.core.fd_freq_1(moleculeclone, gradients, irrep)  # TODO or moleculeclone?
-
-        #        wfn.set_hessian(H)
-        #        wfn.set_gradient(G0)
-        #        wfn.set_frequencies(core.get_frequencies())
-        subjobrec["qcvars"]["CURRENT HESSIAN"] = QCAspect("CURRENT HESSIAN", "Eh/a0/a0", H, "")
-        #
-        #        # The last item in the list is the reference energy, return it
-        #        core.set_variable('CURRENT ENERGY', energies[-1])
-        #
-        #        core.set_parent_symmetry('')
-        #        optstash.restore()
-        #        optstash_conv.restore()
-        #
-        #        if return_wfn:
-        #            return (wfn.hessian(), wfn)
-        #        else:
-        #            return wfn.hessian()
+        # Assemble Hessian from gradients or energies
+        H = assemble(findif_meta_dict, irrep)
+        subjobrec["qcvars"]["CURRENT HESSIAN"] = qcel.Datum("CURRENT HESSIAN", "Eh/a0/a0", H)
 
         # pp.pprint(subjobrec)
         pe.active_qcvars = copy.deepcopy(subjobrec["qcvars"])
@@ -304,9 +253,6 @@ def hessian(name, **kwargs):
         else:
             return subjobrec["qcvars"]["CURRENT HESSIAN"].data
 
-    else:
-        raise FeatureNotImplemented("""hessian({}, dertype=0)""".format(lowername))
-
 
 #        core.print_out("""hessian() will perform frequency computation by finite difference of analytic energies.\n""")
 #
@@ -491,6 +437,21 @@ def frequency(name, **kwargs):
     #        run an initial job with ``'sow'`` and follow instructions in its output file.
     #        For maximum flexibility, ``return_wfn`` is always on in ``'reap'`` mode.
     #
+    #    :type sowreap_dir: string
+    #    :param sowreap_dir: |dl| ``'findif_sowreap'`` |dr| || ``'/scratch/h2o_freq'`` || etc.
+    #
+    #        Directory into which ``'sow'`` writes a manifest and one QCSchema input per
+    #        displacement, to be run through ``qcdb.driver.sowreap.compute_sown``, and whence
+    #        ``'reap'`` collects the results. Missing results are listed in the error raised.
+    #
+    #    :type findif_displacement_space: string
+    #    :param findif_displacement_space: |dl| ``'cdsalc'`` |dr| || ``'unique'``
+    #
+    #        For a finite difference of gradients Hessian, whether to displace along
+    #        the symmetry-adapted coordinates of the D2h subgroup (``'cdsalc'``) or along
+    #        only those Cartesian coordinates not related by the molecule's full point
+    #        group (``'unique'``), reconstructing the rest by symmetry.
+    #
     #    :type dertype: :ref:`dertype <op_py_dertype>`
     #    :param dertype: |dl| ``'hessian'`` |dr| || ``'gradient'`` || ``'energy'``
     #
@@ -571,10 +532,13 @@ def frequency(name, **kwargs):
     # Compute the hessian
     H, jobrec = hessian(lowername, return_wfn=True, molecule=molecule, **kwargs)
 
-    #    # S/R: Quit after getting new displacements
-    #    if freq_mode == 'sow':
-    #        return 0.0
-    #
+    # S/R: Quit after getting new displacements
+    if kwargs.get("mode") == "sow":
+        if return_wfn:
+            return (None, None)
+        else:
+            return None
+
     #    # Project final frequencies?
     #    translations_projection_sound, rotations_projection_sound = _energy_is_invariant(wfn.gradient())
     # TODO hack!!!
@@ -609,20 +573,18 @@ def vibanal_str(mass, coord, fcm, hess=None, project_trans=True, project_rot=Tru
     else:
         nmwhess = hess
 
-    mol = psi4.geometry(coord)
+    mol = Molecule(coord)
+    mol.update_geometry()
     m = np.asarray(mass)  # not good permanent
-    geom = np.asarray(mol.geometry())
+    geom = mol.geometry(np_out=True)
     symbols = [mol.symbol(at) for at in range(mol.natom())]
     irrep_labels = mol.irrep_labels()
 
-    wfn = psi4.core.Wavefunction.build(mol, "STO-3G")  # dummy, obviously. only used for SALCs
-    basisset = wfn.basisset()
-
-    vibinfo, vibtext = qcdb.vib.harmonic_analysis(
-        nmwhess, geom, m, basisset, irrep_labels, project_trans=project_trans, project_rot=project_rot
+    vibinfo, vibtext = vib.harmonic_analysis(
+        nmwhess, geom, m, mol, irrep_labels, project_trans=project_trans, project_rot=project_rot
     )
     print(vibtext)
-    print(qcdb.vib.print_vibs(vibinfo, shortlong=True, normco="q", atom_lbl=symbols))  # , groupby=-1))
+    print(vib.print_vibs(vibinfo, shortlong=True, normco="q", atom_lbl=symbols))  # , groupby=-1))
 
     return vibinfo
 
@@ -658,16 +620,8 @@ def vibanal_jobrec(jobrec, hess=None, irrep=None, molecule=None, project_trans=T
     m = np.asarray(molrec["masses"])
     irrep_labels = molecule.irrep_labels()
 
-    import psi4
-
-    # wfn = psi4.core.Wavefunction.build(psi4.core.Molecule.from_dict(molrec), "STO-3G")  # dummy, obviously. only used for SALCs
-    wfn = psi4.core.Wavefunction.build(
-        psi4.core.Molecule.from_dict(molecule.to_dict()), "STO-3G"
-    )  # dummy, obviously. only used for SALCs
-    basisset = wfn.basisset()
-
     vibinfo, vibtext = vib.harmonic_analysis(
-        nmwhess, geom, m, basisset, irrep_labels, project_trans=project_trans, project_rot=project_rot
+        nmwhess, geom, m, molecule, irrep_labels, project_trans=project_trans, project_rot=project_rot
     )
 
     print(vibtext)
@@ -324,12 +324,12 @@ def optking(name, **kwargs):
         #            steps_since_last_hessian += 1
 
         popts = {}
-        for k, v in pe.nu_options.scroll["QCDB"].items():
-            if v.disputed() and k.endswith("G_CONVERGENCE"):
+        for k, v in pe.nu_options.disputed("QCDB").items():
+            if k.endswith("G_CONVERGENCE"):
                 popts[k] = v.value
 
-        for k, v in pe.nu_options.scroll["PSI4"].items():
-            if v.disputed() and k.endswith("G_CONVERGENCE"):
+        for k, v in pe.nu_options.disputed("PSI4").items():
+            if k.endswith("G_CONVERGENCE"):
                 popts[k] = v.value
         psi4.driver.p4util.python_helpers.set_options(popts)
 
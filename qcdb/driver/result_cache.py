@@ -0,0 +1,211 @@
+"""On-disk, content-addressed cache of single-point job records so that
+identical molecule/method/basis/keywords combinations recurring in CBS,
+many-body, and finite difference workflows are computed only once.
+
+"""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+import numpy as np
+import qcengine as qcng
+from qcelemental.models import AtomicInput
+
+# here liveth the cache consulted by the program runners, if any
+active_cache = None
+
+
+def canonical_keywords(ropts: Optional["Keywords"]) -> Dict[str, Dict[str, Any]]:
+    """Values of the disputed keywords of `ropts` by domain, in sorted order, for hashing."""
+
+    kwds = {}
+    if ropts is not None:
+        for pkg in sorted(ropts.scroll):
+            disputed = {k: v.value for k, v in sorted(ropts.disputed(pkg).items())}
+            if disputed:
+                kwds[pkg] = disputed
+
+    return kwds
+
+
+class ResultCache:
+    """Directory of pickled job records keyed by a hash of the QCSchema input.
+
+    Parameters
+    ----------
+    directory
+        Where to store cache files. Created if absent. Defaults to a fresh temporary directory.
+    max_bytes
+        Size above which least-recently-used entries are evicted.
+    geometry_tolerance
+        Cartesian coordinates [a0] are rounded to multiples of this value before hashing.
+
+    """
+
+    suffix = ".jobrec.pkl"
+
+    def __init__(self, directory: str = None, max_bytes: int = 2**30, geometry_tolerance: float = 1.0e-6):
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="qcdb_cache_")
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.geometry_tolerance = geometry_tolerance
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters of cache traffic and current footprint."""
+
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(ent.stat().st_size for ent in entries),
+        }
+
+    def key(self, input_model: AtomicInput, program: str) -> str:
+        """Canonical hash of the parts of `input_model` that determine the result of `program`."""
+
+        mol = input_model.molecule
+        geom = np.asarray(mol.geometry).reshape(-1, 3)
+        rgeom = np.rint(geom / self.geometry_tolerance).astype(np.int64)
+
+        canon = {
+            "program": program,
+            "driver": input_model.driver,
+            "method": input_model.model.method,
+            "basis": input_model.model.basis,
+            "symbols": list(mol.symbols),
+            "geometry": rgeom.ravel().tolist(),
+            "masses": np.round(np.asarray(mol.masses), 6).tolist(),
+            "real": list(mol.real),
+            "charge": round(mol.molecular_charge, 6),
+            "multiplicity": mol.molecular_multiplicity,
+            "fragments": [list(map(int, frag)) for frag in mol.fragments],
+            "fix_com": mol.fix_com,
+            "fix_orientation": mol.fix_orientation,
+            "keywords": canonical_keywords(input_model.extras.get("qcdb:options")),
+            "mode_config": str(input_model.extras.get("qcdb:mode_config")),
+        }
+
+        text = json.dumps(canon, sort_keys=True, default=str)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return stored job record for `key` (marking it recently used) or None."""
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as handle:
+                jobrec = pickle.load(handle)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return jobrec
+
+    def put(self, key: str, jobrec: Dict[str, Any]) -> None:
+        """Store `jobrec` for `key` atomically, then evict down to `max_bytes`."""
+
+        jobrec = dict(jobrec)
+        jobrec["extras"] = {k: v for k, v in jobrec.get("extras", {}).items() if k != "qcdb:options"}
+
+        fd, tmppath = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump(jobrec, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # record not storable; the job result itself is unaffected
+            os.remove(tmppath)
+            return
+        os.replace(tmppath, self._path(key))
+
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+
+        for ent in self._entries():
+            os.remove(ent.path)
+        self.hits = self.misses = self.evictions = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def _entries(self):
+        return [ent for ent in os.scandir(self.directory) if ent.name.endswith(self.suffix)]
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for ent in self._entries():
+            try:
+                st = ent.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, ent.path))
+            total += st.st_size
+
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+
+def enable_result_cache(
+    directory: str = None, max_bytes: int = 2**30, geometry_tolerance: float = 1.0e-6
+) -> ResultCache:
+    """Serve repeated single-point jobs from an on-disk cache at `directory`. See :py:class:`ResultCache`."""
+
+    global active_cache
+    active_cache = ResultCache(directory, max_bytes=max_bytes, geometry_tolerance=geometry_tolerance)
+    return active_cache
+
+
+def disable_result_cache() -> None:
+    """Stop consulting the result cache. Files on disk are left in place."""
+
+    global active_cache
+    active_cache = None
+
+
+def compute(input_model: AtomicInput, program: str, local_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Run `input_model` through QCEngine harness `program` and return the job record as dictionary,
+    consulting the active result cache first and filling it afterwards."""
+
+    cache = active_cache
+    if cache is None:
+        return qcng.compute(input_model, program, local_options=local_options, raise_error=True).dict()
+
+    key = cache.key(input_model, program)
+    jobrec = cache.get(key)
+    if jobrec is None:
+        jobrec = qcng.compute(input_model, program, local_options=local_options, raise_error=True).dict()
+        cache.put(key, jobrec)
+    elif "qcdb:options" in input_model.extras:
+        jobrec["extras"]["qcdb:options"] = input_model.extras["qcdb:options"]
+
+    return jobrec
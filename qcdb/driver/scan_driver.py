@@ -0,0 +1,177 @@
+"""Potential energy scans along the geometry variables of a molecule, with all
+points built up front and run concurrently.
+
+"""
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..exceptions import ValidationError
+from . import driver_helpers, driver_util, executor, pe
+from .energy import energy
+
+
+def scan_molecules(molecule: "Molecule", variables: List[str], values: np.ndarray) -> List["Molecule"]:
+    """Build the molecule at each row of `values` for geometry `variables`.
+
+    Parameters
+    ----------
+    molecule
+        Molecule with geometry `variables`, usually a Z-matrix. Not modified.
+    variables
+        Names of the geometry variables to set.
+    values
+        (M, len(variables)) values of the variables at each point.
+
+    Returns
+    -------
+    list of Molecule
+        Cartesian molecule at each point, charge, multiplicity, fragmentation
+        and frame handling as `molecule`.
+
+    """
+    from ..molecule import Molecule
+
+    molecule.update_geometry()
+    molrec = molecule.to_dict(force_units="Bohr")
+    molrec.pop("input_units_to_au", None)
+
+    mols = []
+    for geom in molecule.scan_geometries(variables, values):
+        molrec["geom"] = geom.ravel()
+        mols.append(Molecule.from_dict(molrec))
+
+    return mols
+
+
+def _scan_job(func: Callable, name: str, **kwargs) -> Tuple[float, Dict[str, Any]]:
+    """Run a single point of a scan against a private copy of the keywords."""
+
+    return func(name, keywords=pe.nu_options.fork(), return_wfn=True, **kwargs)
+
+
+def scan_iter(
+    name: str,
+    molecule: Optional["Molecule"] = None,
+    variable: Union[str, List[str]] = None,
+    values: np.ndarray = None,
+    *,
+    guess: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    **kwargs,
+) -> Iterator[Tuple[int, np.ndarray, float, Dict[str, Any]]]:
+    """Run a scan, yielding each point as it completes. See :py:func:`scan`.
+
+    Yields
+    ------
+    index, value, energy, jobrec
+        Position of the point in `values`, its variable value(s), its energy [Eh], and its job record.
+
+    """
+    kwargs = driver_util.kwargs_lower(kwargs)
+    execopts = executor.pop_executor_kwargs(kwargs)
+    kwargs.pop("return_wfn", None)
+
+    if molecule is None:
+        molecule = driver_helpers.get_active_molecule()
+    if variable is None or values is None:
+        raise ValidationError("scan: both `variable` and `values` are required.")
+
+    variables = [variable] if isinstance(variable, str) else list(variable)
+    values = np.asarray(values, dtype=float).reshape(-1, len(variables))
+    npoints = values.shape[0]
+    if npoints == 0:
+        raise ValidationError("scan: no `values` to scan.")
+
+    mols = scan_molecules(molecule, variables, values)
+
+    # global keywords settled before points run concurrently against copies
+    if "options" in kwargs:
+        driver_helpers.set_options(kwargs.pop("options"))
+    if len(pe.nu_options.scroll) == 0:
+        pe.load_options()
+
+    def task(idx, extra):
+        return idx, ((energy, name), {"molecule": mols[idx], **kwargs, **extra})
+
+    if guess is None:
+        tasks = dict(task(idx, {}) for idx in range(npoints))
+        follow = None
+    else:
+        # contiguous runs of points, one per worker, each point seeded from its predecessor
+        if execopts.get("executor") in [None, "serial"]:
+            nchain = 1
+        else:
+            nchain = execopts.get("max_workers") or executor.default_max_workers(
+                execopts.get("memory_per_job"), execopts.get("ncores_per_job")
+            )
+        heads = [int(chain[0]) for chain in np.array_split(np.arange(npoints), min(npoints, nchain))]
+        tasks = dict(task(idx, {}) for idx in heads)
+
+        def follow(idx, result):
+            if idx + 1 == npoints or idx + 1 in heads:
+                return None
+            return task(idx + 1, guess(result[1]))
+
+    for idx, (ene, jobrec) in executor.fan_out(_scan_job, tasks, follow=follow, **execopts):
+        yield idx, values[idx] if len(variables) > 1 else values[idx, 0], ene, jobrec
+
+
+def scan(
+    name: str,
+    molecule: Optional["Molecule"] = None,
+    variable: Union[str, List[str]] = None,
+    values: np.ndarray = None,
+    **kwargs,
+):
+    """Compute the energy of `molecule` at each of `values` of geometry `variable`.
+
+    Parameters
+    ----------
+    name
+        Method, as for :py:func:`~qcdb.energy`.
+    molecule
+        Molecule with geometry variable(s) `variable`. Defaults to the active molecule. Not modified.
+    variable
+        Geometry variable to scan, or list of variables to scan together.
+    values
+        Values of `variable` at each point, or (npoints, nvariables) for a list of `variable`.
+        Units as the molecule's input, degrees for angles.
+    guess
+        Called with the job record of a converged point to return additional
+        ``energy()`` kwargs for the next point along the scan, such as options
+        to read its orbitals, where the program harness supports it. When
+        given, each worker runs a contiguous stretch of points in order rather
+        than all points being independent.
+    return_wfn
+        Additionally return the job record of each point.
+    executor, max_workers, memory_per_job, ncores_per_job
+        Pool and per-job resources as for :py:func:`~qcdb.driver.executor.fan_out`.
+    kwargs
+        Passed to each ``energy()`` call.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        Scanned values, as given.
+    energies : numpy.ndarray
+        Energy [Eh] at each of `values`.
+    jobrecs : list of dict
+        Job record at each of `values`, if `return_wfn`.
+
+    Examples
+    --------
+    >>> h2 = qcdb.Molecule("H\\nH 1 R\\nR=0.74")
+    >>> rvals, energies = qcdb.scan("hf", h2, variable="R", values=np.linspace(0.6, 1.0, 9), executor="thread")
+    >>> qcdb.diatomic(rvals, energies, h2)
+
+    """
+    return_wfn = driver_util.kwargs_lower(kwargs).get("return_wfn", False)
+
+    points = sorted(scan_iter(name, molecule, variable, values, **kwargs), key=lambda point: point[0])
+    values = np.asarray([point[1] for point in points])
+    energies = np.asarray([point[2] for point in points])
+
+    if return_wfn:
+        return values, energies, [point[3] for point in points]
+    else:
+        return values, energies
@@ -0,0 +1,345 @@
+"""Sow/reap execution of finite difference Hessians, where each displaced
+computation is written out as a self-contained QCSchema ``AtomicInput`` JSON
+file to be run anywhere (see :py:func:`compute_sown`), and the Hessian is later
+assembled from whichever result files have been gathered back.
+
+"""
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import qcelemental as qcel
+
+from ..exceptions import MissingDisplacementsError, ValidationError
+from ..util import provenance_stamp
+
+manifest_schema_name = "qcdb_findif_sowreap"
+manifest_schema_version = 1
+
+
+def _jsonify(obj: Any) -> Any:
+    """``json.dump`` fallback for the NumPy types in molecules and findif plans."""
+
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump(obj: Dict[str, Any], path: str) -> None:
+    tmppath = path + ".tmp"
+    with open(tmppath, "w") as handle:
+        json.dump(obj, handle, default=_jsonify, indent=1)
+    os.replace(tmppath, path)
+
+
+def input_filename(n: int) -> str:
+    return f"disp{n:05d}.in.json"
+
+
+def output_filename(n: int) -> str:
+    return f"disp{n:05d}.out.json"
+
+
+def keywords_to_dict(keywords: "Keywords") -> Dict[str, Any]:
+    """Collect all non-default values of `keywords` into a dictionary of
+    :py:func:`~qcdb.set_options` form, e.g., ``{"psi4_scf__d_convergence": 8}``."""
+
+    options = {}
+    for pkg in keywords.scroll:
+        for key, okey in keywords.disputed(pkg).items():
+            if not okey.is_default():
+                options[f"{pkg}_{key}".lower()] = okey.value
+
+    return options
+
+
+def sow(
+    method: str,
+    molecule: "Molecule",
+    findif_meta_dict: Dict[str, Any],
+    directory: str,
+    *,
+    keywords: "Keywords",
+    package: str,
+    derivfunc: str = "gradient",
+    irrep: int = -1,
+) -> str:
+    """Write the reference and each displacement of `findif_meta_dict` as a QCSchema
+    ``AtomicInput`` file into `directory` along with a manifest for :py:func:`reap`.
+
+    Parameters
+    ----------
+    method
+        Method to be used for each computation.
+    molecule
+        Undisplaced molecule supplying all but the geometry of each displacement.
+    findif_meta_dict
+        Finite difference plan with ``reference`` and ``displacements`` entries.
+    directory
+        Where to write the input files and manifest. Created if absent.
+    keywords
+        Options, all non-default values of which are written to each input file.
+    package
+        Program to run each displacement through.
+    derivfunc
+        Derivative computed at each geometry.
+    irrep
+        Irrep of the requested partial Hessian, or -1 for all.
+
+    Returns
+    -------
+    str
+        Path to the manifest.
+
+    """
+    directory = os.path.abspath(os.path.expanduser(directory))
+    os.makedirs(directory, exist_ok=True)
+
+    molschema = molecule.to_schema(dtype=2)
+    molschema["fix_com"] = True
+    molschema["fix_orientation"] = True
+    options = keywords_to_dict(keywords)
+    basis = keywords.scroll["QCDB"]["BASIS"].value or "(auto)"
+
+    # number displacements as findif_scheduler does, reference first
+    plan = [("reference", findif_meta_dict["reference"])]
+    plan.extend(findif_meta_dict["displacements"].items())
+
+    displacements = []
+    for n, (label, displacement) in enumerate(plan, start=1):
+        atin = {
+            "schema_name": "qcschema_input",
+            "schema_version": 1,
+            "driver": derivfunc,
+            "model": {"method": method, "basis": basis},
+            "molecule": {**molschema, "geometry": np.asarray(displacement["geometry"]).ravel()},
+            "keywords": options,
+            "extras": {"qcdb:package": package, "qcdb:displacement": label},
+        }
+        _dump(atin, os.path.join(directory, input_filename(n)))
+        displacements.append({"n": n, "label": label, "input": input_filename(n), "output": output_filename(n)})
+
+    manifest = {
+        "schema_name": manifest_schema_name,
+        "schema_version": manifest_schema_version,
+        "method": method,
+        "package": package,
+        "driver": derivfunc,
+        "irrep": irrep,
+        "findif_meta_dict": findif_meta_dict,
+        "displacements": displacements,
+    }
+    path = os.path.join(directory, "manifest.json")
+    _dump(manifest, path)
+
+    print(f""" Sowed {len(plan)} displacements into {directory}. Run each of them, e.g.,\n""")
+    print(f"""     python -c "import qcdb; qcdb.driver.sowreap.compute_sown('{input_filename(1)}')"\n""")
+    print(""" then call again with mode='reap' to assemble the Hessian.""")
+
+    return path
+
+
+def compute_sown(infile: str, outfile: Optional[str] = None) -> Dict[str, Any]:
+    """Run one ``AtomicInput`` file written by :py:func:`sow` and write its
+    ``AtomicResult`` alongside, where :py:func:`reap` expects it.
+
+    Replaces any options previously set in this process.
+
+    Parameters
+    ----------
+    infile
+        Path to ``disp*.in.json`` file.
+    outfile
+        Path of result. Defaults to `infile` with ``.in.json`` replaced by ``.out.json``.
+
+    Returns
+    -------
+    dict
+        Result in QCSchema ``AtomicResult`` form.
+
+    """
+    from ..molecule import Molecule
+    from . import driver_helpers, pe
+    from .energy import energy
+    from .gradient import gradient
+
+    with open(infile) as handle:
+        atin = json.load(handle)
+    if outfile is None:
+        outfile = infile.replace(".in.json", ".out.json")
+
+    pe.clean_options()
+    pe.load_options()
+    driver_helpers.set_options(atin["keywords"])
+    molecule = Molecule.from_schema(atin["molecule"])
+
+    derivfunc = {"energy": energy, "gradient": gradient}[atin["driver"]]
+    ret, jobrec = derivfunc(
+        atin["model"]["method"], molecule=molecule, package=atin["extras"]["qcdb:package"], return_wfn=True
+    )
+
+    qcvars = {k: v.dict() for k, v in jobrec["qcvars"].items()}
+    atres = {
+        **atin,
+        "schema_name": "qcschema_output",
+        "return_result": ret,
+        "properties": {"return_energy": jobrec["qcvars"]["CURRENT ENERGY"].data},
+        "provenance": provenance_stamp(__name__),
+        "success": True,
+        "extras": {**atin["extras"], "qcdb:qcvars": qcvars},
+    }
+    _dump(atres, outfile)
+
+    return atres
+
+
+def missing_displacements(directory: str) -> List[str]:
+    """Return the input files of the manifest in `directory` lacking a successful result."""
+
+    manifest = load_manifest(directory)
+    return [disp["input"] for disp in manifest["displacements"] if _load_result(directory, disp) is None]
+
+
+def load_manifest(directory: str) -> Dict[str, Any]:
+    """Return the manifest written by :py:func:`sow` into `directory`."""
+
+    path = os.path.join(os.path.expanduser(directory), "manifest.json")
+    try:
+        with open(path) as handle:
+            manifest = json.load(handle)
+    except FileNotFoundError:
+        raise ValidationError(f"No sow/reap manifest at {path}. Run with mode='sow' first.")
+
+    if manifest.get("schema_name") != manifest_schema_name:
+        raise ValidationError(f"Not a sow/reap manifest: {path}")
+
+    return manifest
+
+
+def _load_result(directory: str, disp: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(os.path.expanduser(directory), disp["output"])) as handle:
+            atres = json.load(handle)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if not atres.get("success", False):
+        return None
+
+    return atres
+
+
+def check_manifest(
+    manifest: Dict[str, Any],
+    method: Optional[str] = None,
+    molecule: Optional["Molecule"] = None,
+    *,
+    package: Optional[str] = None,
+    derivfunc: Optional[str] = None,
+    irrep: Optional[int] = None,
+    geometry_tolerance: float = 1.0e-6,
+) -> None:
+    """Check that the computation sowed into `manifest` is the one requested by the given arguments.
+
+    Raises
+    ------
+    ValidationError
+        If method, package, derivative function, irrep, or reference geometry (in [a0], to within
+        `geometry_tolerance`) differ from those sowed.
+
+    """
+    mismatches = []
+    for field, requested in [("method", method), ("package", package), ("driver", derivfunc)]:
+        if requested is not None and requested.lower() != manifest[field].lower():
+            mismatches.append(f"{field} '{requested}' (sowed '{manifest[field]}')")
+    if irrep is not None and irrep != manifest["irrep"]:
+        mismatches.append(f"irrep {irrep} (sowed {manifest['irrep']})")
+
+    if molecule is not None:
+        sowed = np.asarray(manifest["findif_meta_dict"]["reference"]["geometry"], dtype=float).ravel()
+        geom = molecule.geometry(np_out=True).ravel()
+        if geom.shape != sowed.shape or not np.allclose(geom, sowed, atol=geometry_tolerance, rtol=0.0):
+            mismatches.append("molecule (reference geometry differs from that sowed)")
+
+    if mismatches:
+        raise ValidationError(f"Sow/reap manifest is for another computation: {', '.join(mismatches)}.")
+
+
+def reap(
+    directory: str,
+    method: Optional[str] = None,
+    molecule: Optional["Molecule"] = None,
+    *,
+    package: Optional[str] = None,
+    derivfunc: Optional[str] = None,
+    irrep: Optional[int] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Gather results of the displacements sowed into `directory`.
+
+    Parameters
+    ----------
+    directory
+        Where :py:func:`sow` wrote the manifest and whither results have been gathered.
+    method, molecule, package, derivfunc, irrep
+        If given, must match those sowed, as for :py:func:`check_manifest`.
+
+    Returns
+    -------
+    findif_meta_dict
+        Finite difference plan with ``energy`` and any ``gradient`` filled in for reference and displacements.
+    jobrec
+        Job record of the reference computation with ``molecule`` and ``qcvars``.
+
+    Raises
+    ------
+    ValidationError
+        If the sowed computation isn't the one requested.
+    MissingDisplacementsError
+        If any displacement lacks a successful result. Its ``missing`` attribute lists their input files.
+
+    """
+    manifest = load_manifest(directory)
+    check_manifest(manifest, method, molecule, package=package, derivfunc=derivfunc, irrep=irrep)
+    findif_meta_dict = manifest["findif_meta_dict"]
+
+    plan = [findif_meta_dict["reference"]]
+    plan.extend(findif_meta_dict["displacements"].values())
+
+    missing = []
+    reference = None
+    for disp, displacement in zip(manifest["displacements"], plan):
+        atres = _load_result(directory, disp)
+        if atres is None:
+            missing.append(disp["input"])
+            continue
+
+        displacement["energy"] = atres["properties"]["return_energy"]
+        if manifest["driver"] == "gradient":
+            displacement["gradient"] = np.asarray(atres["return_result"]).reshape(-1, 3)
+        if disp["n"] == 1:
+            reference = atres
+
+    ndisp = len(plan)
+    print(f""" Reaped {ndisp - len(missing)} of {ndisp} displacements from {directory}.""")
+    if missing:
+        raise MissingDisplacementsError(missing)
+
+    qcvars = {}
+    for label, dqcvar in reference.get("extras", {}).get("qcdb:qcvars", {}).items():
+        if isinstance(dqcvar["data"], list):
+            dqcvar["data"] = np.asarray(dqcvar["data"])
+        qcvars[label] = qcel.Datum(**dqcvar)
+    qcvars["CURRENT ENERGY"] = qcel.Datum("CURRENT ENERGY", "Eh", reference["properties"]["return_energy"])
+    if manifest["driver"] == "gradient":
+        qcvars["CURRENT GRADIENT"] = qcel.Datum("CURRENT GRADIENT", "Eh/a0", plan[0]["gradient"])
+
+    jobrec = {
+        "molecule": reference["molecule"],
+        "qcvars": qcvars,
+        "provenance": provenance_stamp(__name__),
+    }
+
+    return findif_meta_dict, jobrec
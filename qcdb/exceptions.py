@@ -167,3 +167,17 @@ class UpgradeHelper(QcdbException):
         msg = "Using `{}` instead of `{}` is obsolete as of {}.{}".format(old, new, version, elaboration)
         QcdbException.__init__(self, msg)
         print("\nQcdbException: %s\n\n" % (msg))
+
+
+class MissingDisplacementsError(QcdbException):
+    """Error called when reaping a finite difference computation for which
+    results of the displacements *missing* have not been gathered.
+
+    """
+
+    def __init__(self, missing):
+        msg = "Results missing for {} displacement(s): {}".format(len(missing), ", ".join(missing))
+        QcdbException.__init__(self, msg)
+        self.msg = msg
+        self.missing = missing
+        print("\nQcdbException: %s\n\n" % (msg))
@@ -1,9 +1,14 @@
+import copy
 import uuid
+import weakref
 from collections import defaultdict
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from ..exceptions import KeywordReconciliationError, KeywordValidationError, ValidationError
 
+# keyword sets from which others are forked, by id, for restoring unpickled forks in this (or a forked) process
+_roots = weakref.WeakValueDictionary()
+
 
 class Keywords:
     mark_of_the_user = "00000000"
@@ -14,6 +19,147 @@ class Keywords:
         self.aliases = defaultdict(dict)
         self.scroll = defaultdict(dict)
 
+        # copy-on-write bookkeeping. Keyword-s marked with `_token` aren't shared with any fork, so can be modified
+        #   in place. `_changed` are keywords modified since forked (ultimately) from `_root`, None if self.
+        #   `_generation` counts modifications.
+        self._root = None
+        self._root_id = uuid.uuid4().hex
+        self._token = uuid.uuid4().hex
+        self._changed = defaultdict(dict)
+        self._generation = 0
+
+        # keywords with values proposed beyond the default, by domain
+        self._disputed = defaultdict(dict)
+        _roots[self._root_id] = self
+
+    def __deepcopy__(self, memo):
+        return self.fork()
+
+    def __getstate__(self):
+        """Pickle as the histories of keywords that differ from the root keyword set, not the whole set."""
+
+        root = self if self._root is None else self._root
+        changes = defaultdict(dict)
+        for pkg, keys in self.scroll.items():
+            rkeys = root.scroll.get(pkg, {})
+            for key, okey in keys.items():
+                rkey = rkeys.get(key)
+                if rkey is None:
+                    changes[pkg][key] = okey
+                elif okey is not rkey:
+                    changes[pkg][key] = okey.history
+
+        dropped = {
+            pkg: [key for key in keys if key not in self.scroll.get(pkg, {})] for pkg, keys in root.scroll.items()
+        }
+
+        return {
+            "root_id": self._root_id,
+            "root_generation": root._generation,
+            "domains": self.domains,
+            "aliases": dict(self.aliases),
+            "changes": dict(changes),
+            "dropped": {pkg: keys for pkg, keys in dropped.items() if keys},
+        }
+
+    def __setstate__(self, state):
+        root = _roots.get(state["root_id"])
+        if root is None:
+            raise ValidationError(
+                "Keywords can only be unpickled in a process holding the keyword set it was forked from."
+            )
+        if root._generation != state["root_generation"]:
+            raise ValidationError("Keywords can't be unpickled once the keyword set it was forked from has changed.")
+
+        self.__dict__.update(root.fork().__dict__)
+        self.domains = state["domains"]
+        self.aliases = defaultdict(dict, state["aliases"])
+        for pkg, keys in state["dropped"].items():
+            for key in keys:
+                del self.scroll[pkg][key]
+                self._disputed[pkg].pop(key, None)
+        for pkg, keys in state["changes"].items():
+            for key, change in keys.items():
+                if isinstance(change, Keyword):
+                    okey = change
+                else:
+                    okey = copy.copy(root.scroll[pkg][key])
+                    okey.history = list(change)
+                okey._owner = self._token
+                self.scroll[pkg][key] = okey
+                self._note_dispute(pkg, key)
+
+    def fork(self) -> "Keywords":
+        """Return an independent copy of the keyword set for a job to modify.
+
+        All Keyword-s are shared until modified in either copy, when that Keyword alone is copied, so forking costs
+        little more than the domain dictionaries. Forks pickle small, as their differences from the root keyword set.
+
+        """
+        child = Keywords.__new__(Keywords)
+        child.domains = list(self.domains)
+        child.aliases = defaultdict(dict, {pkg: dict(akeys) for pkg, akeys in self.aliases.items()})
+        child.scroll = defaultdict(dict, {pkg: dict(keys) for pkg, keys in self.scroll.items()})
+        child._root = self if self._root is None else self._root
+        child._root_id = self._root_id
+        child._token = uuid.uuid4().hex
+        child._changed = defaultdict(dict)
+        child._generation = 0
+        child._disputed = defaultdict(dict, {pkg: dict(keys) for pkg, keys in self._disputed.items()})
+
+        # Keyword-s this set may have modified in place are now shared
+        self._token = uuid.uuid4().hex
+
+        return child
+
+    def merge(self, other: "Keywords") -> None:
+        """Take up the keywords modified in fork ``other`` since it was forked (or last merged)."""
+
+        for pkg, keys in other._changed.items():
+            for key in keys:
+                self.scroll[pkg][key] = other.scroll[pkg][key]
+                self._changed[pkg][key] = True
+                self._note_dispute(pkg, key)
+        self._generation += 1
+
+        other._changed = defaultdict(dict)
+        other._token = uuid.uuid4().hex
+
+    def _own(self, package: str, key: str) -> "Keyword":
+        """Return Keyword ``key`` of domain ``package`` for modifying, first copying it if shared with a fork."""
+
+        okey = self.scroll[package][key]
+        if okey._owner != self._token:
+            okey = copy.copy(okey)
+            okey.history = list(okey.history)
+            okey._owner = self._token
+            self.scroll[package][key] = okey
+        self._changed[package][key] = True
+        self._generation += 1
+
+        return okey
+
+    def _note_dispute(self, package: str, key: str) -> None:
+        """Update disputed keywords for modified Keyword ``key`` of domain ``package``."""
+
+        if self.scroll[package][key].disputed():
+            self._disputed[package][key] = True
+        else:
+            self._disputed[package].pop(key, None)
+
+    def disputed(self, package: str) -> Dict[str, "Keyword"]:
+        """Keywords of domain ``package`` with values proposed beyond the default, without scanning all keywords.
+
+        Returns
+        -------
+        dict
+            Keyword name to Keyword, in order of first proposal.
+
+        """
+        pkg = package.upper()
+        keys = self.scroll.get(pkg, {})
+        return {key: keys[key] for key in self._disputed.get(pkg, {}) if key in keys}
+
     def __str__(self) -> str:
         text = []
         for pkg in self.scroll:
@@ -30,13 +176,12 @@ class Keywords:
         text = []
         for pkg in self.scroll:
             text.append(f"  <<<  {pkg}  >>>")
-            for key, okey in sorted(self.scroll[pkg].items()):
+            for key, okey in sorted(self.disputed(pkg).items()):
                 # if not okey.is_default():
-                if len(okey.history) > 1:
-                    if history:
-                        text.append(str(okey))
-                    else:
-                        text.append(okey.shortstr())
+                if history:
+                    text.append(str(okey))
+                else:
+                    text.append(okey.shortstr())
 
         return "\n".join(text)
 
@@ -45,10 +190,24 @@ class Keywords:
 
         pkg = package.upper()
         if pkg in self.domains:
+            key._owner = self._token
             self.scroll[pkg][key.keyword] = key
+            self._generation += 1
+            self._note_dispute(pkg, key.keyword)
         else:
             raise ValidationError(f"Domain not supported: {package}")
 
+    def remove(self, package: str, key: str) -> "Keyword":
+        """Unregister and return keyword ``key`` of domain ``package`` from the keyword set."""
+
+        pkg = package.upper()
+        okey = self.scroll[pkg].pop(key.upper())
+        self._disputed[pkg].pop(key.upper(), None)
+        self._changed[pkg].pop(key.upper(), None)
+        self._generation += 1
+
+        return okey
+
     def add_alias(self, package: str, key: "AliasKeyword") -> None:
         """Register single new alias keyword ``key`` of domain ``package`` into the keyword set."""
         pkg = package.upper()
@@ -102,24 +261,27 @@ class Keywords:
         ukey = key.upper()
         count = 0
         acount = 0
-        for ropt, oropt in self.scroll[pkg].items():
+        for ropt in self.scroll[pkg]:
             # if ropt.endswith(ukey):
             if ropt == ukey or ropt.endswith("__" + ukey):  # psi wants
+                oropt = self._own(pkg, ropt)
                 overlap = len(key)
                 if imperative:
                     oropt.require(value, overlap=overlap, accession=accession, verbose=verbose)
                 else:
                     oropt.suggest(value, overlap=overlap, accession=accession, verbose=verbose)
+                self._note_dispute(pkg, ropt)
                 count += 1
         if count == 0:
             for aopt, oaopt in self.aliases[pkg].items():
                 if aopt == ukey:
-                    oropt = self.scroll[pkg][oaopt.target]
+                    oropt = self._own(pkg, oaopt.target)
                     overlap = len(oropt.keyword)
                     if imperative:
                         oropt.require(value, overlap=overlap, accession=accession, verbose=verbose)
                     else:
                         oropt.suggest(value, overlap=overlap, accession=accession, verbose=verbose)
+                    self._note_dispute(pkg, oaopt.target)
                     acount += 1
 
         if count == 0 and acount == 0:
@@ -128,7 +290,9 @@ class Keywords:
     def unwind_by_accession(self, accession):
         for pkg in self.scroll:
             for rkey, orkey in self.scroll[pkg].items():
-                orkey.history = [entry for entry in orkey.history if entry[3] != accession]
+                if any(entry[3] == accession for entry in orkey.history):
+                    self._own(pkg, rkey).history = [entry for entry in orkey.history if entry[3] != accession]
+                    self._note_dispute(pkg, rkey)
 
 
 class AliasKeyword:
@@ -146,6 +310,7 @@ class Keyword:
         self.glossary = glossary
         self.validator = validator
         self.history = []  # list of quads (value, required, overlap, accession)
+        self._owner = None  # token of the Keywords that may modify this in place
         self.suggest(default, accession=self.mark_of_the_default, verbose=0)
         self.has_changed = False
         self.expert = expert
@@ -176,23 +341,38 @@ class Keyword:
         )
         return "\n".join(text)
 
+    @property
+    def history(self):
+        return self._history
+
+    @history.setter
+    def history(self, history):
+        self._history = history
+        self._resolved = None  # (value, score, history entry) of `history`, None when to be computed
+
     def _compute(self):
-        """The all-important `self.value` is read-only and computed on-the-fly from `self.history`."""
+        """The all-important `self.value` is read-only and computed from `self.history`, once per change to it."""
+
+        if self._resolved is None:
+            self._resolved = self._resolve()
+        return self._resolved
 
+    def _resolve(self):
         scores = [cand[2] + 100 * int(cand[1]) for cand in self.history]
         max_score = max(scores)
 
         # only catch user and driver reqd of highest relevance and most recent vintage
         user = None
-        for score, candidate in zip(reversed(scores), reversed(self.history)):
-            if score == max_score and candidate[3] == self.mark_of_the_user:
-                user = candidate
-                break
-
         driver = None
         for score, candidate in zip(reversed(scores), reversed(self.history)):
-            if score == max_score and candidate[3] != self.mark_of_the_user:
+            if score != max_score:
+                continue
+            if candidate[3] == self.mark_of_the_user:
+                if user is None:
+                    user = candidate
+            elif driver is None:
                 driver = candidate
+            if user is not None and driver is not None:
                 break
 
         if user is None and driver is None:
@@ -265,6 +445,7 @@ class Keyword:
             accession = uuid.uuid4()
 
         self.history.append((self._check(value), imperative, overlap, accession))
+        self._resolved = None
 
         if verbose >= 2:
             added = self.history[-1]
@@ -9,6 +9,8 @@ import collections
 import copy
 import math
 
+import numpy as np
+
 from ..exceptions import IncompleteAtomError, ValidationError
 from ..util.vecutil import *
 
@@ -21,6 +23,8 @@ class CoordValue(object):
     This class and its subclasses are used by `qcdb.Molecule` but not by users directly.
 
     """
+    __slots__ = ('PYfixed', )
+
     def __init__(self, fixed=False, computed=False):
         # Fixed coordinate? For a fixed value, the reset method does nothing.
         self.PYfixed = fixed
@@ -39,6 +43,8 @@ class CoordValue(object):
 
 class NumberValue(CoordValue):
     """Specialization of CoordValue that is simply a number to be stored."""
+    __slots__ = ('value', )
+
     def __init__(self, value, fixed=False):
         CoordValue.__init__(self, fixed, True)
         # coordinate number value
@@ -75,6 +81,8 @@ class VariableValue(CoordValue):
     on the list of geometry values stored by the molecule.
 
     """
+    __slots__ = ('PYname', 'geometryVariables', 'negate')
+
     def __init__(self, name, geometryVariables, negate=False, fixed=False):
         CoordValue.__init__(self, fixed, True)
         # Name of variable
@@ -139,6 +147,9 @@ class CoordEntry(object):
     This class and its subclasses are used by `qcdb.Molecule` but not by users directly.
 
     """
+    __slots__ = ('PYentry_number', 'computed', 'coordinates', 'PYZ', 'PYcharge', 'PYmass', 'PYsymbol', 'PYlabel', 'PYA',
+                 'ghosted', 'PYbasissets', 'PYshells')
+
     def __init__(self, entry_number, Z, charge, mass, symbol, label="", A=-1, basis=None, shells=None):
         """Constructor"""
         # Order in full atomic list
@@ -352,6 +363,8 @@ class CartesianEntry(CoordEntry):
     coordinate specification as three Cartesians.
 
     """
+    __slots__ = ('x', 'y', 'z')
+
     def __init__(self, entry_number, Z, charge, mass, symbol, label, A, x, y, z, basis=None, shells=None):
         CoordEntry.__init__(self, entry_number, Z, charge, mass, symbol, label, A, basis, shells)
         self.x = x
@@ -413,6 +426,8 @@ class ZMatrixEntry(CoordEntry):
     coordinate specification as any position of ZMatrix.
 
     """
+    __slots__ = ('rto', 'rval', 'ato', 'aval', 'dto', 'dval')
+
     def __init__(self,
                  entry_number,
                  Z,
@@ -598,3 +613,223 @@ class ZMatrixEntry(CoordEntry):
         CoordEntry.everything(self)
         print('\nZMatrixEntry\n  Type = %s\n\n' % (self.type()))
         print(self.print_in_input_format())
+
+
+def _perp_units(u, v):
+    """Row-wise perp_unit() of M X 3 arrays *u* and *v*."""
+    result = np.cross(u, v)
+    norm = np.linalg.norm(result, axis=1)
+    for row in np.flatnonzero(norm * norm < 1.0e-16):
+        result[row] = perp_unit(u[row].tolist(), v[row].tolist())
+        norm[row] = 1.0
+    return result / norm[:, None]
+
+
+def zmat_to_cartesian(anchors, values, cartesian=None):
+    """Cartesian coordinates of many geometries sharing one Z-matrix, each
+    atom placed from its anchors as ZMatrixEntry.compute() would, but
+    atom-by-atom across all geometries at once (NeRF-style).
+
+    Parameters
+    ----------
+    anchors : array_like of int
+        (nat, 3) zero-based indices of the distance, angle, and dihedral
+        anchor atoms of each atom; -1 where not defined.
+    values : array_like of float
+        (M, nat, 3) distance, angle, and dihedral (degrees) of each atom in
+        each geometry; values past the anchors present are ignored.
+    cartesian : array_like of bool, optional
+        (nat,) atoms whose `values` are instead x, y, z coordinates.
+
+    Returns
+    -------
+    numpy.ndarray
+        (M, nat, 3) coordinates in the units of the distances in `values`.
+
+    """
+    anchors = np.asarray(anchors, dtype=int)
+    values = np.asarray(values, dtype=float)
+    nat = anchors.shape[0]
+    if cartesian is None:
+        cartesian = np.zeros(nat, dtype=bool)
+    if values.ndim != 3 or values.shape[1:] != (nat, 3):
+        raise ValidationError('zmat_to_cartesian: values must be M X %d X 3, not %s' % (nat, values.shape))
+
+    geoms = np.zeros_like(values)
+    for at in range(nat):
+        rto, ato, dto = anchors[at]
+        if max(rto, ato, dto) >= at and not cartesian[at]:
+            raise ValidationError('zmat_to_cartesian: atom %d anchored to a later atom' % (at + 1))
+
+        if cartesian[at]:
+            geoms[:, at] = values[:, at]
+            continue
+
+        if rto < 0:
+            xyz = np.zeros_like(values[:, at])
+
+        elif ato < 0:
+            xyz = np.zeros_like(values[:, at])
+            xyz[:, 2] = values[:, at, 0]
+
+        else:
+            r = values[:, at, 0:1]
+            a = np.radians(values[:, at, 1:2])
+            B = geoms[:, rto]
+            eCB = B - geoms[:, ato]
+            eCB /= np.linalg.norm(eCB, axis=1)[:, None]
+
+            if dto < 0:
+                # CB collinear with X, find Y first; otherwise find X first
+                colinear = (np.fabs(1.0 - np.fabs(eCB[:, 0])) < 1.0E-5)[:, None]
+                unitX = np.broadcast_to([1.0, 0.0, 0.0], eCB.shape)
+                unitY = np.broadcast_to([0.0, 1.0, 0.0], eCB.shape)
+                eY = np.where(colinear, _perp_units(_perp_units(unitY, eCB), eCB), _perp_units(unitX, eCB))
+                xyz = B + r * (eY * np.sin(a) - eCB * np.cos(a))
+
+            else:
+                d = np.radians(values[:, at, 2:3])
+                eDC = geoms[:, ato] - geoms[:, dto]
+                eDC /= np.linalg.norm(eDC, axis=1)[:, None]
+                eY = _perp_units(eDC, eCB)
+                eX = _perp_units(eY, eCB)
+                xyz = B + r * (eX * np.sin(a) * np.cos(d) + eY * np.sin(a) * np.sin(d) - eCB * np.cos(a))
+
+        geoms[:, at] = np.where(np.fabs(xyz) < 1.E-14, 0.0, xyz)
+
+    return geoms
+
+
+class CartesianArrays(object):
+    """Contiguous storage for the atoms of a molecule whose every atom is a fixed
+    Cartesian, in place of one CartesianEntry (and three NumberValue) apiece.
+    Arrays run over all atoms, dummies included, in entry order. Each atom is
+    presented to the molecule as an ArrayEntry.
+
+    This class is used by `qcdb.Molecule` but not by users directly.
+
+    """
+    __slots__ = ('geom', 'Z', 'charge', 'mass', 'A', 'symbol', 'label', 'ghosted', 'fragment', 'basissets', 'shells')
+
+    def __init__(self, geom, Z, charge, mass, symbol, label, A):
+        # Cartesian coordinates in the units of the input
+        self.geom = np.array(geom, dtype=float).reshape(-1, 3)
+        nat = self.geom.shape[0]
+        # Atomic numbers, charges (SAD-related), masses and mass numbers
+        self.Z = np.array(Z).reshape(nat)
+        self.charge = np.array(charge).reshape(nat)
+        self.mass = np.array(mass, dtype=float).reshape(nat)
+        self.A = np.array(A, dtype=int).reshape(nat)
+        # Symbols and labels, upper-cased as in CoordEntry
+        self.symbol = np.array([sym.upper() for sym in symbol], dtype=object)
+        self.label = np.array([lbl.upper() for lbl in label], dtype=object)
+        # Ghost flags and index of the fragment holding each atom (-1 if none)
+        self.ghosted = np.zeros(nat, dtype=bool)
+        self.fragment = np.full(nat, -1, dtype=int)
+        # Basis and one-atom BasisSet hash assignments, created on first use
+        self.basissets = [None] * nat
+        self.shells = [None] * nat
+
+    def __len__(self):
+        return self.geom.shape[0]
+
+    def entries(self):
+        """Returns a new ArrayEntry for each atom."""
+        return [ArrayEntry(self, at) for at in range(len(self))]
+
+
+class ArrayEntry(CoordEntry):
+    """CoordEntry for atom *index* of a CartesianArrays, reading and
+    writing the arrays rather than holding its own data.
+
+    """
+    __slots__ = ('core', 'index')
+
+    def __init__(self, core, index):
+        self.core = core
+        self.index = index
+
+    def __reduce__(self):
+        # copies and pickles share the copied core among all entries
+        return (ArrayEntry, (self.core, self.index))
+
+    def _scalar(name):
+        def fget(self):
+            return getattr(self.core, name)[self.index].item()
+
+        def fset(self, value):
+            getattr(self.core, name)[self.index] = value
+
+        return property(fget, fset)
+
+    PYZ = _scalar('Z')
+    PYcharge = _scalar('charge')
+    PYmass = _scalar('mass')
+    PYA = _scalar('A')
+    ghosted = _scalar('ghosted')
+    del _scalar
+
+    @property
+    def PYentry_number(self):
+        return self.index
+
+    @property
+    def PYsymbol(self):
+        return self.core.symbol[self.index]
+
+    @property
+    def PYlabel(self):
+        return self.core.label[self.index]
+
+    def _assignments(name):
+        def fget(self):
+            assigned = getattr(self.core, name)
+            if assigned[self.index] is None:
+                assigned[self.index] = collections.OrderedDict()
+            return assigned[self.index]
+
+        def fset(self, value):
+            getattr(self.core, name)[self.index] = value
+
+        return property(fget, fset)
+
+    PYbasissets = _assignments('basissets')
+    PYshells = _assignments('shells')
+    del _assignments
+
+    @property
+    def computed(self):
+        return True
+
+    @property
+    def coordinates(self):
+        return self.core.geom[self.index].tolist()
+
+    def invalidate(self):
+        """Fixed Cartesians never go out of date."""
+        pass
+
+    def compute(self):
+        """Returns the coordinates (in whichever units were inputted)"""
+        return self.coordinates
+
+    def set_coordinates(self, x, y, z):
+        """Updates the values of this atom's coordinates."""
+        self.core.geom[self.index] = [x, y, z]
+
+    def type(self):
+        """The type of CoordEntry specialization."""
+        return 'CartesianCoord'
+
+    def print_in_input_format(self):
+        """Prints the updated geometry, in the format provided by the user."""
+        return "  %17.12f  %17.12f  %17.12f\n" % tuple(self.coordinates)
+
+    def clone(self):
+        """Returns new, independent CartesianEntry object"""
+        x, y, z = self.coordinates
+        entry = CartesianEntry(self.PYentry_number, self.PYZ, self.PYcharge, self.PYmass, self.PYsymbol, self.PYlabel,
+                               self.PYA, NumberValue(x), NumberValue(y), NumberValue(z), copy.deepcopy(self.PYbasissets),
+                               copy.deepcopy(self.PYshells))
+        entry.set_ghosted(self.ghosted)
+        return entry
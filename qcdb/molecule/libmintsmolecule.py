@@ -8,7 +8,8 @@ import qcelemental as qcel
 
 from ..exceptions import IncompleteAtomError, ValidationError
 from ..util.vecutil import *
-from .libmintscoordentry import CartesianEntry, NumberValue, VariableValue, ZMatrixEntry
+from .libmintscoordentry import (CartesianArrays, CartesianEntry, NumberValue, VariableValue, ZMatrixEntry,
+                                 zmat_to_cartesian)
 from .libmintspointgrp import PointGroup, SymmetryOperation, SymmOps, similar
 
 LINEAR_A_TOL = 1.0E-2  # When sin(a) is below this, we consider the angle to be linear
@@ -83,6 +84,8 @@ class LibmintsMolecule():
         self.atoms = []
         # Atom info vector (includes dummy atoms)
         self.full_atoms = []
+        # Array storage behind full_atoms when all are fixed Cartesians, else None
+        self.core = None
         # A list of all variables known, whether they have been set or not.
         self.all_variables = []
         # A listing of the variables used to define the geometries
@@ -113,11 +116,15 @@ class LibmintsMolecule():
         # Nilpotence boolean (flagged upon first determination of symmetry frame,
         #    reset each time a substantiative change is made)
         self.lock_frame = False
+        # Skip reorientation and point group analysis, reporting C1 (for bulk construction)
+        self.PYskip_symmetry = False
 
         # <<< Symmetry >>>
 
         # Point group to use with this molecule
         self.pg = None
+        # Whether point group analysis of the current geometry is owed (deferred from update_geometry)
+        self.symmetry_pending = False
         # Full point group
         self.full_pg = 'C1'
         # n of the highest rotational axis Cn
@@ -768,6 +775,7 @@ class LibmintsMolecule():
         """
         text = ""
         if self.natom():
+            self._symmetry_analysis()
             if self.pg:
                 text += """    Molecular point group: %s\n""" % (self.pg.symbol())
             if self.full_pg:
@@ -807,6 +815,7 @@ class LibmintsMolecule():
         """
         text = ""
         if self.natom():
+            self._symmetry_analysis()
             if self.pg:
                 text += """    Molecular point group: %s\n""" % (self.pg.symbol())
             if self.full_pg:
@@ -834,6 +843,7 @@ class LibmintsMolecule():
         """
         text = ""
         if self.natom():
+            self._symmetry_analysis()
             if self.pg:
                 text += """    Molecular point group: %s\n""" % (self.pg.symbol())
             if self.full_pg:
@@ -860,6 +870,7 @@ class LibmintsMolecule():
         """
         text = ""
         if self.natom():
+            self._symmetry_analysis()
             if self.pg:
                 text += """    Molecular point group: %s\n""" % (self.pg.symbol())
             if self.full_pg:
@@ -1009,6 +1020,7 @@ class LibmintsMolecule():
         """
         self.lock_frame = False
         self.set_has_cartesian(True)
+        self.expand_core()
 
         if label == '':
             label = symbol
@@ -1023,9 +1035,46 @@ class LibmintsMolecule():
         else:
             raise ValidationError("Molecule::add_atom: Adding atom on top of an existing atom.")
 
+    def add_atoms(self, Z, geom, symbol, mass, charge, label, A):
+        """Add many Cartesian atoms at once, as for add_atom() but with each
+        argument an array over atoms and *geom* N X 3. Atoms added to an empty
+        molecule are stored in contiguous arrays (see CartesianArrays).
+
+        """
+        if self.nallatom():
+            for at in range(len(symbol)):
+                self.add_atom(Z[at], *geom[at], symbol[at], mass[at], charge[at], label[at], A[at])
+            return
+
+        self.lock_frame = False
+        self.set_has_cartesian(True)
+
+        label = [lbl if lbl != '' else sym for sym, lbl in zip(symbol, label)]
+        self.core = CartesianArrays(geom, Z, charge, mass, symbol, label, A)
+        self.full_atoms = self.core.entries()
+        # Dummies go to full_atoms, ghosts need to go to both.
+        self.atoms = [entry for entry in self.full_atoms if entry.label() != 'X']
+
+    def expand_core(self):
+        """Replace array storage of atoms, if any, by one CartesianEntry per atom,
+        as is needed before atoms of any other kind join the molecule.
+
+        """
+        if self.core is None:
+            return
+        expanded = [entry.clone() for entry in self.full_atoms]
+        self.atoms = [expanded[entry.index] for entry in self.atoms]
+        self.full_atoms = expanded
+        self.core = None
+
+    def _core_atoms(self):
+        """Index into self.core arrays of each atom of self.atoms."""
+        return np.fromiter((entry.index for entry in self.atoms), dtype=int, count=len(self.atoms))
+
     # For use with atoms defined with ZMAT or variable values, i.e., not Cartesian and NumberValue
     def add_unsettled_atom(self, Z, anchor, symbol, mass=0.0, charge=0.0, label='', A=-1):
         self.lock_frame = False
+        self.expand_core()
         numEntries = len(anchor)
         currentAtom = len(self.full_atoms)
 
@@ -1119,6 +1168,53 @@ class LibmintsMolecule():
         """Returns the CoordEntry for an atom."""
         return self.atoms[atom]
 
+    def _symmetry_locator(self, tol):
+        """Returns an _AtomLocator over the geometry atom_at_position() searches, plus
+        integer labels that are equal for atoms is_equivalent_to one another. Kept for
+        as long as self.wholegeom, that is, through one update_geometry().
+
+        """
+        if self.wholegeom is not None:
+            cached = getattr(self, '_sym_locator', None)
+            if cached is not None and cached[0] is self.wholegeom and cached[1] == tol:
+                return cached[2], cached[3]
+            current_geom = self.wholegeom
+        else:
+            current_geom = self.geometry(np_out=True)
+
+        # bucket by cheap hashable properties, then is_equivalent_to within buckets
+        labels = np.zeros(self.natom(), dtype=int)
+        reps = []
+        buckets = collections.defaultdict(list)
+        for at in range(self.natom()):
+            atom = self.atoms[at]
+            bucket = buckets[(atom.PYZ, atom.PYmass, atom.ghosted)]
+            for label in bucket:
+                if self.atoms[reps[label]].is_equivalent_to(atom):
+                    break
+            else:
+                label = len(reps)
+                reps.append(at)
+                bucket.append(label)
+            labels[at] = label
+
+        locator = _AtomLocator(current_geom, tol)
+        if self.wholegeom is not None:
+            self._sym_locator = (self.wholegeom, tol, locator, labels)
+        return locator, labels
+
+    def is_symmetry_operation(self, R, origin=None, tol=DEFAULT_SYM_TOL):
+        """Whether (3, 3) operation *R* about *origin* carries every atom onto an
+        equivalent atom. Atoms are matched in one batched search rather than one
+        atom_at_position() apiece.
+
+        """
+        locator, labels = self._symmetry_locator(tol)
+        origin = np.zeros(3) if origin is None else np.asarray(origin, dtype=float)
+        images = (locator.geom - origin) @ np.asarray(R, dtype=float).T + origin
+        match = locator.find(images, tol)
+        return bool(np.all(match >= 0) and np.all(labels[match] == labels))
+
     def atom_at_position(self, b, tol=0.05):
         """Tests to see if an atom is at the passed position *b* in Bohr with a tolerance *tol*.
 
@@ -1185,6 +1281,57 @@ class LibmintsMolecule():
 
         self.geometry_variables[vstr.upper()] = val
 
+    def scan_geometries(self, variables, values):
+        """Returns the geometries in Bohr as an M X N X 3 array with the
+        geometry variables *variables* set in turn to each row of the
+        M X len(*variables*) array *values*, other variables at their
+        current values. Geometries are in the Z-matrix frame, neither moved
+        to the center of mass nor reoriented, and the molecule is untouched.
+        See zmat_to_cartesian().
+
+        >>> H2O = qcdb.Molecule("O\\nH 1 R\\nH 1 R 2 104.5\\nR=1.0")
+        >>> print(H2O.scan_geometries(['R'], [[0.9], [1.0], [1.1]]).shape)
+        (3, 3, 3)
+
+        """
+        variables = [vb.upper() for vb in variables]
+        for vb in variables:
+            if vb not in self.all_variables:
+                raise ValidationError('Molecule::scan_geometries: Geometry variable %s not in use.\n' % (vb))
+        values = np.asarray(values, dtype=float).reshape(-1, len(variables))
+        columns = dict(zip(variables, values.T))
+
+        def evaluate(coord):
+            if coord.type() == 'VariableType' and coord.name().upper() in columns:
+                return columns[coord.name().upper()] * (-1.0 if coord.negated() else 1.0)
+            return coord.compute()
+
+        anchors = np.full((self.nallatom(), 3), -1, dtype=int)
+        cartesian = np.zeros(self.nallatom(), dtype=bool)
+        zvalues = np.zeros((values.shape[0], self.nallatom(), 3))
+        for at, entry in enumerate(self.full_atoms):
+            if entry.type() == 'ZMatrixCoord':
+                for idx, (to, val) in enumerate([(entry.rto, entry.rval), (entry.ato, entry.aval),
+                                                 (entry.dto, entry.dval)]):
+                    if to is not None:
+                        anchors[at, idx] = to.entry_number()
+                        zvalues[:, at, idx] = evaluate(val)
+            elif isinstance(entry, CartesianEntry):
+                cartesian[at] = True
+                for idx, val in enumerate([entry.x, entry.y, entry.z]):
+                    zvalues[:, at, idx] = evaluate(val)
+            else:
+                cartesian[at] = True
+                zvalues[:, at] = entry.compute()
+
+        geoms = zmat_to_cartesian(anchors, zvalues, cartesian)
+
+        # Dummies and Absent fragments dropped, as for self.atoms
+        real = [at for fr in range(self.nfragments()) if self.fragment_types[fr] != 'Absent'
+                for at in range(self.fragments[fr][0], self.fragments[fr][1] + 1) if self.full_atoms[at].symbol() != 'X']
+
+        return geoms[:, real] * self.input_units_to_au()
+
     def get_anchor_atom(self, vstr, line):
         """Attempts to interpret a string *vstr* as an atom specifier in
         a zmatrix. Takes the current *line* for error message printing.
@@ -1210,8 +1357,11 @@ class LibmintsMolecule():
         [[-2.930978460188563, -0.21641143673806384, 0.0], [-3.655219780069251, 1.4409218455037016, 0.0], [-1.1332252981904638, 0.0769345303220403, 0.0], [2.5523113582286716, 0.21064588230662976, 0.0], [3.175492014248769, -0.7062681346308132, -1.4334725450878665], [3.175492014248769, -0.7062681346308132, 1.4334725450878665]]
 
         """
-        geom = np.asarray([self.atoms[at].compute() for at in range(self.natom())])
-        geom *= self.input_units_to_au()
+        if self.core is not None:
+            geom = self.core.geom[self._core_atoms()] * self.input_units_to_au()
+        else:
+            geom = np.asarray([self.atoms[at].compute() for at in range(self.natom())])
+            geom *= self.input_units_to_au()
         if np_out:
             return geom
         else:
@@ -1224,8 +1374,11 @@ class LibmintsMolecule():
         [[-2.930978460188563, -0.21641143673806384, 0.0], [-3.655219780069251, 1.4409218455037016, 0.0], [-1.1332252981904638, 0.0769345303220403, 0.0], [0.0, 0.0, 0.0], [2.5523113582286716, 0.21064588230662976, 0.0], [3.175492014248769, -0.7062681346308132, -1.4334725450878665], [3.175492014248769, -0.7062681346308132, 1.4334725450878665]]
 
         """
-        geom = np.asarray([self.full_atoms[at].compute() for at in range(self.nallatom())])
-        geom *= self.input_units_to_au()
+        if self.core is not None:
+            geom = self.core.geom * self.input_units_to_au()
+        else:
+            geom = np.asarray([self.full_atoms[at].compute() for at in range(self.nallatom())])
+            geom *= self.input_units_to_au()
         if np_out:
             return geom
         else:
@@ -1238,6 +1391,10 @@ class LibmintsMolecule():
 
         """
         self.lock_frame = False
+        self.symmetry_pending = True
+        if self.core is not None:
+            self.core.geom[self._core_atoms()] = np.asarray(geom, dtype=float)[:self.natom()] / self.input_units_to_au()
+            return
         for at in range(self.natom()):
             self.atoms[at].set_coordinates(geom[at][0] / self.input_units_to_au(),
                                            geom[at][1] / self.input_units_to_au(),
@@ -1250,6 +1407,10 @@ class LibmintsMolecule():
 
         """
         self.lock_frame = False
+        self.symmetry_pending = True
+        if self.core is not None:
+            self.core.geom[:] = np.asarray(geom, dtype=float)[:self.nallatom()] / self.input_units_to_au()
+            return
         for at in range(self.nallatom()):
             self.full_atoms[at].set_coordinates(geom[at][0] / self.input_units_to_au(),
                                                 geom[at][1] / self.input_units_to_au(),
@@ -1464,6 +1625,9 @@ class LibmintsMolecule():
         high_spin_multiplicity = 1
 
         for fr in range(self.nfragments()):
+            if self.core is not None:
+                self.core.fragment[self.fragments[fr][0]:self.fragments[fr][1] + 1] = fr
+
             if self.fragment_types[fr] == 'Absent':
                 continue
 
@@ -1525,7 +1689,7 @@ class LibmintsMolecule():
         self.wholegeom = self.geometry(np_out=True)
 
         # If the no_reorient command was given, don't reorient
-        if not self.PYfix_orientation:
+        if not self.PYfix_orientation and not self.PYskip_symmetry:
             # Now we need to rotate the geometry to its symmetry frame
             # to align the axes correctly for the point group
             # symmetry_frame looks for the highest point group so that we can align
@@ -1537,10 +1701,9 @@ class LibmintsMolecule():
             #self.print_full()
             self.wholegeom = self.geometry(np_out=True)
 
-        # Recompute point group of the molecule, so the symmetry info is updated to the new frame
-        self.set_point_group(self.find_point_group())
-        self.set_full_point_group()
-        self.wholegeom = self.geometry(np_out=True)
+        # Recompute point group of the molecule, so the symmetry info is updated to the new frame.
+        #   Deferred until first asked for, see _symmetry_analysis()
+        self.symmetry_pending = True
 
         # Disabling symmetrize for now if orientation is fixed, as it is not
         #   correct.  We may want to fix this in the future, but in some cases of
@@ -1561,6 +1724,7 @@ class LibmintsMolecule():
         self.lock_frame = False
         self.atoms = []
         self.full_atoms = []
+        self.core = None
 
     def nuclear_repulsion_energy(self):
         """Computes nuclear repulsion energy.
@@ -1750,6 +1914,9 @@ class LibmintsMolecule():
         >>> H2OH2O.translate([1.0, 1.0, 0.0])
 
         """
+        if self.core is not None:
+            self.core.geom += np.asarray(r, dtype=float) / self.input_units_to_au()
+            return
         for at in range(self.nallatom()):
             temp = scale(self.full_atoms[at].compute(), self.input_units_to_au())
             temp = add(temp, r)
@@ -1958,6 +2125,24 @@ class LibmintsMolecule():
         """
         return self.PYfix_orientation
 
+    def symmetry_skipped(self):
+        """Get whether or not reorientation and point group analysis are skipped.
+
+        >>> H2OH2O.symmetry_skipped()
+        False
+
+        """
+        return self.PYskip_symmetry
+
+    def skip_symmetry(self, _skip=True):
+        """Whether to skip reorientation and point group analysis (True) in
+        update_geometry(), leaving the molecule in its input frame and in C1.
+        For building many molecules whose symmetry won't be read.
+
+        """
+        self.lock_frame = False
+        self.PYskip_symmetry = _skip
+
     def fix_orientation(self, _fix=True):
         """Fix the orientation at its current frame
         (method name in libmints is set_orientation_fixed)
@@ -2052,28 +2237,49 @@ class LibmintsMolecule():
 
     def point_group(self):
         """Returns the point group (object) if set"""
+        self._symmetry_analysis()
         if self.pg is None:
             raise ValidationError("Molecule::point_group: Molecular point group has not been set.")
         return self.pg
 
     def set_point_group(self, pg):
         """Set the point group to object *pg* """
+        # settle any owed analysis first so it can't later overwrite *pg*
+        self._symmetry_analysis()
         self.pg = pg
         # Call this here, the programmer will forget to call it, as I have many times.
         self.form_symmetry_information()
 
+    def _symmetry_analysis(self):
+        """Determine the point group and full point group of the current
+        geometry if update_geometry() or set_geometry() left them owed.
+        Molecules set to skip_symmetry() are given C1 without analysis.
+
+        """
+        if not self.symmetry_pending:
+            return
+        self.symmetry_pending = False
+
+        if self.PYskip_symmetry:
+            self.set_point_group(PointGroup('C1'))
+            self.full_pg = 'C1'
+            self.PYfull_pg_n = 1
+            return
+
+        self.wholegeom = self.geometry(np_out=True)
+        try:
+            self.set_point_group(self.find_point_group())
+            self.set_full_point_group()
+        finally:
+            self.wholegeom = None
+
     def set_full_point_group(self, tol=FULL_PG_TOL, verbose=1):
         """Determine and set FULL point group. self.PYfull_pg_n is highest
         order n in Cn. 0 for atoms or infinity.
 
         """
         # Get cartesian geometry and put COM at origin
-        geom = self.geometry()
-        com = self.center_of_mass()
-        for at in range(self.natom()):
-            geom[at][0] += -com[0]
-            geom[at][1] += -com[1]
-            geom[at][2] += -com[2]
+        geom = self.geometry(np_out=True) - np.asarray(self.center_of_mass())
 
         # Get rotor type
         rotor = self.rotor_type(tol)
@@ -2110,7 +2316,7 @@ class LibmintsMolecule():
                 self.PYfull_pg_n = 3
             else:  # Oh or Ih ?
                 # Oh has a S4 and should be oriented properly already.
-                test_mat = matrix_3d_rotation(geom, z_axis, math.pi / 2.0, True)
+                test_mat = geom @ _rotation_matrix(z_axis, math.pi / 2.0, True).T
                 op_symm = equal_but_for_row_order(geom, test_mat, tol)
                 if verbose > 2:
                     print("""  S4z                              : %s""" % ('yes' if op_symm else 'no'))
@@ -2190,10 +2396,9 @@ class LibmintsMolecule():
             # Rotate geometry to put unique axis on the z-axis, if it isn't already.
             if abs(phi) > 1.0e-14:
                 rot_axis = cross(z_axis, old_axis)  # right order?
-                test_mat = matrix_3d_rotation(geom, rot_axis, phi, False)
+                geom = geom @ _rotation_matrix(rot_axis, phi).T
                 if verbose > 2:
                     print("""  Rotating by %lf to get principal axis on z-axis ...""" % (phi))
-                geom = [row[:] for row in test_mat]
 
             if verbose > 2:
                 print("""  Geometry to analyze - principal axis on z-axis:""")
@@ -2211,16 +2416,7 @@ class LibmintsMolecule():
                 print("""  Rotation axis (Sn_z)             : %d""" % (Sn_z))
 
             # Check for sigma_h (xy plane).
-            op_sigma_h = False
-            for at in range(self.natom()):
-                if abs(geom[at][2]) < tol:
-                    continue  # atom is in xy plane
-                else:
-                    test_atom = [geom[at][0], geom[at][1], -1 * geom[at][2]]
-                    if not atom_present_in_geom(geom, test_atom, tol):
-                        break
-            else:
-                op_sigma_h = True
+            op_sigma_h = geom_present_in_geom(geom, geom * [1, 1, -1], np.abs(geom[:, 2]) < tol, tol)
             if verbose > 2:
                 print("""  sigma_h                          : %s""" % ('yes' if op_sigma_h else 'no'))
 
@@ -2248,22 +2444,12 @@ class LibmintsMolecule():
 
             is_D = False
             if abs(phi) > 1.0e-14:
-                test_mat = matrix_3d_rotation(geom, z_axis, phi, False)
+                geom = geom @ _rotation_matrix(z_axis, phi).T
                 if verbose > 2:
                     print("""  Rotating by %8.3e to get atom %d in yz-plane ...""" % (phi, pivot_atom_i + 1))
-                geom = [row[:] for row in test_mat]
 
             # Check for sigma_v (yz plane).
-            op_sigma_v = False
-            for at in range(self.natom()):
-                if abs(geom[at][0]) < tol:
-                    continue  # atom is in yz plane
-                else:
-                    test_atom = [-1 * geom[at][0], geom[at][1], geom[at][2]]
-                    if not atom_present_in_geom(geom, test_atom, tol):
-                        break
-            else:
-                op_sigma_v = True
+            op_sigma_v = geom_present_in_geom(geom, geom * [-1, 1, 1], np.abs(geom[:, 0]) < tol, tol)
             if verbose > 2:
                 print("""  sigma_v                          : %s""" % ('yes' if op_sigma_v else 'no'))
 
@@ -2274,30 +2460,26 @@ class LibmintsMolecule():
 
             # Check for perpendicular C2's.
             # Loop through pairs of atoms to find c2 axis candidates.
+            Z = np.array([self.Z(at) for at in range(self.natom())])
+            r2 = np.einsum('ij,ij->i', geom, geom)
             for i in range(self.natom()):
-                A = [geom[i][0], geom[i][1], geom[i][2]]
-                AdotA = dot(A, A)
-                for j in range(i):
-                    if self.Z(i) != self.Z(j):
-                        continue  # ensure same atomic number
-
-                    B = [geom[j][0], geom[j][1], geom[j][2]]  # ensure same distance from com
-                    if abs(AdotA - dot(B, B)) > 1.0e-6:
-                        continue  # loose check
-
-                    # Use sum of atom vectors as axis if not 0.
-                    axis = add(A, B)
-                    if norm(axis) < 1.0e-12:
-                        continue
-                    axis = normalize(axis)
+                # ensure same atomic number and same distance from com (loose check)
+                js = np.nonzero((Z[:i] == Z[i]) & (np.abs(r2[i] - r2[:i]) <= 1.0e-6))[0]
 
-                    # Check if axis is perpendicular to z-axis.
-                    if abs(dot(axis, z_axis)) > 1.0e-6:
-                        continue
+                # Use sum of atom vectors as axis if not 0.
+                axes = geom[i] + geom[js]
+                norms = np.linalg.norm(axes, axis=1)
+                keep = norms >= 1.0e-12
+                axes = axes[keep] / norms[keep, None]
 
+                # Check if axis is perpendicular to z-axis.
+                for axis in axes[np.abs(axes[:, 2]) <= 1.0e-6]:
                     # Do the thorough check for C2.
                     if matrix_3d_rotation_Cn(geom, axis, False, tol, 2) == 2:
                         is_D = True
+                        break
+                if is_D:
+                    break
             if verbose > 2:
                 print("""  perp. C2's                       : %s""" % ('yes' if is_D else 'no'))
 
@@ -2338,41 +2520,22 @@ class LibmintsMolecule():
         """Does the molecule have an inversion center at origin
 
         """
-        geom = self.geometry(np_out=True)
-        inverted = 2. * np.asarray(origin) - geom
-        for at in range(self.natom()):
-            atom = self.atom_at_position(inverted[at], tol)
-            if atom < 0 or not self.atoms[atom].is_equivalent_to(self.atoms[at]):
-                return False
-        return True
+        return self.is_symmetry_operation(-np.identity(3), origin, tol)
 
     def is_plane(self, origin, uperp, tol=DEFAULT_SYM_TOL):
         """Is a plane?
 
         """
-        for i in range(self.natom()):
-            A = sub(self.xyz(i), origin)
-            Apar = scale(uperp, dot(uperp, A))
-            Aperp = sub(A, Apar)
-            A = add(sub(Aperp, Apar), origin)
-            atom = self.atom_at_position(A, tol)
-            if atom < 0 or not self.atoms[atom].is_equivalent_to(self.atoms[i]):
-                return False
-        return True
+        uperp = np.asarray(uperp, dtype=float)
+        return self.is_symmetry_operation(np.identity(3) - 2.0 * np.outer(uperp, uperp), origin, tol)
 
     def is_axis(self, origin, axis, order, tol=DEFAULT_SYM_TOL):
         """Is *axis* an axis of order *order* with respect to *origin*?
 
         """
-        for i in range(self.natom()):
-            A = sub(self.xyz(i), origin)
-            for j in range(1, order):
-                R = A
-                R = rotate(R, j * 2.0 * math.pi / order, axis)
-                R = add(R, origin)
-                atom = self.atom_at_position(R, tol)
-                if atom < 0 or not self.atoms[atom].is_equivalent_to(self.atoms[i]):
-                    return False
+        for j in range(1, order):
+            if not self.is_symmetry_operation(_rotation_matrix(axis, j * 2.0 * math.pi / order), origin, tol):
+                return False
         return True
 
     def is_linear_planar(self, tol=DEFAULT_SYM_TOL):
@@ -2532,26 +2695,32 @@ class LibmintsMolecule():
 
             # Call the function pointer
             symm_func[g](symop)
-            found = True
+            op = np.diag([symop[0][0], symop[1][1], symop[2][2]])
 
-            for at in range(self.natom()):
-                op = [symop[0][0], symop[1][1], symop[2][2]]
-                pos = naivemult(self.xyz(at), op)
-
-                matching_atom = self.atom_at_position(pos, tol)
-                if matching_atom >= 0:
-                    if not self.atoms[at].is_equivalent_to(self.atoms[matching_atom]):
-                        found = False
-                        break
-                else:
-                    found = False
-                    break
-
-            if found:
+            if self.is_symmetry_operation(op, None, tol):
                 pg_bits |= symm_bit[g]
 
         return PointGroup(pg_bits)
 
+    def _symmetry_pairs(self, shifted_geom, tol, diagonal):
+        """Generates the (i, j, A, B) atom pairs, j < i (or j <= i if *diagonal*), that
+        symmetry_frame() tries as symmetry element candidates: equivalent atoms at the
+        same distance from the com, whose com-shifted positions A, B are in *shifted_geom*.
+        Pairs are screened per atom i against all j at once, in the order looped formerly.
+
+        """
+        labels = self._symmetry_locator(tol)[1]
+        shifted_geom = np.asarray(shifted_geom)
+        r2 = np.einsum('ij,ij->i', shifted_geom, shifted_geom)
+        for i in range(len(shifted_geom)):
+            upto = i + 1 if diagonal else i
+            # the atoms must be identical and the same distance from the com
+            js = np.nonzero((labels[:upto] == labels[i]) & (np.abs(r2[i] - r2[:upto]) <= tol))[0]
+            if len(js):
+                A = shifted_geom[i].tolist()
+                for j in js:
+                    yield i, int(j), A, shifted_geom[j].tolist()
+
     def symmetry_frame(self, tol=DEFAULT_SYM_TOL):
         """Determine symmetry reference frame. If noreorient is not set,
         this is the rotation matrix applied to the geometry in update_geometry.
@@ -2566,7 +2735,6 @@ class LibmintsMolecule():
         else:
             current_geom = self.geometry(np_out=True)
         shifted_geom = current_geom - np.asarray(com)
-        shifted_geom = shifted_geom.tolist()
 
         worldxaxis = [1.0, 0.0, 0.0]
         worldyaxis = [0.0, 1.0, 0.0]
@@ -2609,29 +2777,16 @@ class LibmintsMolecule():
 
         else:
             # loop through pairs of atoms to find c2 axis candidates
-            for i in range(self.natom()):
-                A = shifted_geom[i]
-                AdotA = dot(A, A)
-                for j in range(i + 1):
-                    # the atoms must be identical
-                    if not self.atoms[i].is_equivalent_to(self.atoms[j]):
-                        continue
-                    B = shifted_geom[j]
-                    # the atoms must be the same distance from the com
-                    if math.fabs(AdotA - dot(B, B)) > tol:
-                        continue
-                    axis = add(A, B)
-                    # atoms colinear with the com don't work
-                    if norm(axis) < tol:
-                        continue
-                    axis = normalize(axis)
-                    if self.is_axis(com, axis, 2, tol):
-                        have_c2axis = True
-                        c2axis = copy.deepcopy(axis)
-                        break
-                else:
+            for i, j, A, B in self._symmetry_pairs(shifted_geom, tol, True):
+                axis = add(A, B)
+                # atoms colinear with the com don't work
+                if norm(axis) < tol:
                     continue
-                break
+                axis = normalize(axis)
+                if self.is_axis(com, axis, 2, tol):
+                    have_c2axis = True
+                    c2axis = copy.deepcopy(axis)
+                    break
 
         # symmframe found c2axis
         c2like = 'ZAxis'
@@ -2653,31 +2808,18 @@ class LibmintsMolecule():
 
             else:
                 # loop through paris of atoms to find c2 axis candidates
-                for i in range(self.natom()):
-                    A = sub(self.xyz(i), com)
-                    AdotA = dot(A, A)
-                    for j in range(i):
-                        # the atoms must be identical
-                        if not self.atoms[i].is_equivalent_to(self.atoms[j]):
-                            continue
-                        B = sub(self.xyz(j), com)
-                        # the atoms must be the same distance from the com
-                        if math.fabs(AdotA - dot(B, B)) > tol:
-                            continue
-                        axis = add(A, B)
-                        # atoms colinear with the com don't work
-                        if norm(axis) < tol:
-                            continue
-                        axis = normalize(axis)
-                        # if axis is not perp continue
-                        if math.fabs(dot(axis, c2axis)) > tol:
-                            continue
-                        if self.is_axis(com, axis, 2, tol):
-                            have_c2axisperp = True
-                            c2axisperp = copy.deepcopy(axis)
-                        break
-                    else:
+                for i, j, A, B in self._symmetry_pairs(shifted_geom, tol, False):
+                    axis = add(A, B)
+                    # atoms colinear with the com don't work
+                    if norm(axis) < tol:
                         continue
+                    axis = normalize(axis)
+                    # if axis is not perp continue
+                    if math.fabs(dot(axis, c2axis)) > tol:
+                        continue
+                    if self.is_axis(com, axis, 2, tol):
+                        have_c2axisperp = True
+                        c2axisperp = copy.deepcopy(axis)
                     break
 
         # symmframe found c2axisperp
@@ -2721,35 +2863,22 @@ class LibmintsMolecule():
                     sigmav = perp_unit(c2axis, [0.0, 0.0, 1.0])
             else:
                 # loop through pairs of atoms to find sigma v plane candidates
-                for i in range(self.natom()):
-                    A = sub(self.xyz(i), com)
-                    AdotA = dot(A, A)
-                    # the second atom can equal i because i might be in the plane
-                    for j in range(i + 1):
-                        # the atoms must be identical
-                        if not self.atoms[i].is_equivalent_to(self.atoms[j]):
-                            continue
-                        B = sub(self.xyz(j), com)
-                        # the atoms must be the same distance from the com
-                        if math.fabs(AdotA - dot(B, B)) > tol:
-                            continue
-                        inplane = add(B, A)
-                        norm_inplane = norm(inplane)
-                        if norm_inplane < tol:
-                            continue
-                        inplane = scale(inplane, 1.0 / norm_inplane)
-                        perp = cross(c2axis, inplane)
-                        norm_perp = norm(perp)
-                        if norm_perp < tol:
-                            continue
-                        perp = scale(perp, 1.0 / norm_perp)
-                        if self.is_plane(com, perp, tol):
-                            have_sigmav = True
-                            sigmav = copy.deepcopy(perp)
-                            break
-                    else:
+                # the second atom can equal i because i might be in the plane
+                for i, j, A, B in self._symmetry_pairs(shifted_geom, tol, True):
+                    inplane = add(B, A)
+                    norm_inplane = norm(inplane)
+                    if norm_inplane < tol:
                         continue
-                    break
+                    inplane = scale(inplane, 1.0 / norm_inplane)
+                    perp = cross(c2axis, inplane)
+                    norm_perp = norm(perp)
+                    if norm_perp < tol:
+                        continue
+                    perp = scale(perp, 1.0 / norm_perp)
+                    if self.is_plane(com, perp, tol):
+                        have_sigmav = True
+                        sigmav = copy.deepcopy(perp)
+                        break
 
         # symmframe found sigmav
         if have_sigmav:
@@ -2781,30 +2910,16 @@ class LibmintsMolecule():
                         break
             else:
                 # loop through pairs of atoms to contruct trial planes
-                for i in range(self.natom()):
-                    A = sub(self.xyz(i), com)
-                    AdotA = dot(A, A)
-                    for j in range(i):
-                        # the atoms must be identical
-                        if not self.atoms[i].is_equivalent_to(self.atoms[j]):
-                            continue
-                        B = sub(self.xyz(j), com)
-                        BdotB = dot(B, B)
-                        # the atoms must be the same distance from the com
-                        if math.fabs(AdotA - BdotB) > tol:
-                            continue
-                        perp = sub(B, A)
-                        norm_perp = norm(perp)
-                        if norm_perp < tol:
-                            continue
-                        perp = scale(perp, 1.0 / norm_perp)
-                        if self.is_plane(com, perp, tol):
-                            have_sigma = True
-                            sigma = copy.deepcopy(perp)
-                            break
-                    else:
+                for i, j, A, B in self._symmetry_pairs(shifted_geom, tol, False):
+                    perp = sub(B, A)
+                    norm_perp = norm(perp)
+                    if norm_perp < tol:
                         continue
-                    break
+                    perp = scale(perp, 1.0 / norm_perp)
+                    if self.is_plane(com, perp, tol):
+                        have_sigma = True
+                        sigma = copy.deepcopy(perp)
+                        break
 
         # foundsigma
         if have_sigma:
@@ -2978,12 +3093,14 @@ class LibmintsMolecule():
 
     def sym_label(self):
         """Returns the symmetry label"""
+        self._symmetry_analysis()
         if self.pg is None:
             self.set_point_group(self.find_point_group())
         return self.pg.symbol()
 
     def irrep_labels(self):
         """Returns the irrep labels"""
+        self._symmetry_analysis()
         if self.pg is None:
             self.set_point_group(self.find_point_group())
         return [self.pg.char_table().gamma(i).symbol_ns() for i in range(self.pg.char_table().nirrep())]
@@ -3095,6 +3212,7 @@ class LibmintsMolecule():
 
     def full_point_group_with_n(self) -> str:
         """Return point group name such as Cnv or Sn."""
+        self._symmetry_analysis()
         return self.full_pg
 
     def full_pg_n(self) -> int:
@@ -3102,6 +3220,7 @@ class LibmintsMolecule():
         it's the highest-order rotation axis.
 
         """
+        self._symmetry_analysis()
         return self.PYfull_pg_n
 
     def get_full_point_group(self) -> str:
@@ -3109,6 +3228,7 @@ class LibmintsMolecule():
         (method name in libmints is full_point_group)
 
         """
+        self._symmetry_analysis()
         pg_with_n = self.full_pg
         if pg_with_n in ['D_inf_h', 'C_inf_v', 'C1', 'Cs', 'Ci', 'Td', 'Oh', 'Ih']:
             return pg_with_n  # These don't need changes - have no 'n'.
@@ -3119,18 +3239,22 @@ class LibmintsMolecule():
 
     def nunique(self):
         """Return the number of unique atoms."""
+        self._symmetry_analysis()
         return self.PYnunique
 
     def unique(self, iuniq):
         """Returns the overall number of the iuniq'th unique atom."""
+        self._symmetry_analysis()
         return self.equiv[iuniq][0]
 
     def nequivalent(self, iuniq):
         """Returns the number of atoms equivalent to iuniq."""
+        self._symmetry_analysis()
         return self.nequiv[iuniq]
 
     def equivalent(self, iuniq, j):
         """Returns the j'th atom equivalent to iuniq."""
+        self._symmetry_analysis()
         return self.equiv[iuniq][j]
 
     def atom_to_unique(self, iatom):
@@ -3138,6 +3262,7 @@ class LibmintsMolecule():
         The return value is in [0, nunique).
 
         """
+        self._symmetry_analysis()
         return self.PYatom_to_unique[iatom]
 
     def atom_to_unique_offset(self, iatom):
@@ -3145,6 +3270,7 @@ class LibmintsMolecule():
         in the list of generated atoms. The unique atom itself is allowed offset 0.
 
         """
+        self._symmetry_analysis()
         iuniq = self.PYatom_to_unique[iatom]
         nequiv = self.nequiv[iuniq]
         for i in range(nequiv):
@@ -3161,6 +3287,84 @@ class LibmintsMolecule():
         return mmax
 
 
+class _AtomLocator():
+    """Hashed grid over the rows of *geom* for finding atoms near many points at once,
+    the batched counterpart of LibmintsMolecule.atom_at_position().
+    @param geom  ndarray   : (nat, 3) atom positions
+    @param tol   double    : largest search radius to be used with find()
+
+    """
+
+    def __init__(self, geom, tol):
+        self.geom = np.asarray(geom, dtype=float).reshape(-1, 3)
+        self.tol = tol
+        # cells at least 2 tol wide so any match lies in the 27 cells about a point
+        self.h = max(2.0 * tol, 0.1)
+        cells = np.floor(self.geom / self.h).astype(np.int64)
+        # pad two cells each side so every neighbor of a searchable cell has a distinct key
+        self.lo = cells.min(axis=0) - 2 if len(cells) else np.zeros(3, dtype=np.int64)
+        self.span = (cells.max(axis=0) - self.lo + 3) if len(cells) else np.full(3, 3, dtype=np.int64)
+        keys = self._keys(cells)
+        self.order = np.argsort(keys, kind='stable')
+        self.keys = keys[self.order]
+        self.maxocc = int(np.max(np.unique(self.keys, return_counts=True)[1])) if len(keys) else 0
+
+    def _keys(self, cells):
+        shifted = cells - self.lo
+        return (shifted[:, 0] * self.span[1] + shifted[:, 1]) * self.span[2] + shifted[:, 2]
+
+    def find(self, points, tol=None):
+        """Index of the atom nearest each row of *points* if within *tol*, else -1."""
+        tol = self.tol if tol is None else tol
+        if tol > self.tol:
+            raise ValidationError("_AtomLocator: search radius %g exceeds grid radius %g" % (tol, self.tol))
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        found = np.full(len(points), -1, dtype=int)
+        if not len(self.keys):
+            return found
+        best = np.full(len(points), tol * tol)
+        cells = np.floor(points / self.h).astype(np.int64)
+        # points more than a cell beyond any atom cannot match anything
+        inside = np.all((cells > self.lo) & (cells < self.lo + self.span - 1), axis=1)
+        base = self._keys(cells[inside])
+        pts = points[inside]
+        idx = np.nonzero(inside)[0]
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    key = base + (dx * self.span[1] + dy) * self.span[2] + dz
+                    first = np.searchsorted(self.keys, key, side='left')
+                    for k in range(self.maxocc):
+                        pos = first + k
+                        ok = pos < len(self.keys)
+                        ok[ok] &= self.keys[pos[ok]] == key[ok]
+                        if not ok.any():
+                            break
+                        atom = self.order[pos[ok]]
+                        dist2 = np.sum(np.square(self.geom[atom] - pts[ok]), axis=1)
+                        closer = dist2 < best[idx[ok]]
+                        best[idx[ok][closer]] = dist2[closer]
+                        found[idx[ok][closer]] = atom[closer]
+        return found
+
+
+def _rotation_matrix(axis, phi, reflect=False):
+    """ndarray counterpart of the operation applied by matrix_3d_rotation().
+    @param  axis    Vector3  : axis around which to rotate (need not be normalized)
+    @param  phi     double   : magnitude of rotation in rad
+    @param  reflect bool     : if true, then also reflect in plane perpendicular to axis
+    @returns (3, 3) ndarray R so that rotated rows are coord @ R.T
+
+    """
+    w = np.asarray(axis, dtype=float)
+    w = w / np.linalg.norm(w)
+    K = np.array([[0.0, -w[2], w[1]], [w[2], 0.0, -w[0]], [-w[1], w[0], 0.0]])
+    R = math.cos(phi) * np.identity(3) + math.sin(phi) * K + (1.0 - math.cos(phi)) * np.outer(w, w)
+    if reflect:
+        R = (np.identity(3) - 2.0 * np.outer(w, w)) @ R
+    return R
+
+
 def atom_present_in_geom(geom, b, tol=DEFAULT_SYM_TOL):
     """Function used by set_full_point_group() to scan a given geometry
     and determine if an atom is present at a given location.
@@ -3173,6 +3377,15 @@ def atom_present_in_geom(geom, b, tol=DEFAULT_SYM_TOL):
     return False
 
 
+def geom_present_in_geom(geom, points, skip, tol=DEFAULT_SYM_TOL):
+    """Function used by set_full_point_group() to check at once that an atom of
+    *geom* is present at every row of *points* not flagged in boolean *skip*.
+
+    """
+    found = _AtomLocator(geom, tol).find(points, tol)
+    return bool(np.all(skip | (found >= 0)))
+
+
 def matrix_3d_rotation_Cn(coord, axis, reflect, tol=DEFAULT_SYM_TOL, max_Cn_to_check=-1):
     """Find maximum n in Cn around given axis, i.e., the highest-order rotation axis.
     @param coord Matrix    : points to rotate - column dim is 3
@@ -3184,9 +3397,10 @@ def matrix_3d_rotation_Cn(coord, axis, reflect, tol=DEFAULT_SYM_TOL, max_Cn_to_c
     # Check all atoms. In future, make more intelligent.
     max_possible = len(coord) if max_Cn_to_check == -1 else max_Cn_to_check
 
+    coord = np.asarray(coord, dtype=float)
     Cn = 1  # C1 is there for sure
     for n in range(2, max_possible + 1):
-        rotated_mat = matrix_3d_rotation(coord, axis, 2 * math.pi / n, reflect)
+        rotated_mat = coord @ _rotation_matrix(axis, 2 * math.pi / n, reflect).T
         if equal_but_for_row_order(coord, rotated_mat, tol):
             Cn = n
     return Cn
@@ -3259,20 +3473,20 @@ def equal_but_for_row_order(mat, rhs, tol=DEFAULT_SYM_TOL):
     @returns true if equal, otherwise false.
 
     """
-    for m in range(len(mat)):
-        for m_rhs in range(len(mat)):
-
-            for n in range(len(mat[m])):
-                if abs(mat[m][n] - rhs[m_rhs][n]) > tol:
-                    break  # from n
-            else:
-                # whole row matched, goto next m row
-                break  # from m_rhs
-        else:
-            # no matching row was found
+    mat = np.asarray(mat, dtype=float)
+    rhs = np.asarray(rhs, dtype=float)
+
+    # rows within tol in every element are within tol * sqrt(3) overall
+    radius = tol * math.sqrt(3.0)
+    nearest = _AtomLocator(rhs, radius).find(mat, radius)
+    matched = nearest >= 0
+    matched[matched] = np.all(np.abs(mat[matched] - rhs[nearest[matched]]) <= tol, axis=1)
+
+    # the nearest row may miss the elementwise test where another would pass
+    for m in np.nonzero(~matched)[0]:
+        if not np.any(np.all(np.abs(rhs - mat[m]) <= tol, axis=1)):
             return False
-    else:
-        return True
+    return True
 
 
 def compute_atom_map(mol, tol=0.05):
@@ -3287,34 +3501,24 @@ def compute_atom_map(mol, tol=0.05):
 
     natom = mol.natom()
     ng = ct.order()
-    atom_map = [0] * natom
-    for i in range(natom):
-        atom_map[i] = [0] * ng
-
-    np3 = [0.0, 0.0, 0.0]
-
-    # loop over all centers
-    for i in range(natom):
-        ac = mol.xyz(i)
-
-        # then for each symop in the pointgroup, transform the coordinates of
-        #   center "i" and see which atom it maps into
-        for g in range(ng):
-            so = ct.symm_operation(g)
-
-            for ii in range(3):
-                np3[ii] = 0
-                for jj in range(3):
-                    np3[ii] += so[ii][jj] * ac[jj]
-            atom_map[i][g] = mol.atom_at_position(np3, tol)
-            if atom_map[i][g] < 0:
-                print("""  Molecule:\n""")
-                mol.print_out()
-                print("""  attempted to find atom at\n""")
-                print("""    %lf %lf %lf\n""" % (np3[0], np3[1], np3[2]))
-                raise ValidationError("ERROR: Symmetry operation %d did not map atom %d to another atom:\n" %
-                                      (g, i + 1))
-
+    ops = np.array([ct.symm_operation(g).d for g in range(ng)])
+
+    # transform the coordinates of every center by every symop in the pointgroup
+    #   and see, in one batched search, which atom each image maps into
+    geom = mol.geometry(np_out=True)
+    images = np.einsum('gij,aj->agi', ops, geom)
+    current_geom = mol.wholegeom if mol.wholegeom is not None else geom
+    atom_map = _AtomLocator(current_geom, tol).find(images, tol).reshape(natom, ng)
+
+    for i, g in np.argwhere(atom_map < 0)[:1]:
+        np3 = images[i, g]
+        print("""  Molecule:\n""")
+        mol.print_out()
+        print("""  attempted to find atom at\n""")
+        print("""    %lf %lf %lf\n""" % (np3[0], np3[1], np3[2]))
+        raise ValidationError("ERROR: Symmetry operation %d did not map atom %d to another atom:\n" % (g, i + 1))
+
+    atom_map = atom_map.tolist()
     return atom_map
 
 
@@ -58,7 +58,8 @@ class Molecule(LibmintsMolecule):
                  zero_ghost_fragments=False,
                  nonphysical=False,
                  mtol=1.e-3,
-                 verbose=1):
+                 verbose=1,
+                 skip_symmetry=False):
         """Initialize Molecule object from LibmintsMolecule"""
         super(Molecule, self).__init__()
 
@@ -114,7 +115,7 @@ class Molecule(LibmintsMolecule):
                     verbose=verbose)
 
             # ok, got the molrec dictionary; now build the thing
-            self._internal_from_dict(molrec, verbose=verbose)
+            self._internal_from_dict(molrec, verbose=verbose, skip_symmetry=skip_symmetry)
 
         # The comment line
         self.tagline = ""
@@ -1138,14 +1139,18 @@ class Molecule(LibmintsMolecule):
         return validated_molrec
 
     @classmethod
-    def from_dict(cls, molrec, verbose=1):
+    def from_dict(cls, molrec, verbose=1, skip_symmetry=False):
 
         mol = cls()
-        mol._internal_from_dict(molrec=molrec, verbose=verbose)
+        mol._internal_from_dict(molrec=molrec, verbose=verbose, skip_symmetry=skip_symmetry)
         return mol
 
-    def _internal_from_dict(self, molrec, verbose=1):
-        """Constructs instance from fully validated and defaulted dictionary `molrec`."""
+    def _internal_from_dict(self, molrec, verbose=1, skip_symmetry=False):
+        """Constructs instance from fully validated and defaulted dictionary `molrec`.
+        With `skip_symmetry`, the molecule is neither reoriented nor analyzed for
+        point group, for bulk construction of molecules whose symmetry won't be read.
+
+        """
 
         # Compromises for qcdb.Molecule
         # * molecular_charge is int, not float
@@ -1186,13 +1191,11 @@ class Molecule(LibmintsMolecule):
             nat = geom.shape[0]
             unsettled = False
 
-            for iat in range(nat):
-                x, y, z = geom[iat]
-                label = molrec['elem'][iat] + molrec['elbl'][iat]
-                Z = molrec['elez'][iat] * int(molrec['real'][iat])
-                self.add_atom(Z, x, y, z, molrec['elem'][iat], molrec['mass'][iat], Z, label, molrec['elea'][iat])
-                # TODO charge and 2nd elez site
-                # TODO real back to type Ghost?
+            label = [elem + elbl for elem, elbl in zip(molrec['elem'], molrec['elbl'])]
+            Z = np.array(molrec['elez'], dtype=int) * np.array(molrec['real'], dtype=int)
+            self.add_atoms(Z, geom, molrec['elem'], molrec['mass'], Z, label, molrec['elea'])
+            # TODO charge and 2nd elez site
+            # TODO real back to type Ghost?
 
         # apparently py- and c- sides settled on a diff convention of 2nd of pair in fragments_
         fragment_separators = np.array(molrec['fragment_separators'], dtype=int)
@@ -1208,6 +1211,7 @@ class Molecule(LibmintsMolecule):
 
         self.fix_com(molrec['fix_com'])
         self.fix_orientation(molrec['fix_orientation'])
+        self.skip_symmetry(skip_symmetry)
         if 'fix_symmetry' in molrec:
             # Save the user-specified symmetry, but don't set it as the point group
             # That step occurs in update_geometry, after the atoms are added
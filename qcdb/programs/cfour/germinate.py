@@ -1,7 +1,11 @@
+import bisect
+import collections
+import json
+import mmap
 import os
 import re
 import uuid
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 import qcelemental as qcel
 
@@ -46,6 +50,100 @@ def muster_basisset(molrec: Dict, ropts: "Keywords", native_puream: bool, verbos
     return text
 
 
+class _GenbasIndex:
+    """Byte spans of the basis blocks of a GENBAS file, served from an mmap of the file.
+
+    Blocks are keyed by their header line, like "CO:qz2p", in file order. A repeated header keeps its first
+    position and its last block. The spans are persisted beside the file in ``GENBAS.idx`` (where writable),
+    stamped with the file's size and modification time, so the file is parsed once rather than once per job.
+
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        stat = os.stat(path)
+        self.stamp = [stat.st_size, stat.st_mtime_ns]
+
+        self.mm = b""
+        if stat.st_size:
+            with open(path, "rb") as handle:
+                self.mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        blocks = self._load()
+        if blocks is None:
+            blocks = self._scan()
+            self._save(blocks)
+
+        # header, span of block following header line, by basis in file order
+        self.blocks = collections.defaultdict(list)
+        for order, (header, start, end) in enumerate(blocks):
+            baskey = header.split()[0].split(":")  # ['CO', 'qz2p']
+            self.blocks[baskey[1]].append((order, baskey[0], header, start, end))
+        self.basis_names = sorted(self.blocks)
+
+    def _scan(self) -> List[Tuple[str, int, int]]:
+        blocks = {}
+        headers = list(re.finditer(rb"^[A-Z]{1,2}:.*$", self.mm, flags=re.MULTILINE))
+        for ihdr, mobj in enumerate(headers):
+            end = headers[ihdr + 1].start() if ihdr + 1 < len(headers) else len(self.mm)
+            blocks[mobj.group(0).decode()] = (mobj.end(), end)
+
+        return [(header, start, end) for header, (start, end) in blocks.items()]
+
+    def _load(self) -> Union[List[Tuple[str, int, int]], None]:
+        try:
+            with open(self.path + ".idx", "r") as handle:
+                index = json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+        if index.get("stamp") != self.stamp:
+            return None
+        return [tuple(block) for block in index["blocks"]]
+
+    def _save(self, blocks: List[Tuple[str, int, int]]) -> None:
+        # write aside then rename, so concurrent jobs never read a partial index
+        tmp = f"{self.path}.idx.{uuid.uuid4().hex}"
+        try:
+            with open(tmp, "w") as handle:
+                json.dump({"stamp": self.stamp, "blocks": blocks}, handle)
+            os.replace(tmp, self.path + ".idx")
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def lookup(self, basis: str, uelems: List[str], exact: bool = True) -> Dict[str, str]:
+        """Header line: block text for `basis` (or, if not `exact`, bases starting like `basis`) of elements `uelems`."""
+
+        if exact:
+            names = [basis] if basis in self.blocks else []
+        else:
+            # loose match to accomodate composing
+            prefix = basis[:5]
+            names = []
+            for name in self.basis_names[bisect.bisect_left(self.basis_names, prefix) :]:
+                if not name.startswith(prefix):
+                    break
+                names.append(name)
+
+        wanted = sorted(block for name in names for block in self.blocks[name] if block[1] in uelems)
+        return {header: self.mm[start:end].decode() for _, _, header, start, end in wanted}
+
+
+_genbas_indices = {}
+
+
+def _genbas_index(path: str) -> _GenbasIndex:
+    """Process-wide index of GENBAS file `path`, rebuilt should the file change."""
+
+    stat = os.stat(path)
+    index = _genbas_indices.get(path)
+    if index is None or index.stamp != [stat.st_size, stat.st_mtime_ns]:
+        index = _genbas_indices[path] = _GenbasIndex(path)
+
+    return index
+
+
 def extract_basis_from_genbas(basis: str, elem: Union[str, List], exact: bool = True, verbose: int = 1) -> str:
     """
 
@@ -73,24 +171,8 @@ def extract_basis_from_genbas(basis: str, elem: Union[str, List], exact: bool =
     else:
         uelems = set(el.upper() for el in elem)
 
-    # with open('/home/psilocaluser/gits/qccddb/share/qcdb/basis/GENBAS', 'r') as handle:
-    # with open('GENBAS', 'r') as handle:
     library_genbas_loc = os.sep.join([pe.data_dir, "basis", "GENBAS"])
-    with open(library_genbas_loc, "r") as handle:
-        genbas = handle.read()
-
-    toks = re.split("(^[A-Z]{1,2}:.*$)", genbas, flags=re.MULTILINE)
-    allbas = dict(zip(toks[1::2], toks[2::2]))
-
-    wantedbas = {}
-    for basline, basblock in allbas.items():
-        baskey = basline.split()[0].split(":")  # ['CO', 'qz2p']
-        if exact is True:
-            if baskey[1] == basis and baskey[0] in uelems:  # perfect match
-                wantedbas[basline] = basblock
-        else:
-            if baskey[1].startswith(basis[:5]) and baskey[0] in uelems:  # loose match to accomodate composing
-                wantedbas[basline] = basblock
+    wantedbas = _genbas_index(library_genbas_loc).lookup(basis, uelems, exact=exact)
 
     wanted_genbas = "".join(f"{k}\n{v}\n" for k, v in wantedbas.items())
     if verbose >= 2:
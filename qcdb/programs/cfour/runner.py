@@ -14,6 +14,7 @@ from qcengine.programs.util import PreservingDict
 
 from ... import qcvars
 from ...basisset import BasisSet
+from ...driver import result_cache
 from ...util import accession_stamp, print_jobrec, provenance_stamp
 from .germinate import (
     extract_basis_from_genbas,
@@ -33,7 +34,7 @@ def run_cfour(name: str, molecule: "Molecule", options: "Keywords", **kwargs) ->
         **{
             "driver": inspect.stack()[1][3],
             "extras": {
-                "qcdb:options": copy.deepcopy(options),
+                "qcdb:options": options.fork(),
             },
             "model": {
                 "method": name,
@@ -44,7 +45,7 @@ def run_cfour(name: str, molecule: "Molecule", options: "Keywords", **kwargs) ->
         }
     )
 
-    jobrec = qcng.compute(resi, "qcdb-cfour", local_options=local_options, raise_error=True).dict()
+    jobrec = result_cache.compute(resi, "qcdb-cfour", local_options=local_options)
 
     hold_qcvars = jobrec["extras"].pop("qcdb:qcvars")
     jobrec["qcvars"] = {key: qcel.Datum(**dval) for key, dval in hold_qcvars.items()}
@@ -139,7 +140,7 @@ class QcdbCFOURHarness(CFOURHarness):
         # print(ropts.print_changed(history=True))  # debug
 
         # Handle conversion of psi4 keyword structure into cfour format
-        skma_options = {key: ropt.value for key, ropt in sorted(ropts.scroll["CFOUR"].items()) if ropt.disputed()}
+        skma_options = {key: ropt.value for key, ropt in sorted(ropts.disputed("CFOUR").items())}
         optcmd = format_keywords(skma_options)
 
         # Assemble ZMAT pieces
@@ -1,3 +1,5 @@
+import copy
+import hashlib
 import itertools
 import math
 import re
@@ -5,6 +7,7 @@ import uuid
 from collections import defaultdict
 from typing import Dict, List, Tuple
 
+import numpy as np
 import qcelemental as qcel
 import qcengine as qcng
 from qcelemental.util import which
@@ -40,14 +43,25 @@ def _get_symmetry_card(pg: str, full_pg_n: int) -> Tuple[str, str]:
 def get_master_frame(
     kmol: "qcelemental.models.Molecule", scratch_directory
 ) -> Tuple["qcelemental.models.Molecule", Dict[str, str]]:
-    """Do whatever it takes to figure out the GAMESS master frame by which ``kmol`` can be run with full symmetry."""
+    """Do whatever it takes to figure out the GAMESS master frame by which ``kmol`` can be run with full symmetry.
 
-    harness = qcng.get_program("gamess")
+    The probe runs are done once per molecule, whatever its placement, and cached for the process.
 
+    """
     # want the full frame-independent symmetry, so allow reorientation to Psi4 master frame
     qmol = Molecule.from_schema(kmol.dict() | {"fix_com": False, "fix_orientation": False})
     pgn, naxis = _get_symmetry_card(qmol.full_point_group_with_n(), qmol.full_pg_n())
 
+    internal_symmetry_card = f"{pgn} {naxis}".strip()
+    key = _master_frame_key(kmol, internal_symmetry_card)
+    if key in _master_frame_cache:
+        # same molecule probed before, so only rigid motion onto its master frame needed
+        cached_mf_kmol, data = _master_frame_cache[key]
+        mf_kmol, _ = kmol.align(cached_mf_kmol, atoms_map=False, mols_align=True, run_mirror=True, verbose=0)
+        return mf_kmol, copy.deepcopy(data)
+
+    harness = qcng.get_program("gamess")
+
     # run exetyp=check asserting full symmetry to extract master frame from GAMESS
     # * fix_*=F so harness returns the internal GAMESS frame, not the naive input frame
     # * uses an arbitrary UHF/6-31G model
@@ -173,8 +187,27 @@ def get_master_frame(
         "unique": full_pg_unique,
         "symmetry_card": symmetry_card,
     }
+    _master_frame_cache[key] = (mf_kmol, data)
+
+    return mf_kmol, copy.deepcopy(data)
+
+
+_master_frame_cache = {}
+
+
+def _master_frame_key(kmol: "qcelemental.models.Molecule", symmetry_card: str) -> str:
+    """Hash of the elements, masses, interatomic distances, and ``symmetry_card`` of ``kmol``, the same for any
+    placement (including mirror image) of the same molecule with its atoms in the same order."""
+
+    geom = np.asarray(kmol.geometry)
+    distances = np.around(np.linalg.norm(geom[:, None, :] - geom[None, :, :], axis=2), 6)
+
+    digest = hashlib.sha1()
+    digest.update(f"{symmetry_card}|{' '.join(kmol.symbols)}|".encode())
+    digest.update(np.around(kmol.masses, 6).tobytes())
+    digest.update(distances.tobytes())
 
-    return mf_kmol, data
+    return digest.hexdigest()
 
 
 def _get_exetype_check_input(
@@ -14,6 +14,7 @@ from qcengine.programs.util import PreservingDict
 
 from ... import qcvars
 from ...basisset import BasisSet
+from ...driver import result_cache
 from ...molecule import Molecule
 from ...util import accession_stamp, print_jobrec, provenance_stamp
 from .germinate import get_master_frame, muster_inherited_keywords, muster_modelchem, muster_molecule_and_basisset
@@ -29,7 +30,7 @@ def run_gamess(name: str, molecule: "Molecule", options: "Keywords", **kwargs) -
         **{
             "driver": inspect.stack()[1][3],
             "extras": {
-                "qcdb:options": copy.deepcopy(options),
+                "qcdb:options": options.fork(),
             },
             "model": {
                 "method": name,
@@ -40,7 +41,7 @@ def run_gamess(name: str, molecule: "Molecule", options: "Keywords", **kwargs) -
         }
     )
 
-    jobrec = qcng.compute(resi, "qcdb-gamess", local_options=local_options, raise_error=True).dict()
+    jobrec = result_cache.compute(resi, "qcdb-gamess", local_options=local_options)
 
     hold_qcvars = jobrec["extras"].pop("qcdb:qcvars")
     jobrec["qcvars"] = {key: qcel.Datum(**dval) for key, dval in hold_qcvars.items()}
@@ -157,7 +158,7 @@ class QcdbGAMESSHarness(GAMESSHarness):
         for mem_frac_replicated in (1, 0.5, 0.1, 0.75):
             mwords, memddi = self._partition(mwords_total, mem_frac_replicated, config.ncores)
             asdf += f"loop {mwords_total=} {mem_frac_replicated=} {config.ncores=} -> repl: {mwords=} dist: {memddi=} -> percore={memddi/config.ncores + mwords} tot={memddi + config.ncores * mwords}\n"
-            trial_opts = {key: ropt.value for key, ropt in sorted(ropts.scroll["GAMESS"].items()) if ropt.disputed()}
+            trial_opts = {key: ropt.value for key, ropt in sorted(ropts.disputed("GAMESS").items())}
             trial_opts["contrl__exetyp"] = "check"
             trial_opts["system__parall"] = not (config.ncores == 1)
             trial_opts["system__mwords"] = mwords
@@ -192,7 +193,7 @@ class QcdbGAMESSHarness(GAMESSHarness):
         # print(ropts.print_changed(history=True))  # debug
 
         # Handle conversion of qcsk keyword structure into program format
-        skma_options = {key: ropt.value for key, ropt in sorted(ropts.scroll["GAMESS"].items()) if ropt.disputed()}
+        skma_options = {key: ropt.value for key, ropt in sorted(ropts.disputed("GAMESS").items())}
 
         optcmd = format_keywords(skma_options)
 
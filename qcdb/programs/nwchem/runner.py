@@ -14,6 +14,7 @@ from qcengine.programs.util import PreservingDict
 
 from ... import qcvars
 from ...basisset import BasisSet
+from ...driver import result_cache
 from ...driver.config import get_mode_config
 from ...molecule import Molecule
 from ...util import accession_stamp, format_error, print_jobrec, provenance_stamp
@@ -32,7 +33,7 @@ def run_nwchem(name: str, molecule: "Molecule", options: "Keywords", **kwargs) -
         **{
             "driver": inspect.stack()[1][3],
             "extras": {
-                "qcdb:options": copy.deepcopy(options),
+                "qcdb:options": options.fork(),
                 "qcdb:mode_config": mode_options,
             },
             "model": {
@@ -44,7 +45,7 @@ def run_nwchem(name: str, molecule: "Molecule", options: "Keywords", **kwargs) -
         }
     )
 
-    jobrec = qcng.compute(resi, "qcdb-nwchem", local_options=local_options, raise_error=True).dict()
+    jobrec = result_cache.compute(resi, "qcdb-nwchem", local_options=local_options)
 
     hold_qcvars = jobrec["extras"].pop("qcdb:qcvars")
     jobrec["qcvars"] = {key: qcel.Datum(**dval) for key, dval in hold_qcvars.items()}
@@ -165,7 +166,7 @@ class QcdbNWChemHarness(NWChemHarness):
         # Handle conversion of qcdb keyword structure into nwchem format
         # OLD    optcmd = moptions.prepare_options_for_nwchem(jobrec['options'])
         #    resolved_options = {k: v.value for k, v in jobrec['options'].scroll['NWCHEM'].items() if v.disputed()}
-        skma_options = {key: ropt.value for key, ropt in sorted(ropts.scroll["NWCHEM"].items()) if ropt.disputed()}
+        skma_options = {key: ropt.value for key, ropt in sorted(ropts.disputed("NWCHEM").items())}
         optcmd = format_keywords(skma_options)
 
         # Handle text to be passed untouched to cfour
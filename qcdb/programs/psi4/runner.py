@@ -10,6 +10,7 @@ from qcengine.programs.psi4 import Psi4Harness
 from qcengine.programs.util import PreservingDict
 
 from ... import qcvars
+from ...driver import result_cache
 from ...util import print_jobrec, provenance_stamp
 from .germinate import muster_inherited_keywords
 
@@ -24,7 +25,7 @@ def run_psi4(name: str, molecule: "Molecule", options: "Keywords", **kwargs) ->
         **{
             "driver": inspect.stack()[1][3],
             "extras": {
-                "qcdb:options": copy.deepcopy(options),
+                "qcdb:options": options.fork(),
             },
             "model": {
                 "method": name,
@@ -35,7 +36,7 @@ def run_psi4(name: str, molecule: "Molecule", options: "Keywords", **kwargs) ->
         }
     )
 
-    jobrec = qcng.compute(resi, "qcdb-psi4", local_options=local_options, raise_error=True).dict()
+    jobrec = result_cache.compute(resi, "qcdb-psi4", local_options=local_options)
     hold_qcvars = jobrec["extras"].pop("qcdb:qcvars")
     jobrec["qcvars"] = {key: qcel.Datum(**dval) for key, dval in hold_qcvars.items()}
 
@@ -91,7 +92,7 @@ class QcdbPsi4Harness(Psi4Harness):
         input_data["model"]["method"] = mtd
 
         # should we put this memory in the JobConfig object? I don't think the units agree
-        ropts.scroll["QCDB"].pop("MEMORY")
+        ropts.remove("QCDB", "MEMORY")
         # print(config.memory, '!!')
         # config.memory = omem.value #???
         # print(config.memory, '!!')
@@ -101,13 +102,11 @@ class QcdbPsi4Harness(Psi4Harness):
         # input_data['return_output'] = True
 
         popts = {}
-        for k, v in ropts.scroll["QCDB"].items():
-            if v.disputed():
-                popts[k] = v.value
+        for k, v in ropts.disputed("QCDB").items():
+            popts[k] = v.value
 
-        for k, v in ropts.scroll["PSI4"].items():
-            if v.disputed():
-                popts[k] = v.value
+        for k, v in ropts.disputed("PSI4").items():
+            popts[k] = v.value
         input_data["keywords"] = popts
 
         if "BASIS" in input_data["keywords"]:
@@ -1,2 +1,2 @@
-from .amplify import build_out, certify_and_datumize
-from .whatprovides import VARH
+from .amplify import IdentitySolver, build_out, certify_and_datumize, wfn_solver
+from .whatprovides import VARH, VARH_PROVIDERS
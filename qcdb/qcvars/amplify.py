@@ -1,11 +1,13 @@
+import collections
+import heapq
 from decimal import Decimal
-from typing import Dict, Union
+from typing import Any, Dict, List, Union
 
 import numpy as np
 from qcelemental import Datum
 
 from ..exceptions import ValidationError
-from .glossary import qcvardefs
+from .glossary import qcvar_definition
 from .identities import wfn_qcvars
 
 
@@ -22,65 +24,131 @@ def certify_and_datumize(
     """
     calcinfo = []
     for pv, var in dicary.items():
-        if pv in qcvardefs.keys():
-            doi = qcvardefs[pv].get("doi", None)
-            if plump and isinstance(var, np.ndarray) and var.ndim == 1:
-                var = var.reshape(eval(qcvardefs[pv]["dimension"].format(nat=nat)))
-            calcinfo.append(Datum(pv, qcvardefs[pv]["units"], var, doi=doi, glossary=qcvardefs[pv]["glossary"]))
+        qcvar = qcvar_definition(pv)
+        if qcvar is None:
+            raise ValidationError(f"Undefined QCvar!: {pv}")
 
-        else:
-            defined = sorted(qcvardefs.keys())
-            raise ValidationError("Undefined QCvar!: {}\n{}".format(pv, "\n\t".join(defined)))
+        if plump and qcvar.shape is not None and isinstance(var, np.ndarray) and var.ndim == 1:
+            var = var.reshape(qcvar.shape(nat))
+        calcinfo.append(Datum(pv, qcvar.units, var, doi=qcvar.doi, glossary=qcvar.glossary))
 
     return {info.label: info for info in calcinfo}
 
 
-def build_out(rawvars: Dict[str, Datum], verbose: int = 1) -> None:
-    """Apply standard QC identities to QCVariables `rawvars` to build more (e.g., correlation from total and HF energies).
+class IdentitySolver:
+    """Apply QCVariable identity equations incrementally, each as soon as its arguments are available.
 
-    Dictionary `wfn_qcvars` had keys with names of QCVariables to be created and values with dictionary of two keys:
-    `args`, the QCVariables that contribute tot the key and `func`, a functional (or lambda) to combine them. This
-    function builds that key QCVariables if all the contributors are available in `rawvars`. Updates internally so
-    multiple passes not needed.
+    The dependency graph of the identities is formed once, on construction, so a solver may be kept and reused
+    for every harvest. Solving works from a worklist, so identities whose arguments only become available through
+    other identities are applied regardless of their order in `actions`, and each QCVariable is derived once.
 
     Parameters
     ----------
-    verbose
-        Controls print level. Per-var printing with >=2.
-
-    Returns
-    -------
-    None
-        But input dictionary `rawvars` is updated.
+    actions
+        Identity equations, each a dictionary with keys `form`, the name of the QCVariable to be created, `args`, the
+        QCVariables (and constants) that contribute to it, and `func`, a functional to combine them. See
+        :py:func:`~qcdb.qcvars.identities.wfn_qcvars`.
 
     """
-    for action in wfn_qcvars():
-        pvar = action["form"]
-        buildline = """building {} {}""".format(pvar, "." * (50 - len(pvar)))
-
-        data_rich_args = []
 
-        for pv in action["args"]:
-            if isinstance(pv, str):
-                if pv in rawvars:
+    def __init__(self, actions: List[Dict[str, Any]]):
+        self.actions = list(actions)
+        self.pvargs = [tuple(pv for pv in action["args"] if isinstance(pv, str)) for action in self.actions]
+
+        # actions indexed by each QCVariable among their arguments
+        self.consumers = collections.defaultdict(list)
+        for iact, pvargs in enumerate(self.pvargs):
+            for pv in set(pvargs):
+                self.consumers[pv].append(iact)
+
+    def solve(self, rawvars: Dict[str, Datum], verbose: int = 1) -> None:
+        """Build all QCVariables obtainable from `rawvars` through the identities, updating `rawvars` in place.
+
+        A QCVariable built by one identity is not rebuilt by another. Identities for QCVariables in `rawvars`
+        from the start are still applied, as consistency checks through the ``PreservingDict``.
+
+        Parameters
+        ----------
+        verbose
+            Controls print level. Per-var printing with >=2.
+
+        """
+        given = set(rawvars)
+        missing = [len(set(pvargs)) for pvargs in self.pvargs]
+        for pv in given:
+            for iact in self.consumers.get(pv, []):
+                missing[iact] -= 1
+
+        # apply in order of `actions` where there's a choice
+        ready = [iact for iact, nmiss in enumerate(missing) if nmiss == 0]
+        heapq.heapify(ready)
+        derived = set()
+
+        while ready:
+            iact = heapq.heappop(ready)
+            action = self.actions[iact]
+            pvar = action["form"]
+            # built already, or an argument since dropped
+            if pvar in derived or not all(pv in rawvars for pv in self.pvargs[iact]):
+                continue
+
+            buildline = """building {} {}""".format(pvar, "." * (50 - len(pvar)))
+            data_rich_args = []
+            for pv in action["args"]:
+                if isinstance(pv, str):
                     data_rich_args.append(rawvars[pv])
                     if verbose >= 3:
                         print(f"{pv=} {rawvars[pv]}")
                 else:
-                    if verbose >= 2:
-                        print("""{}EMPTY, missing {}""".format(buildline, pv))
-                    break
-            else:
-                data_rich_args.append(pv)
-        else:
+                    data_rich_args.append(pv)
+
             result = action["func"](data_rich_args)
             if verbose >= 3:
                 print(f"{result=}")
-            # rawvars[pvar] = result
             # with data coming from file --> variable, looks more precise than it is. hack
             rawvars.__setitem__(pvar, result, 6)
             if verbose >= 1:
                 print("""{}SUCCESS""".format(buildline))
 
+            if pvar not in given:
+                derived.add(pvar)
+
             if pvar == "CURRENT CORRELATION ENERGY" and abs(float(rawvars[pvar])) < 1.0e-16:
                 rawvars.pop(pvar)
+            elif pvar not in given:
+                for jact in self.consumers.get(pvar, []):
+                    missing[jact] -= 1
+                    if missing[jact] == 0:
+                        heapq.heappush(ready, jact)
+
+        if verbose >= 2:
+            for iact, action in enumerate(self.actions):
+                if missing[iact] > 0:
+                    pvar = action["form"]
+                    absent = next(pv for pv in self.pvargs[iact] if pv not in rawvars)
+                    print("""building {} {}EMPTY, missing {}""".format(pvar, "." * (50 - len(pvar)), absent))
+
+
+# identities formed once, for every harvest
+wfn_solver = IdentitySolver(wfn_qcvars())
+
+
+def build_out(rawvars: Dict[str, Datum], verbose: int = 1) -> None:
+    """Apply standard QC identities to QCVariables `rawvars` to build more (e.g., correlation from total and HF energies).
+
+    Identities are those of :py:func:`~qcdb.qcvars.identities.wfn_qcvars`, applied by the cached
+    :py:class:`IdentitySolver` `wfn_solver`. Each QCVariable is built once all its contributors are available in
+    `rawvars`, whether present from the start or themselves built, so a single call suffices.
+
+    Parameters
+    ----------
+    verbose
+        Controls print level. Per-var printing with >=2.
+
+    Returns
+    -------
+    None
+        But input dictionary `rawvars` is updated.
+
+    """
+    wfn_solver.solve(rawvars, verbose=verbose)
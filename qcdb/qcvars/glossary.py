@@ -1,3 +1,8 @@
+import re
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from ..exceptions import ValidationError
+
 qcvardefs = {}
 # .. include:: autodoc_abbr_options_c.rst
 #
@@ -2238,3 +2243,98 @@ define_spin_qcvars(
     do_spin=False,
     do_grad=False,
 )
+
+
+# families of QCVariables templated on root numbers and symmetries, beyond those defined concretely above
+qcvarpatterns = {
+    r"CI ROOT \d+ (TOTAL|CORRELATION) ENERGY": qcvardefs["CI ROOT 0 TOTAL ENERGY"],
+    r"TDDFT ROOT \d+ EXCITATION ENERGY - \w+ SYMMETRY": {
+        "units": "Eh",
+        "glossary": """The excitation energy of time-dependent DFT in the given symmetry from 0 to the given root""",
+    },
+    r"TDDFT ROOT \d+ EXCITED STATE ENERGY - \w+ SYMMETRY": {
+        "units": "Eh",
+        "glossary": """The excited state energy of time dependent DFT from root 0 to the given root in the given symmetry""",
+    },
+    r".+ ROOT \d+ -> ROOT \d+ DIPOLE": {
+        "units": "e a0",
+        "dimension": "(3,)",
+        "glossary": """The transition dipole array between the given roots for the named level of theory.""",
+    },
+    r".+ ROOT \d+ -> ROOT \d+ QUADRUPOLE": {
+        "units": "e a0^2",
+        "dimension": "(3,3)",
+        "glossary": """The redundant transition quadrupole between the given roots for the named level of theory.""",
+    },
+}
+
+
+class QCVarDef(NamedTuple):
+    """Compiled glossary entry of a QCVariable, with `shape` that of an array QCVariable as function of the
+    number of atoms.
+
+    """
+
+    units: str
+    glossary: str
+    doi: Optional[str]
+    shape: Optional[Callable[[int], Tuple[int, ...]]]
+
+
+def _compile_dimension(dimension: str) -> Callable[[int], Tuple[int, ...]]:
+    """Turn a glossary "dimension" template like ``"(3 * {nat}, 3)"`` into a function of the number of atoms."""
+
+    terms = []
+    for term in dimension.strip().strip("()").split(","):
+        if not term.strip():
+            continue
+        mobj = re.fullmatch(r"\s*(?:(\d+)\s*\*\s*)?(\{nat\}|\d+)\s*", term)
+        if mobj is None:
+            raise ValidationError(f"Glossary dimension not understood: {dimension}")
+        coeff = int(mobj.group(1) or 1)
+        if mobj.group(2) == "{nat}":
+            terms.append((coeff, True))
+        else:
+            terms.append((coeff * int(mobj.group(2)), False))
+    terms = tuple(terms)
+
+    return lambda nat: tuple(coeff * nat if per_atom else coeff for coeff, per_atom in terms)
+
+
+def _compile_qcvar(entry: Dict) -> QCVarDef:
+    dimension = entry.get("dimension")
+    return QCVarDef(
+        units=entry["units"],
+        glossary=entry["glossary"],
+        doi=entry.get("doi", None),
+        shape=None if dimension is None else _compile_dimension(dimension),
+    )
+
+
+qcvartable = {pv: _compile_qcvar(entry) for pv, entry in qcvardefs.items()}
+_qcvarpatterns = [(re.compile(pattern), _compile_qcvar(entry)) for pattern, entry in qcvarpatterns.items()]
+
+
+def qcvar_definition(pv: str) -> Optional[QCVarDef]:
+    """Look up compiled glossary entry of QCVariable `pv`, trying templated families after exact names.
+
+    Returns
+    -------
+    QCVarDef or None
+        Definition of `pv`, or None if undefined.
+
+    """
+    try:
+        return qcvartable[pv]
+    except KeyError:
+        pass
+
+    if pv in qcvardefs:
+        qcvar = _compile_qcvar(qcvardefs[pv])
+    else:
+        qcvar = next((qcvar for regex, qcvar in _qcvarpatterns if regex.fullmatch(pv)), None)
+        if qcvar is None:
+            return None
+
+    qcvartable[pv] = qcvar
+    return qcvar
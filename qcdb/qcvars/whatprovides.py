@@ -186,4 +186,15 @@ def return_energy_components():
     return VARH
 
 
+def return_energy_providers(varh):
+    """Invert `varh` into a map of each QCVariable to the set of methods whose computation yields it."""
+
+    providers = {}
+    for mtd, provides in varh.items():
+        for qcvar in provides.values():
+            providers.setdefault(qcvar, set()).add(mtd)
+    return providers
+
+
 VARH = return_energy_components()
+VARH_PROVIDERS = return_energy_providers(VARH)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+import qcdb
+
+from .utils import *
+
+
+def quadrature(center, npts=60):
+    """Product grid about `center`, dense near it, for integrating tight and diffuse functions alike."""
+
+    t, w = np.polynomial.legendre.leggauss(npts)
+    x = 0.3 * np.sinh(4.0 * t)
+    wx = w * 1.2 * np.cosh(4.0 * t)
+    points = np.stack(np.meshgrid(x, x, x, indexing="ij"), axis=-1).reshape(-1, 3)
+
+    return points + center, np.einsum("i,j,k->ijk", wx, wx, wx).ravel()
+
+
+@pytest.mark.parametrize("basis,puream,nbf", [("cc-pvtz", True, 14), ("6-31g**", False, 5)])
+def test_compute_phi_normalized(basis, puream, nbf):
+    mol = qcdb.Molecule("H")
+    bs = qcdb.BasisSet.pyconstruct(mol, "BASIS", basis, verbose=0)
+    points, weights = quadrature(mol.xyz(0, np_out=True))
+
+    phi = bs.compute_phi(points, chunk_size=50000)
+    S = (phi * weights[:, None]).T @ phi
+
+    assert compare(puream, bs.has_puream(), "puream")
+    assert compare_integers(nbf, phi.shape[1], "nbf")
+    # contracted functions within a shell and spherical functions across are all normalized
+    assert compare_arrays(np.ones(nbf), np.diag(S), 6, "normalized")
+
+
+def test_compute_phi_deriv():
+    mol = qcdb.Molecule("O\nH 1 0.96\nH 1 0.96 2 104.5")
+    bs = qcdb.BasisSet.pyconstruct(mol, "BASIS", "cc-pvtz", verbose=0)
+    points = np.random.default_rng(7).normal(size=(200, 3))
+
+    phi = bs.compute_phi(points)
+    dphi = bs.compute_phi(points, deriv=1, chunk_size=37)
+
+    assert phi.shape == (200, bs.nbf())
+    assert dphi.shape == (4, 200, bs.nbf())
+    assert compare_arrays(phi, dphi[0], 14, "chunked")
+    for i in range(3):
+        step = np.zeros(3)
+        step[i] = 1.0e-5
+        fd = (bs.compute_phi(points + step) - bs.compute_phi(points - step)) / 2.0e-5
+        assert compare_arrays(fd, dphi[1 + i], 6, f"d/d{'xyz'[i]}")
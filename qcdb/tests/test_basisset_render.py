@@ -0,0 +1,63 @@
+import hashlib
+
+import pytest
+
+import qcdb
+
+from .utils import *
+
+smol = """
+C    0.0  0.0 0.0
+O    1.4  0.0 0.0
+H_r -0.5 -0.7 0.0
+H_l -0.5  0.7 0.0
+--
+@He 0.0 0.0 3.0
+"""
+
+
+def basisspec_dz_tz_on_hl(mol, role):
+    mol.set_basis_all_atoms("cc-pvdz", role=role)
+    mol.set_basis_by_label("h_l", "cc-pvtz", role=role)
+    return {}
+
+
+def shell_texts(bs, A, pyprint):
+    first_shell = bs.center_to_shell[A]
+    return [getattr(bs.shell(Q + first_shell), pyprint)() for Q in range(bs.center_to_nshell[A])]
+
+
+@pytest.mark.parametrize("target", ["cc-pvdz", "6-31g*", basisspec_dz_tz_on_hl])
+def test_rendered_centers(target):
+    mol = qcdb.Molecule(smol)
+    bs = qcdb.BasisSet.pyconstruct(mol, "BASIS", target, verbose=0)
+
+    for A in range(mol.natom()):
+        # hash by which symmetry observes basis assignment, as if from one-atom BasisSet
+        oneatombasis = qcdb.BasisSet(bs, A)
+        ref = hashlib.sha1(oneatombasis.print_detail(numbersonly=True).encode("utf-8")).hexdigest()
+        assert compare_strings(ref, mol.atoms[A].shell("BASIS"), f"hash atom {A}")
+
+    nwchem = bs.print_detail_nwchem()
+    gamess = bs.print_detail_gamess(return_list=True)
+    for uA in range(mol.nunique()):
+        A = mol.unique(uA)
+        label = ("" if mol.Z(A) > 0 else "bq") + mol.symbol(A).capitalize() + str(A + 1) + " "
+        assert "".join(label + text for text in shell_texts(bs, A, "pyprint_nwchem")) in nwchem
+        assert gamess[uA].endswith("".join(shell_texts(bs, A, "pyprint_gamess")))
+
+    cfour = bs.print_detail_cfour()
+    assert compare_integers(mol.nunique(), cfour.count(":CD_"), "cfour entries")
+    assert cfour == bs.print_detail_cfour()
+
+
+def test_rendered_centers_by_content():
+    bs = qcdb.BasisSet.pyconstruct(qcdb.Molecule(smol), "BASIS", basisspec_dz_tz_on_hl, verbose=0)
+
+    # same element, different basis, doesn't share a block
+    assert bs.center_fingerprint(2) != bs.center_fingerprint(3)
+    assert compare_integers(bs.center_to_nshell[3], bs.print_detail_nwchem().count("\nH4 "), "H_l entries are its own")
+
+    # same element and basis in another molecule and BasisSet does
+    bs2 = qcdb.BasisSet.pyconstruct(qcdb.Molecule("H\nH 1 0.74"), "BASIS", "cc-pvdz", verbose=0)
+    assert compare_strings(bs.center_fingerprint(2), bs2.center_fingerprint(0), "H cc-pvdz")
@@ -0,0 +1,99 @@
+import pytest
+import qcelemental as qcel
+
+import qcdb
+from qcdb.driver import pe
+
+from .utils import *
+
+zeta = {"cc-pvdz": 2, "cc-pvtz": 3, "cc-pvqz": 4}
+
+
+def fake_energy(name, molecule, keywords, return_wfn=False, **kwargs):
+    """Stand-in for ``energy`` whose result depends only on the BASIS of the private `keywords`."""
+
+    basis = keywords.scroll["QCDB"]["BASIS"].value.lower()
+    label = keywords.scroll["QCDB"]["WRITER_FILE_LABEL"].value
+    assert label == f"{name}-{basis}"
+
+    scf = -1.0 - 0.1 / zeta[basis]
+    mp2 = scf - 0.2 - 0.05 / zeta[basis] ** 3
+    ene = {"hf": scf, "mp2": mp2}[name]
+    qcvars = {
+        "HF TOTAL ENERGY": qcel.Datum("HF TOTAL ENERGY", "Eh", scf),
+        "MP2 TOTAL ENERGY": qcel.Datum("MP2 TOTAL ENERGY", "Eh", mp2),
+        "CURRENT ENERGY": qcel.Datum("CURRENT ENERGY", "Eh", ene),
+    }
+    return ene, {"qcvars": qcvars, "molecule": molecule.to_schema(dtype=2)}
+
+
+def run_cbs(**execopts):
+    qcdb.driver.pe.clean_options()
+    qcdb.driver.pe.load_options()
+    mol = qcdb.Molecule("He 0 0 0")
+
+    ene, jrec = qcdb.cbs(
+        fake_energy,
+        "mp2/cc-pv[tq]z",
+        molecule=mol,
+        ptype="energy",
+        return_wfn=True,
+        scf_basis="cc-pv[dtq]z",
+        corl_wfn="mp2",
+        corl_basis="cc-pv[tq]z",
+        **execopts,
+    )
+    return ene, jrec
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_cbs_concurrent(pool):
+    ref, refrec = run_cbs()
+    ene, jrec = run_cbs(executor=pool, max_workers=3)
+
+    assert compare_values(ref, ene, 10, "cbs energy")
+    assert compare_integers(3, jrec["qcvars"]["CBS NUMBER"].data, "cbs jobs")
+    assert pe.nu_options.scroll["QCDB"]["BASIS"].value == ""
+
+
+@pytest.mark.parametrize(
+    "name,kwargs,bases",
+    [
+        ("mp2/cc-pvdz", {}, {"CC-PVDZ"}),
+        ("mp2/cc-pv[dt]z", {}, {"CC-PVDZ", "CC-PVTZ"}),
+        ("mp2/cc-pv[dt]z", {"executor": "thread", "max_workers": 2}, {"CC-PVDZ", "CC-PVTZ"}),
+        ("mp2/cc-pvdz", {"bsse_type": "cp"}, {"CC-PVDZ"}),
+        ("mp2/cc-pv[dt]z", {"bsse_type": "nocp"}, {"CC-PVDZ", "CC-PVTZ"}),
+    ],
+)
+def test_private_keywords_through_bounces(name, kwargs, bases, monkeypatch):
+    from qcdb.driver import load_proc_table  # populate procedures before patching
+    from qcdb.driver.proc_table import procedures
+
+    seen = []
+
+    def fake_procedure(name, molecule, options, ptype, **kwargs):
+        basis = options.scroll["QCDB"]["BASIS"].value
+        seen.append((basis, options.scroll["QCDB"]["SCF_TYPE"].value))
+        ene = -1.0 * molecule.natom() - 0.1 / zeta[basis.lower()]
+        qcvars = {
+            "HF TOTAL ENERGY": qcel.Datum("HF TOTAL ENERGY", "Eh", ene),
+            "MP2 TOTAL ENERGY": qcel.Datum("MP2 TOTAL ENERGY", "Eh", ene),
+            "CURRENT ENERGY": qcel.Datum("CURRENT ENERGY", "Eh", ene),
+        }
+        return {"qcvars": qcvars, "molecule": molecule.to_schema(dtype=2)}
+
+    monkeypatch.setitem(procedures["energy"]["psi4"], "hf", fake_procedure)
+    monkeypatch.setitem(procedures["energy"]["psi4"], "mp2", fake_procedure)
+    pe.clean_options()
+    pe.load_options()
+    keywords = pe.nu_options.fork()
+    keywords.require("QCDB", "SCF_TYPE", "pk", 1234)
+
+    mol = qcdb.Molecule("He 0 0 0\n--\nHe 0 0 3")
+    qcdb.energy(name, molecule=mol, keywords=keywords, **kwargs)
+
+    assert {basis for basis, _ in seen} == bases
+    assert {scf_type for _, scf_type in seen} == {"PK"}
+    assert pe.nu_options.scroll["QCDB"]["BASIS"].value == ""
+    assert pe.nu_options.scroll["QCDB"]["SCF_TYPE"].value == ""
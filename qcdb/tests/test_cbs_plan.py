@@ -0,0 +1,68 @@
+import pytest
+
+import qcdb
+from qcdb.driver.cbs_driver import _plan_cbs_jobs
+from qcdb.qcvars import VARH, VARH_PROVIDERS
+
+from .utils import *
+
+
+def lvl(wfn, basis):
+    return {"f_wfn": wfn, "f_basis": basis, "f_zeta": 2}
+
+
+def test_varh_providers():
+    assert "mp2" in VARH_PROVIDERS["HF TOTAL ENERGY"]
+    assert "ccsd(t)" in VARH_PROVIDERS["MP2 TOTAL ENERGY"]
+    assert "hf" not in VARH_PROVIDERS["MP2 TOTAL ENERGY"]
+    for mtd, qcvar in VARH_PROVIDERS.items():
+        for wfn in qcvar:
+            assert mtd in VARH[wfn].values()
+
+
+@pytest.mark.parametrize(
+    "ptype,ans",
+    [
+        ("energy", [("mp2", "cc-pvtz"), ("ccsd(t)", "cc-pvdz")]),
+        ("gradient", [("hf", "cc-pvtz"), ("mp2", "cc-pvtz"), ("ccsd(t)", "cc-pvdz"), ("mp2", "cc-pvdz")]),
+    ],
+)
+def test_plan_cbs_jobs(ptype, ans):
+    grand_need = [
+        {"d_stage": "scf", "d_need": {"HI": lvl("hf", "cc-pvtz")}},
+        {"d_stage": "corl", "d_need": {"HI": lvl("mp2", "cc-pvtz")}},
+        {"d_stage": "corl", "d_need": {"HI": lvl("hf", "cc-pvtz")}},
+        {"d_stage": "delta", "d_need": {"HI": lvl("ccsd(t)", "cc-pvdz")}},
+        {"d_stage": "delta", "d_need": {"HI": lvl("mp2", "cc-pvdz")}},
+    ]
+    modelchem = [need for stage in grand_need for need in stage["d_need"].values()]
+
+    jobs, provenance = _plan_cbs_jobs(modelchem, grand_need, ptype)
+
+    assert [(job["f_wfn"], job["f_basis"]) for job in jobs] == ans
+    assert list(provenance) == ans
+    if ptype == "energy":
+        assert provenance[("mp2", "cc-pvtz")] == ["scf", "corl"]
+        assert provenance[("ccsd(t)", "cc-pvdz")] == ["delta"]
+    else:
+        assert provenance[("hf", "cc-pvtz")] == ["scf", "corl"]
+        assert provenance[("mp2", "cc-pvdz")] == ["delta"]
+
+
+def test_plan_only():
+    qcdb.driver.pe.clean_options()
+    qcdb.driver.pe.load_options()
+    mol = qcdb.Molecule("He 0 0 0")
+
+    plan = qcdb.energy("mp2/cc-pv[tq]z + D:ccsd(t)/cc-pvdz", molecule=mol, plan_only=True)
+
+    assert plan["ptype"] == "energy"
+    assert plan["natom"] == 1
+    assert [(job["f_wfn"], job["f_basis"]) for job in plan["jobs"]] == [
+        ("mp2", "cc-pvtz"),
+        ("mp2", "cc-pvqz"),
+        ("ccsd(t)", "cc-pvdz"),
+    ]
+    assert plan["provenance"][("mp2", "cc-pvqz")] == ["scf", "corl"]
+    assert plan["provenance"][("ccsd(t)", "cc-pvdz")] == ["delta"]
+    assert ("ccsd", "cc-pvdz") in plan["jobs_ext"]
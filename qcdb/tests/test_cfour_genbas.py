@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from qcdb.programs.cfour import germinate
+from qcdb.programs.cfour.germinate import extract_basis_from_genbas
+
+from .utils import *
+
+genbas = """H:STO-3G
+STO-3G minimal basis
+
+  1
+    0
+    1
+    3    1
+
+  3.42525091  0.62391373  0.16885540
+
+  0.15432897
+  0.53532814
+  0.44463454
+
+H:STO-3G-EXT
+comment
+block h ext
+C:STO-3G
+comment
+block c
+H:6-31G
+comment
+block h 631
+H:STO-3G-EXT
+comment
+block h ext repeated
+"""
+
+
+def test_genbas_index(tmp_path):
+    path = str(tmp_path / "GENBAS")
+    with open(path, "w") as handle:
+        handle.write(genbas)
+
+    index = germinate._genbas_index(path)
+    assert list(index.lookup("STO-3G", ["H"]).values())[0].startswith("\nSTO-3G minimal basis\n")
+    assert compare(["H:STO-3G", "C:STO-3G"], list(index.lookup("STO-3G", ["C", "H"])), "exact, file order")
+    assert compare(["H:STO-3G", "H:STO-3G-EXT"], list(index.lookup("STO-3G", ["H"], exact=False)), "prefix, file order")
+    assert compare([], list(index.lookup("STO-3", ["H"])), "exact misses prefix")
+    assert compare(["\ncomment\nblock h 631\n"], list(index.lookup("6-31G", ["H"]).values()), "block")
+    # repeated header keeps its first position and its last block
+    assert compare(
+        ["\ncomment\nblock h ext repeated\n"], list(index.lookup("STO-3G-EXT", ["H"]).values()), "repeated block"
+    )
+
+    # reused within the process, read back from beside the file in another
+    assert germinate._genbas_index(path) is index
+    assert os.path.isfile(path + ".idx")
+    germinate._genbas_indices.clear()
+    assert compare(index.blocks, germinate._genbas_index(path).blocks, "persisted index")
+
+    # rebuilt on file change
+    with open(path, "a") as handle:
+        handle.write("O:6-31G\ncomment\nblock o 631\n")
+    assert compare(["O:6-31G"], list(germinate._genbas_index(path).lookup("6-31G", ["O"])), "rebuilt index")
+
+
+def test_extract_basis_from_genbas():
+    text = extract_basis_from_genbas("qz2p", ["o", "H", "H"])
+    headers = [line.rstrip() for line in text.splitlines() if ":qz2p" in line]
+    assert compare(["H:qz2p", "O:qz2p"], headers, "exact headers")
+
+    text = extract_basis_from_genbas("6-31G*", "h", exact=False)
+    headers = [line for line in text.splitlines() if line.startswith("H:")]
+    assert "H:6-31G" in headers
+    assert all(hdr[2:].startswith("6-31G") for hdr in headers)
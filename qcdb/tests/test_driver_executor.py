@@ -0,0 +1,88 @@
+import concurrent.futures
+
+import pytest
+import qcelemental as qcel
+
+import qcdb
+from qcdb.driver import driver_nbody, executor
+
+from .utils import *
+
+he3 = """
+He 0 0 0
+--
+He 0 0 3
+--
+He 0 3 0
+"""
+
+
+def fake_energy(name, molecule, return_wfn=False, **kwargs):
+    """Stand-in for ``energy`` that counts real atoms at -1 Eh apiece so no interaction energy."""
+
+    ene = -1.0 * sum(molecule.Z(at) > 0 for at in range(molecule.natom()))
+    return ene, {"qcvars": {"CURRENT ENERGY": qcel.Datum("CURRENT ENERGY", "Eh", ene)}}
+
+
+def square(x, **kwargs):
+    return x * x, kwargs
+
+
+@pytest.mark.parametrize("pool", [None, "serial", "thread", "process"])
+def test_fan_out(pool):
+    tasks = {f"job{i}": ((i,), {}) for i in range(6)}
+
+    ret = dict(executor.fan_out(square, tasks, executor=pool, max_workers=2, memory_per_job=1.5))
+
+    assert sorted(ret) == sorted(tasks)
+    for i in range(6):
+        assert ret[f"job{i}"][0] == i * i
+        assert ret[f"job{i}"][1] == {"local_options": {"memory": 1.5}}
+
+
+def test_fan_out_reuses_executor():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        ret1 = dict(executor.fan_out(square, {"a": ((2,), {})}, executor=pool))
+        ret2 = dict(executor.fan_out(square, {"b": ((3,), {})}, executor=pool))
+
+    assert ret1["a"][0] == 4
+    assert ret2["b"][0] == 9
+
+
+def test_fan_out_bad_executor():
+    with pytest.raises(qcdb.ValidationError):
+        dict(executor.fan_out(square, {"a": ((2,), {})}, executor="mpi"))
+
+
+def test_kwargs_lower_executor():
+    kw = qcdb.driver.driver_util.kwargs_lower({"Executor": "Thread", "max_workers": 10, "memory_per_job": 1.5})
+
+    assert kw == {"executor": "thread", "max_workers": 10, "memory_per_job": 1.5}
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_nbody_components_concurrent(pool):
+    def components(execopts):
+        metadata = {
+            "molecule": qcdb.Molecule(he3),
+            "bsse_type_list": ["cp", "nocp", "vmfc"],
+            "max_nbody": 3,
+            "max_frag": 3,
+            "ptype": "energy",
+            "return_total_data": False,
+            "embedding_charges": False,
+            "kwargs": {},
+            "executor": execopts,
+        }
+        metadata = driver_nbody.build_nbody_compute_list(metadata)
+        return metadata, driver_nbody.compute_nbody_components(fake_energy, "hf", metadata)
+
+    _, ref = components({})
+    metadata, ans = components({"executor": pool, "max_workers": 3})
+
+    assert ans["energies"] == ref["energies"]
+    assert ans["intermediates"] == ref["intermediates"]
+    assert compare_values(-2.0, ans["energies"][((1, 2), (1, 2, 3))], 8, "dimer in trimer basis")
+
+    nbody = driver_nbody.assemble_nbody_components(metadata, ans)
+    assert compare_values(0.0, nbody["ret_energy"], 8, "interaction energy")
@@ -0,0 +1,219 @@
+import collections
+import sys
+
+import numpy as np
+import pytest
+import qcelemental as qcel
+
+import qcdb
+from qcdb.driver import driver_findif, load_proc_table, pe
+from qcdb.driver.proc_table import procedures
+
+from .utils import *
+
+h2o = "O\nH 1 0.96\nH 1 0.96 2 104.5"
+c2h4 = "C 0 0 0.66\nC 0 0 -0.66\nH 0 0.92 1.23\nH 0 -0.92 1.23\nH 0 0.92 -1.23\nH 0 -0.92 -1.23"
+nh3 = "N\nH 1 1.0\nH 1 1.0 2 107\nH 1 1.0 2 107 3 110"
+
+
+def springs(geom, r0=1.6, k=0.4):
+    """Energy, gradient, and Hessian of harmonic springs between all atom pairs."""
+
+    geom = np.reshape(geom, (-1, 3))
+    natom = len(geom)
+    ene, grad, hess = 0.0, np.zeros((natom, 3)), np.zeros((natom, 3, natom, 3))
+    for a in range(natom):
+        for b in range(a + 1, natom):
+            rvec = geom[a] - geom[b]
+            r = np.linalg.norm(rvec)
+            u = rvec / r
+            ene += k * (r - r0) ** 2
+            grad[a] += 2 * k * (r - r0) * u
+            grad[b] -= 2 * k * (r - r0) * u
+            block = 2 * k * (np.outer(u, u) + (r - r0) / r * (np.identity(3) - np.outer(u, u)))
+            hess[a, :, a] += block
+            hess[b, :, b] += block
+            hess[a, :, b] -= block
+            hess[b, :, a] -= block
+
+    return ene, grad, hess.reshape(3 * natom, 3 * natom)
+
+
+def run_springs(name, molecule, options, ptype, **kwargs):
+    ene, grad, _ = springs(molecule.geometry(np_out=True))
+    qcvars = {"CURRENT ENERGY": qcel.Datum("CURRENT ENERGY", "Eh", ene)}
+    if ptype == "gradient":
+        qcvars["CURRENT GRADIENT"] = qcel.Datum("CURRENT GRADIENT", "Eh/a0", grad)
+    return {"qcvars": qcvars, "molecule": molecule.to_schema(dtype=2)}
+
+
+@pytest.fixture
+def springs_procedure(monkeypatch):
+    monkeypatch.setitem(procedures["energy"]["psi4"], "springs", run_springs)
+    monkeypatch.setitem(procedures["gradient"]["psi4"], "springs", run_springs)
+    pe.clean_options()
+    pe.load_options()
+
+
+def projected(findif_meta_dict, hess):
+    """`hess` with translations & rotations projected out as in the findif SALC space."""
+
+    B = np.array([salc["coef"] for salc in findif_meta_dict["salcs"]])
+    sqmass3 = np.repeat(np.sqrt(findif_meta_dict["masses"]), 3)
+    P = np.diag(sqmass3) @ B.T @ B @ np.diag(1 / sqmass3)
+    return P @ hess @ P.T
+
+
+@pytest.mark.parametrize(
+    "mol,pg,nsalc,nsym",
+    [
+        (h2o, "c2v", 3, 2),
+        (c2h4, "d2h", 12, 3),
+        (nh3, "cs", 6, 4),
+        ("He 0 0 0\nHe 0 0 1.5", "d2h", 1, 1),
+    ],
+)
+def test_cdsalcs(mol, pg, nsalc, nsym):
+    mol = qcdb.Molecule(mol)
+    mol.update_geometry()
+
+    salcs = driver_findif.cdsalcs(mol)
+    B = np.array([salc for h, salc in salcs])
+
+    assert compare_strings(pg, mol.schoenflies_symbol(), "point group")
+    assert compare_integers(nsalc, len(salcs), "nsalc")
+    assert compare_integers(nsym, len(driver_findif.cdsalcs(mol, irreps=[0])), "totally symmetric nsalc")
+    assert compare_arrays(np.identity(nsalc), B @ B.T, 10, "orthonormal")
+
+
+@pytest.mark.parametrize("stencil_size", [3, 5])
+@pytest.mark.parametrize("mol", [h2o, c2h4, nh3])
+def test_findif_assembly(mol, stencil_size):
+    mol = qcdb.Molecule(mol)
+    mol.update_geometry()
+    _, grad, hess = springs(mol.geometry(np_out=True))
+
+    fd_g = driver_findif.gradient_from_energies_geometries(mol, stencil_size=stencil_size)
+    for disp in fd_g["displacements"].values():
+        disp["energy"] = springs(disp["geometry"])[0]
+
+    fd_h1 = driver_findif.hessian_from_gradients_geometries(mol, stencil_size=stencil_size)
+    for disp in fd_h1["displacements"].values():
+        disp["gradient"] = springs(disp["geometry"])[1]
+
+    fd_h0 = driver_findif.hessian_from_energies_geometries(mol, stencil_size=stencil_size)
+    fd_h0["reference"]["energy"] = springs(fd_h0["reference"]["geometry"])[0]
+    for disp in fd_h0["displacements"].values():
+        disp["energy"] = springs(disp["geometry"])[0]
+
+    atol = 1.0e-5 if stencil_size == 3 else 1.0e-8
+    assert compare_arrays(grad, driver_findif.assemble_gradient_from_energies(fd_g), atol, "G from E")
+    assert compare_arrays(
+        projected(fd_h1, hess), driver_findif.assemble_hessian_from_gradients(fd_h1), atol, "H from G"
+    )
+    assert compare_arrays(projected(fd_h0, hess), driver_findif.assemble_hessian_from_energies(fd_h0), atol, "H from E")
+
+
+def test_findif_drivers(springs_procedure):
+    mol = qcdb.Molecule(h2o)
+    mol.update_geometry()
+    _, grad, hess = springs(mol.geometry(np_out=True))
+
+    G = qcdb.gradient("springs", molecule=mol, dertype=0)
+    H1, jrec = qcdb.hessian("springs", molecule=mol, dertype=1, return_wfn=True)
+    H0 = qcdb.hessian("springs", molecule=mol, dertype=0, findif_stencil_size=5, executor="thread")
+
+    fd = driver_findif.hessian_from_gradients_geometries(mol)
+    assert compare_arrays(grad, G, 1.0e-5, "gradient dertype=0")
+    assert compare_arrays(projected(fd, hess), H1, 1.0e-5, "hessian dertype=1")
+    assert compare_arrays(projected(fd, hess), H0, 1.0e-7, "hessian dertype=0")
+    assert compare_arrays(H1, jrec["qcvars"]["CURRENT HESSIAN"].data, 12, "hessian qcvar")
+
+
+@pytest.mark.parametrize(
+    "mol,pg,nop,ndisp",
+    [
+        (h2o, "Cnv", 4, 5),
+        (c2h4, "Dnh", 8, 9),
+        (nh3, "Cs", 2, 10),
+        (
+            "C\nH 1 1.09\nH 1 1.09 2 109.4712206\nH 1 1.09 2 109.4712206 3 120\nH 1 1.09 2 109.4712206 3 -120",
+            "Td",
+            24,
+            4,
+        ),
+        ("C 0 0 0\nO 0 0 1.16\nO 0 0 -1.16", "D_inf_h", 8, 5),
+    ],
+)
+def test_findif_unique(mol, pg, nop, ndisp):
+    mol = qcdb.Molecule(mol)
+    mol.update_geometry()
+    _, _, hess = springs(mol.geometry(np_out=True))
+
+    ops = driver_findif.symmetry_operations(mol)
+    fd = driver_findif.hessian_from_gradients_geometries(mol, displacement_space="unique")
+    fd["reference"]["gradient"] = springs(fd["reference"]["geometry"])[1]
+    for disp in fd["displacements"].values():
+        disp["gradient"] = springs(disp["geometry"])[1]
+
+    assert compare_strings(pg, mol.full_point_group_with_n(), "full point group")
+    assert compare_integers(nop, len(ops), "nop")
+    assert compare_integers(ndisp, len(fd["displacements"]), "ndisp")
+    for R, atom_map in ops:
+        assert compare_arrays(np.identity(3), R @ R.T, 10, "orthogonal")
+        assert compare_integers(mol.natom(), len(set(atom_map)), "permutation")
+    assert compare_arrays(hess, driver_findif.assemble_hessian_from_gradients(fd), 1.0e-5, "unprojected H from G")
+
+
+def test_findif_unique_driver(springs_procedure):
+    mol = qcdb.Molecule(c2h4)
+    mol.update_geometry()
+    _, _, hess = springs(mol.geometry(np_out=True))
+
+    H = qcdb.hessian("springs", molecule=mol, dertype=1, findif_displacement_space="unique", findif_stencil_size=5)
+
+    assert compare_arrays(hess, H, 1.0e-8, "hessian dertype=1 unique")
+    with pytest.raises(qcdb.ValidationError):
+        qcdb.hessian("springs", molecule=mol, dertype=0, findif_displacement_space="unique")
+
+
+@pytest.mark.parametrize("mol", [h2o, c2h4, nh3])
+@pytest.mark.parametrize("isotope", [False, True])
+def test_harmonic_analysis_without_psi4(mol, isotope, monkeypatch):
+    mol = qcdb.Molecule(mol)
+    mol.update_geometry()
+    geom = mol.geometry(np_out=True)
+    mass = np.array([mol.mass(at) if mol.Z(at) != 1 or not isotope else 2.014101778 for at in range(mol.natom())])
+    monkeypatch.setitem(sys.modules, "psi4", None)
+
+    vibinfo, _ = qcdb.vib.harmonic_analysis(springs(geom)[2], geom, mass, mol, mol.irrep_labels())
+
+    nsalc = collections.Counter(mol.irrep_labels()[h] for h, _ in driver_findif.cdsalcs(mol))
+    vibs = [gamma for gamma, trv in zip(vibinfo["gamma"].data, vibinfo["TRV"].data) if trv == "V"]
+    assert compare_integers(3 * mol.natom() - 6, len(vibs), "nvib")
+    assert compare(dict(nsalc), dict(collections.Counter(vibs)), "vibrations by irrep")
+
+
+@pytest.mark.parametrize("mol", [h2o, c2h4])
+def test_harmonic_analysis_batch(mol):
+    mol = qcdb.Molecule(mol)
+    mol.update_geometry()
+    geom = mol.geometry(np_out=True)
+    mass = np.array([mol.mass(at) for at in range(mol.natom())])
+    heavy = np.where([mol.Z(at) == 1 for at in range(mol.natom())], 2.014101778, mass)
+    hesses = [springs(geom, k=k)[2] for k in [0.3, 0.4, 0.5]]
+
+    hess_batch = qcdb.vib.harmonic_analysis_batch(hesses, geom, mass, mol, mol.irrep_labels())
+    mass_batch = qcdb.vib.harmonic_analysis_batch(hesses[1], geom, [mass, heavy], mol, mol.irrep_labels())
+
+    assert compare_integers(3, len(hess_batch), "Hessian batch")
+    assert compare_integers(2, len(mass_batch), "mass batch")
+    for vibinfos, hess, m in zip([hess_batch, mass_batch], [hesses, [hesses[1]] * 2], [[mass] * 3, [mass, heavy]]):
+        for vibinfo, h, mm in zip(vibinfos, hess, m):
+            ref, _ = qcdb.vib.harmonic_analysis(h, geom, mm, mol, mol.irrep_labels())
+            assert compare(list(ref["TRV"].data), list(vibinfo["TRV"].data), "batch member TRV")
+            # translations & rotations are degenerate noise, so compare only vibrations
+            for field in ["omega", "mu", "k", "q", "x"]:
+                ref_vibs, vibs = ref[field].data[..., 6:].real, vibinfo[field].data[..., 6:].real
+                assert compare_values(ref_vibs, vibs, 8, f"batch member {field}")
+            assert compare(list(ref["gamma"].data), list(vibinfo["gamma"].data), "batch member irreps")
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+import qcelemental as qcel
+
+import qcdb
+from qcdb.driver import scan_driver
+
+from .utils import *
+
+h2o = """
+O
+H 1 R
+H 1 R 2 A
+
+R = 1.0
+A = 104.5
+"""
+
+
+def fake_energy(name, molecule, return_wfn=False, keywords=None, seed=None, **kwargs):
+    """Stand-in for ``energy`` that is harmonic in the OH distances [a0] and the HOH angle [rad]."""
+
+    geom = molecule.geometry(np_out=True)
+    r1, r2 = np.linalg.norm(geom[1:] - geom[0], axis=1)
+    cosa = np.dot(geom[1] - geom[0], geom[2] - geom[0]) / (r1 * r2)
+    ene = (r1 - 1.8) ** 2 + (r2 - 1.8) ** 2 + 0.1 * (np.arccos(cosa) - 1.8) ** 2
+
+    return ene, {"qcvars": {"CURRENT ENERGY": qcel.Datum("CURRENT ENERGY", "Eh", ene)}, "seed": seed, "r": r1}
+
+
+def ref_energy(R, A):
+    r = R / qcel.constants.bohr2angstroms
+    return 2 * (r - 1.8) ** 2 + 0.1 * (np.radians(A) - 1.8) ** 2
+
+
+@pytest.mark.parametrize("pool", ["serial", "thread", "process"])
+def test_scan(pool, monkeypatch):
+    monkeypatch.setattr(scan_driver, "energy", fake_energy)
+    mol = qcdb.Molecule(h2o)
+    rvals = np.linspace(0.8, 1.2, 7)
+
+    values, energies = qcdb.scan("hf", mol, variable="R", values=rvals, executor=pool, max_workers=3)
+
+    assert compare_values(rvals, values, 12, "values in order")
+    assert compare_values(ref_energy(rvals, 104.5), energies, 10, "energies in order")
+    assert compare_values(1.0, mol.get_variable("R"), 12, "molecule untouched")
+
+
+def test_scan_two_variables(monkeypatch):
+    monkeypatch.setattr(scan_driver, "energy", fake_energy)
+    grid = np.array([[R, A] for R in [0.9, 1.0, 1.1] for A in [100.0, 110.0]])
+
+    values, energies, jobrecs = qcdb.scan(
+        "hf", qcdb.Molecule(h2o), variable=["R", "A"], values=grid, executor="thread", return_wfn=True
+    )
+
+    assert compare_values(ref_energy(grid[:, 0], grid[:, 1]), energies, 10, "energies on grid")
+    assert compare(6, len(jobrecs), "jobrecs")
+
+
+def test_scan_iter_guess(monkeypatch):
+    monkeypatch.setattr(scan_driver, "energy", fake_energy)
+    rvals = np.linspace(0.8, 1.2, 9)
+
+    def guess(jobrec):
+        return {"seed": jobrec["r"]}
+
+    points = list(
+        qcdb.driver.scan_iter("hf", qcdb.Molecule(h2o), "R", rvals, guess=guess, executor="thread", max_workers=3)
+    )
+
+    assert compare(list(range(9)), sorted(point[0] for point in points), "all points")
+    seeds = {idx: jobrec["seed"] for idx, _, _, jobrec in points}
+    # three stretches of three points, each after the first seeded from its predecessor
+    assert compare([0, 3, 6], [idx for idx in range(9) if seeds[idx] is None], "stretch heads")
+    for idx in [1, 2, 4, 5, 7, 8]:
+        assert compare_values(rvals[idx - 1] / qcel.constants.bohr2angstroms, seeds[idx], 10, f"seed of {idx}")
+
+
+def test_scan_bad_variable():
+    with pytest.raises(qcdb.ValidationError):
+        qcdb.scan("hf", qcdb.Molecule(h2o), variable="D", values=[1.0, 2.0])
+
+
+def test_scan_iter_guess_options(monkeypatch):
+    from qcdb.driver import load_proc_table  # populate procedures before patching
+    from qcdb.driver.proc_table import procedures
+
+    seen = {}
+
+    def fake_procedure(name, molecule, options, ptype, **kwargs):
+        ene, jobrec = fake_energy(name, molecule)
+        seen[round(jobrec["r"], 8)] = options.scroll["QCDB"]["WRITER_FILE_LABEL"].value
+        return jobrec
+
+    monkeypatch.setitem(procedures["energy"]["psi4"], "hf", fake_procedure)
+    qcdb.driver.pe.clean_options()
+    qcdb.driver.pe.load_options()
+    rvals = np.linspace(0.8, 1.2, 6)
+
+    def guess(jobrec):
+        return {"options": {"writer_file_label": f"from-{jobrec['r']:.6f}"}}
+
+    points = list(
+        qcdb.driver.scan_iter("hf", qcdb.Molecule(h2o), "R", rvals, guess=guess, executor="thread", max_workers=2)
+    )
+
+    assert compare(6, len(points), "all points")
+    rs = [round(R / qcel.constants.bohr2angstroms, 8) for R in rvals]
+    # two stretches of three points, each after the first run with the options its predecessor guessed
+    for idx in range(6):
+        expected = "" if idx in [0, 3] else f"from-{rs[idx - 1]:.6f}"
+        assert compare(expected, seen[rs[idx]], f"options of {idx}")
+    assert qcdb.driver.pe.nu_options.scroll["QCDB"]["WRITER_FILE_LABEL"].value == ""
@@ -0,0 +1,169 @@
+import os
+
+import numpy as np
+import pytest
+import qcelemental as qcel
+
+import qcdb
+from qcdb.driver import driver_util, findif_scheduler
+
+from .utils import *
+
+
+def gradient(name, **kwargs):
+    pass
+
+
+def findif_plan(ndisp=6):
+    rng = np.random.default_rng(7)
+    return {
+        "reference": {"geometry": rng.random(6)},
+        "displacements": {f"{i}: -1": {"geometry": rng.random(6)} for i in range(ndisp)},
+    }
+
+
+@pytest.fixture
+def fake_displacement(monkeypatch):
+    calls = []
+
+    def _process_displacement(derivfunc, method, molecule, displacement, n, ndisp, **kwargs):
+        if n in fail:
+            raise RuntimeError(f"node lost at displacement {n}")
+        calls.append(n)
+        geom = np.asarray(displacement["geometry"])
+        qcvars = {
+            "CURRENT ENERGY": qcel.Datum("CURRENT ENERGY", "Eh", float(np.sum(geom))),
+            "CURRENT GRADIENT": qcel.Datum("CURRENT GRADIENT", "Eh/a0", 2.0 * geom.reshape(-1, 3)),
+        }
+        return {"qcvars": qcvars, "extras": {"qcdb:options": None}, "local_options": kwargs.get("local_options")}
+
+    fail = set()
+    monkeypatch.setattr(driver_util, "_process_displacement", _process_displacement)
+    return calls, fail
+
+
+@pytest.mark.parametrize("pool", [None, "thread", "process"])
+def test_run_displacements(fake_displacement, pool):
+    calls, _ = fake_displacement
+    plan = findif_plan()
+
+    ref = findif_scheduler.run_displacements(
+        gradient, "hf", None, plan, execopts={"executor": pool, "max_workers": 3, "memory_per_job": 0.5}
+    )
+
+    if pool != "process":
+        assert sorted(calls) == list(range(1, 8))
+    assert ref["local_options"] == {"memory": 0.5}
+    for disp in [plan["reference"], *plan["displacements"].values()]:
+        assert compare_values(np.sum(disp["geometry"]), disp["energy"], 12, "disp energy")
+        assert compare_arrays(2.0 * disp["geometry"].reshape(-1, 3), disp["gradient"], 12, "disp gradient")
+
+
+def test_resume_from_checkpoint(fake_displacement, tmp_path):
+    calls, fail = fake_displacement
+
+    fail.add(4)
+    with pytest.raises(RuntimeError):
+        findif_scheduler.run_displacements(gradient, "hf", None, findif_plan(), checkpoint=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 6
+
+    fail.clear()
+    calls.clear()
+    plan = findif_plan()
+    ref = findif_scheduler.run_displacements(gradient, "hf", None, plan, checkpoint=str(tmp_path))
+
+    assert calls == [4]
+    assert compare_values(np.sum(plan["reference"]["geometry"]), ref["qcvars"]["CURRENT ENERGY"].data, 12, "ref")
+    for disp in plan["displacements"].values():
+        assert compare_arrays(2.0 * disp["geometry"].reshape(-1, 3), disp["gradient"], 12, "disp gradient")
+
+    # changed geometry invalidates the stored displacement
+    calls.clear()
+    plan = findif_plan()
+    plan["displacements"]["0: -1"]["geometry"] = plan["displacements"]["0: -1"]["geometry"] + 1.0e-4
+    findif_scheduler.run_displacements(gradient, "hf", None, plan, checkpoint=str(tmp_path))
+
+    assert calls == [2]
+
+
+def test_checkpoint_of_other_computation(fake_displacement, tmp_path):
+    calls, _ = fake_displacement
+    keywords = qcdb.keywords.Keywords()
+    keywords.add("QCDB", qcdb.keywords.Keyword(keyword="basis", default="", validator=lambda x: x.upper()))
+    keywords.require("QCDB", "BASIS", "cc-pvdz", 1234)
+
+    findif_scheduler.run_displacements(gradient, "hf", None, findif_plan(), checkpoint=str(tmp_path), keywords=keywords)
+    assert len(calls) == 7
+
+    # same everything reuses all displacements
+    calls.clear()
+    findif_scheduler.run_displacements(gradient, "hf", None, findif_plan(), checkpoint=str(tmp_path), keywords=keywords)
+    assert calls == []
+
+    # changed method invalidates all stored displacements
+    findif_scheduler.run_displacements(
+        gradient, "mp2", None, findif_plan(), checkpoint=str(tmp_path), keywords=keywords
+    )
+    assert sorted(calls) == list(range(1, 8))
+
+    # as do changed keywords
+    calls.clear()
+    keywords.require("QCDB", "BASIS", "cc-pvtz", 1234)
+    findif_scheduler.run_displacements(
+        gradient, "mp2", None, findif_plan(), checkpoint=str(tmp_path), keywords=keywords
+    )
+    assert sorted(calls) == list(range(1, 8))
+
+
+def test_checkpoint_of_other_charge(fake_displacement, tmp_path):
+    calls, _ = fake_displacement
+    neutral = qcdb.Molecule("H\nH 1 0.74")
+    cation = qcdb.Molecule("1 2\nH\nH 1 0.74")
+
+    findif_scheduler.run_displacements(gradient, "hf", neutral, findif_plan(), checkpoint=str(tmp_path))
+    assert len(calls) == 7
+
+    calls.clear()
+    findif_scheduler.run_displacements(
+        gradient, "hf", qcdb.Molecule("H\nH 1 0.74"), findif_plan(), checkpoint=str(tmp_path)
+    )
+    assert calls == []
+
+    # changed charge alone invalidates all stored displacements
+    findif_scheduler.run_displacements(gradient, "hf", cation, findif_plan(), checkpoint=str(tmp_path))
+    assert sorted(calls) == list(range(1, 8))
+
+
+@pytest.mark.parametrize("driver,dertype", [("gradient", 0), ("hessian", 1)])
+def test_private_keywords_reach_displacements(driver, dertype, monkeypatch):
+    from qcdb.driver import load_proc_table  # populate procedures before patching
+    from qcdb.driver.proc_table import procedures
+
+    seen = []
+
+    def fake_procedure(name, molecule, options, ptype, **kwargs):
+        seen.append(options.scroll["QCDB"]["BASIS"].value)
+        geom = molecule.geometry(np_out=True)
+        bond = geom[1] - geom[0]
+        r = np.linalg.norm(bond)
+        grad = (r - 1.4) / r * np.array([-bond, bond])
+        qcvars = {
+            "CURRENT ENERGY": qcel.Datum("CURRENT ENERGY", "Eh", 0.5 * (r - 1.4) ** 2),
+            "CURRENT GRADIENT": qcel.Datum("CURRENT GRADIENT", "Eh/a0", grad),
+        }
+        return {"qcvars": qcvars, "molecule": molecule.to_schema(dtype=2)}
+
+    monkeypatch.setitem(procedures["energy"]["psi4"], "hf", fake_procedure)
+    monkeypatch.setitem(procedures["gradient"]["psi4"], "hf", fake_procedure)
+
+    qcdb.driver.pe.clean_options()
+    qcdb.driver.pe.load_options()
+    keywords = qcdb.driver.pe.nu_options.fork()
+    keywords.require("QCDB", "BASIS", "cc-pvtz", 1234)
+
+    mol = qcdb.Molecule("H\nH 1 0.74\nsymmetry c1")
+    getattr(qcdb, driver)("hf", molecule=mol, keywords=keywords, dertype=dertype)
+
+    assert len(seen) > 1
+    assert set(seen) == {"CC-PVTZ"}
+    assert qcdb.driver.pe.nu_options.scroll["QCDB"]["BASIS"].value == ""
@@ -0,0 +1,62 @@
+import types
+
+import numpy as np
+import pytest
+import qcelemental as qcel
+
+from qcdb.programs.gamess import germinate
+
+from .utils import *
+
+ch4_geom = [[0.0, 0.0, 0.0], [0.63, 0.63, 0.63], [-0.63, -0.63, 0.63], [-0.63, 0.63, -0.63], [0.63, -0.63, -0.63]]
+
+
+def rigidly_moved(kmol, seed):
+    rng = np.random.default_rng(seed)
+    rot, _ = np.linalg.qr(rng.normal(size=(3, 3)))
+    rot *= np.linalg.det(rot)
+    geom = kmol.geometry @ rot + rng.normal(size=3)
+    return kmol.copy(update={"geometry": geom})
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """Stand-in for GAMESS ``exetyp=check`` runs, returning the molecule in an arbitrary frame and accepting the
+    first trial unique atoms."""
+
+    calls = []
+
+    def fake_compute(atin, program, **kwargs):
+        calls.append(atin.molecule)
+        return types.SimpleNamespace(molecule=rigidly_moved(atin.molecule, len(calls)))
+
+    monkeypatch.setattr(germinate, "_master_frame_cache", {})
+    harness = types.SimpleNamespace(execute=lambda gamessrec: calls.append(gamessrec) or (True, {"stdout": ""}))
+    monkeypatch.setattr(germinate.qcng, "get_program", lambda name: harness)
+    monkeypatch.setattr(germinate.qcng, "compute", fake_compute)
+    return calls
+
+
+def test_master_frame_cached(probes):
+    kmol = qcel.models.Molecule(
+        symbols=["C", "H", "H", "H", "H"], geometry=np.array(ch4_geom) / qcel.constants.bohr2angstroms
+    )
+
+    mf_kmol, data = germinate.get_master_frame(kmol, None)
+    assert compare(2, len(probes), "probe runs")
+    assert compare("Td", data["symmetry_card"], "symmetry card")
+
+    # same molecule, placed differently, joins the master frame without probe
+    for seed in [10, 11]:
+        mf2_kmol, data2 = germinate.get_master_frame(rigidly_moved(kmol, seed), None)
+        assert compare_values(mf_kmol.geometry, mf2_kmol.geometry, 6, f"same master frame {seed}")
+        assert compare(data, data2, "same unique atoms")
+    assert compare(2, len(probes), "probe runs skipped")
+
+    data2["unique"].append(3)
+    assert compare(data["unique"], germinate.get_master_frame(kmol, None)[1]["unique"], "cache isolated")
+
+    # different molecule probed afresh
+    stretched = kmol.copy(update={"geometry": kmol.geometry * 1.01})
+    germinate.get_master_frame(stretched, None)
+    assert compare(4, len(probes), "new probe runs")
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+import qcdb
+from qcdb.basisset.libmintsbasissetparser import Gaussian94BasisSetParser, gbs_index
+
+from .utils import *
+
+gbs = """cartesian
+
+****
+H     0
+S   2   1.00
+      1.3000000              0.5000000
+      0.1220000              0.5000000
+****
+RB     0
+S   1   1.00
+      0.5000000              1.0000000
+****
+
+RB     0
+RB-ECP     1     28
+s-ul potential
+  1
+2      5.0365510             89.5001980
+p-ul potential
+  1
+2      4.2583410             58.5689740
+"""
+
+
+def shellinfo(shells):
+    return [(shell.am(), shell.exps(), shell.coefs(), shell.is_pure()) for shell in shells]
+
+
+@pytest.mark.parametrize("entry", ["H", "RB", "HE"])
+def test_parse_file(tmp_path, entry):
+    fl = str(tmp_path / "tiny.gbs")
+    with open(fl, "w") as handle:
+        handle.write(gbs)
+    parser = Gaussian94BasisSetParser()
+
+    ref = parser.parse(entry, parser.load_file(fl))
+    ans = parser.parse_file(entry, fl)
+
+    assert compare(["H", "RB"], sorted(gbs_index(fl)), "entries")
+    if ref[0] is None:
+        assert ans == (None, None, None, None, None)
+    else:
+        assert compare_recursive(shellinfo(ref[0]), shellinfo(ans[0]), "shells")
+        assert compare_recursive(shellinfo(ref[2]), shellinfo(ans[2]), "ecp shells")
+        assert compare_recursive(ref[1::2], ans[1::2], "line numbers and ncore")
+
+
+def test_parse_file_invalidate(tmp_path):
+    fl = str(tmp_path / "tiny.gbs")
+    with open(fl, "w") as handle:
+        handle.write(gbs)
+    parser = Gaussian94BasisSetParser()
+
+    shells = parser.parse_file("H", fl)[0]
+    assert compare(2, len(shells[0].exps()), "cached nprim")
+    assert parser.parse_file("H", fl)[0][0] is shells[0]
+
+    with open(fl, "w") as handle:
+        handle.write(gbs.replace("S   2   1.00\n      1.3000000              0.5000000\n", "S   1   1.00\n"))
+    os.utime(fl, ns=(0, os.stat(fl).st_mtime_ns + 1_000_000_000))
+
+    assert compare(1, len(parser.parse_file("H", fl)[0][0].exps()), "reparsed nprim")
+    assert compare(False, shells[0].is_pure(), "cartesian header")
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import qcelemental as qcel
 
@@ -73,6 +74,51 @@ def test_mints4():
     assert compare_values(refGEOM, geom_now, 6, "Bz-H3O+: geometry and orientation")
 
 
+def test_mints4_scan_geometries():
+    # hydronium zmatrix-placed over a Cartesian triangle, as in test_mints4
+    mol = qcdb.Molecule(
+        """
+    1 1
+    He   0.0   0.0   1.0
+    He   0.0   0.866 -0.5
+    He   0.0  -0.866 -0.5
+    X  1  1.0  3  30   2  0.
+    O  4 R   1  90   2  90
+    H  5 OH  4 TDA  1  0
+    H  5 OH  6 TDA  4 A1
+    H  5 OH  6 TDA  4 -A1
+
+    A1    = 120.0
+    OH    = 1.05
+    R     = 4.0
+    units angstrom
+    """
+    )
+    mol.update_geometry()
+
+    scan = mol.scan_geometries(["R", "A1"], [[4.0, 120.0], [5.0, 120.0], [6.0, 100.0]])
+
+    assert compare((3, 7, 3), scan.shape, "scan shape")
+    distances = np.linalg.norm(scan[:, :, None] - scan[:, None, :], axis=3)
+    geom = mol.geometry(np_out=True)
+    assert compare_values(np.linalg.norm(geom[:, None] - geom[None, :], axis=2), distances[0], 8, "scan frame")
+    assert compare_values(
+        np.array([4.0, 5.0, 6.0]) / qcel.constants.bohr2angstroms,
+        np.linalg.norm(scan[:, 3] - scan[:, :3].mean(axis=1), axis=1),
+        8,
+        "scanned R",
+    )
+
+    mol.fix_com(True)
+    mol.fix_orientation(True)
+    for R, A1, geom in zip([5.0, 6.0], [120.0, 100.0], scan[1:]):
+        mol.set_geometry_variable("R", R)
+        mol.set_geometry_variable("A1", A1)
+        mol.lock_frame = False
+        mol.update_geometry()
+        assert compare_values(mol.geometry(np_out=True), geom, 8, f"R={R} geometry")
+
+
 @pytest.mark.parametrize(
     "program,keywords",
     [
@@ -922,6 +922,100 @@ def test_molsymm_alone(subject):
         assert compare_values(refgeomang, geom_now, pg + " orientation", atol=1.0e-6)
 
 
+@pytest.mark.parametrize(
+    "lattice,d2h,pg,nunique",
+    [
+        pytest.param((2.0, 2.0, 2.0), "d2h", "Oh", 64, id="cube"),
+        pytest.param((2.1, 2.6, 3.1), "d2h", "D2h", 64, id="box"),
+        pytest.param((2.1, 2.1, 3.1), "d2h", "D4h", 64, id="tetragonal"),
+    ],
+)
+def test_molsymm_cluster(lattice, d2h, pg, nunique):
+    # 343-atom rock salt cluster, big enough that symmetry detection must not scale as pairs x atoms
+    ticks = np.arange(7) - 3
+    molstr = "\n".join(
+        f"{'Ne' if (i + j + k) % 2 else 'Ar'} {i * lattice[0]} {j * lattice[1]} {k * lattice[2]}"
+        for i in ticks
+        for j in ticks
+        for k in ticks
+    )
+    symmol = qcdb.Molecule(molstr + "\nunits bohr\nno_com")
+    symmol.update_geometry()
+
+    assert compare(d2h, symmol.schoenflies_symbol(), "D2h subgroup")
+    assert compare(pg, symmol.get_full_point_group(), "point group")
+    assert compare(nunique, symmol.nunique(), "unique atoms")
+    assert compare(True, symmol.is_symmetry_operation(np.diag([-1.0, 1.0, 1.0])), "sigma_yz")
+    assert compare(False, symmol.is_symmetry_operation(-np.identity(3), origin=[0.1, 0.0, 0.0]), "shifted i")
+
+
+def test_molsymm_lazy():
+    symmol = qcdb.Molecule(data["singlet_ethylene"]["mol"].format(isoA=""))
+    symmol.update_geometry()
+    assert symmol.symmetry_pending
+
+    assert compare("d2h", symmol.schoenflies_symbol(), "point group on access")
+    assert compare("D2h", symmol.get_full_point_group(), "full point group on access")
+    assert not symmol.symmetry_pending
+
+    # displacing one H drops the symmetry plane through the Hs
+    geom = symmol.geometry(np_out=True)
+    geom[2] += [0.1, 0.1, 0.1]
+    symmol.set_geometry(geom)
+    assert symmol.symmetry_pending
+    assert compare("c1", symmol.schoenflies_symbol(), "point group after set_geometry")
+    assert compare("C1", symmol.get_full_point_group(), "full point group after set_geometry")
+
+
+def test_molsymm_skip():
+    refmol = qcdb.Molecule(data["singlet_ethylene"]["mol"].format(isoA=""))
+    refmol.update_geometry()
+    molrec = refmol.to_dict()
+
+    symmol = qcdb.Molecule.from_dict(molrec, skip_symmetry=True)
+
+    assert compare(True, symmol.symmetry_skipped(), "skipped")
+    assert compare("c1", symmol.schoenflies_symbol(), "point group")
+    assert compare("C1", symmol.get_full_point_group(), "full point group")
+    assert compare(symmol.natom(), symmol.nunique(), "unique atoms")
+    # frame from refmol is kept, not recomputed
+    assert compare_values(refmol.geometry(np_out=True), symmol.geometry(np_out=True), atol=1.0e-10)
+
+
+def test_molecule_array_core():
+    refmol = qcdb.Molecule(data["singlet_ethylene"]["mol"].format(isoA=""))
+    refmol.update_geometry()
+    molrec = refmol.to_dict()
+    molrec["real"][-1] = False
+    molrec["fix_com"] = molrec["fix_orientation"] = True
+
+    arrmol = qcdb.Molecule.from_dict(molrec)
+
+    assert arrmol.core is not None
+    assert compare(6, len(arrmol.core), "core atoms")
+    assert compare_values(refmol.geometry(np_out=True), arrmol.geometry(np_out=True), atol=1.0e-10)
+    assert compare_values([refmol.mass(at) for at in range(6)], [arrmol.mass(at) for at in range(6)], atol=1.0e-10)
+    assert compare(["C", "C", "H", "H", "H", "H"], [arrmol.fsymbol(at) for at in range(6)], "symbols")
+    assert compare(0, arrmol.Z(5), "ghost Z")
+
+    # entries are views into the core
+    geom = arrmol.geometry(np_out=True)
+    geom[0, 2] += 0.2
+    arrmol.set_geometry(geom)
+    assert compare_values(geom, arrmol.geometry(np_out=True), atol=1.0e-10)
+    assert compare_values(geom[0], arrmol.xyz(0, np_out=True), atol=1.0e-10)
+
+    copymol = arrmol.clone()
+    assert copymol.core is not arrmol.core
+    assert compare_values(geom, copymol.geometry(np_out=True), atol=1.0e-10)
+
+    # any non-array atom expands the core
+    arrmol.add_atom(2, 0.0, 0.0, 10.0, "He", 4.002602, 2.0)
+    assert arrmol.core is None
+    assert compare(7, arrmol.natom(), "expanded atoms")
+    assert compare_values(geom, arrmol.geometry(np_out=True)[:6], atol=1.0e-10)
+
+
 @pytest.mark.parametrize("subject", [subject for subject in data.keys() if not subject.startswith("iso")])
 @pytest.mark.parametrize(
     "qcprog",
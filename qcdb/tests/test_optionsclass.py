@@ -279,3 +279,153 @@ def test_alias_e(alias_setup):
         alias_setup.add_alias("qcdb", AliasKeyword(alias="freeze__core", target="melt__core"))
 
     assert "Keyword alias must not share a name with keyword proper" in str(e.value)
+
+
+@pytest.fixture
+def fork_setup():
+    subjects = Keywords()
+    subjects.add("qcdb", Keyword(keyword="memory", default="700 mb", validator=parsers.parse_memory))
+    subjects.add("qcdb", Keyword(keyword="reference", default="rhf", validator=parsers.enum("RHF UHF ROHF")))
+    subjects.add("dftd3", Keyword(keyword="opt1", default=6, validator=validator))
+    subjects.require("qcdb", "memory", "4 gb", Keywords.mark_of_the_user)
+
+    return subjects
+
+
+def test_fork_a(fork_setup):
+    fork = fork_setup.fork()
+    fork.require("qcdb", "reference", "uhf", 1234)
+    fork_setup.suggest("dftd3", "opt1", 8, 1234)
+
+    assert fork.scroll["QCDB"]["REFERENCE"].value == "UHF"
+    assert fork_setup.scroll["QCDB"]["REFERENCE"].value == "RHF"
+    assert fork.scroll["DFTD3"]["OPT1"].value == 6
+    assert fork_setup.scroll["DFTD3"]["OPT1"].value == 8
+
+    # untouched keywords shared, not copied
+    assert fork.scroll["QCDB"]["MEMORY"] is fork_setup.scroll["QCDB"]["MEMORY"]
+    assert fork.scroll["QCDB"]["MEMORY"].value == 4000000000
+
+
+def test_fork_b(fork_setup):
+    fork = fork_setup.fork()
+    fork.require("qcdb", "reference", "uhf", 1234)
+    fork_setup.unwind_by_accession(Keywords.mark_of_the_user)
+    fork.unwind_by_accession(1234)
+
+    assert fork.scroll["QCDB"]["REFERENCE"].value == "RHF"
+    assert fork.scroll["QCDB"]["MEMORY"].value == 4000000000
+    assert fork_setup.scroll["QCDB"]["MEMORY"].value == 700000000
+
+
+def test_fork_merge(fork_setup):
+    fork = fork_setup.fork()
+    fork.require("qcdb", "reference", "uhf", 1234)
+    fork_setup.merge(fork)
+
+    assert fork_setup.scroll["QCDB"]["REFERENCE"].value == "UHF"
+
+    # merged keyword shared, so copied again upon change in either
+    fork.suggest("qcdb", "reference", "rohf", 2345)
+    assert fork_setup.scroll["QCDB"]["REFERENCE"].value == "UHF"
+    fork_setup.require("qcdb", "reference", "rhf", 3456)
+    assert fork.scroll["QCDB"]["REFERENCE"].value == "UHF"
+
+
+def test_fork_pickle(fork_setup):
+    import pickle
+
+    fork = fork_setup.fork()
+    fork.require("qcdb", "reference", "uhf", 1234)
+    fork.fork().suggest("dftd3", "opt1", 7, 1234)
+
+    # closure validators not pickled but recovered from keyword set forked from
+    payload = pickle.dumps(fork)
+    assert "UHF" in str(payload) and "MEMORY" not in str(payload)
+
+    unpickled = pickle.loads(payload)
+    assert unpickled.scroll["QCDB"]["REFERENCE"].value == "UHF"
+    assert unpickled.scroll["QCDB"]["MEMORY"].value == 4000000000
+    assert unpickled.scroll["DFTD3"]["OPT1"].value == 6
+
+    with pytest.raises(qcdb.KeywordValidationError):
+        unpickled.require("qcdb", "reference", "cuhf", 1234)
+
+    # unchanged keywords would be stale
+    fork_setup.require("dftd3", "opt1", 9, 1234)
+    with pytest.raises(qcdb.ValidationError):
+        pickle.loads(payload)
+
+
+def test_value_memo():
+    subject = Keyword(keyword="opt1", default=6, validator=validator)
+    subject.suggest(7, accession=1234)
+    assert subject.value == 7
+    assert subject._compute() is subject._compute()
+
+    subject.require(8, accession=Keywords.mark_of_the_user)
+    assert subject.value == 8
+    subject.require(9, accession=2345)
+    with pytest.raises(qcdb.KeywordReconciliationError):
+        subject.value
+
+    subject.history = subject.history[:-1]
+    assert subject.value == 8
+
+
+def test_disputed(fork_setup):
+    assert list(fork_setup.disputed("qcdb")) == ["MEMORY"]
+    assert fork_setup.disputed("dftd3") == {}
+
+    fork = fork_setup.fork()
+    fork.suggest("dftd3", "opt1", 7, 1234)
+    assert list(fork.disputed("DFTD3")) == ["OPT1"]
+    assert fork.disputed("DFTD3")["OPT1"].value == 7
+    assert fork_setup.disputed("dftd3") == {}
+
+    fork.unwind_by_accession(1234)
+    fork.unwind_by_accession(Keywords.mark_of_the_user)
+    assert fork.disputed("qcdb") == {} and fork.disputed("dftd3") == {}
+    assert list(fork_setup.disputed("qcdb")) == ["MEMORY"]
+
+    for subjects in [fork_setup, fork]:
+        assert {
+            pkg: sorted(key for key, okey in subjects.scroll[pkg].items() if okey.disputed()) for pkg in subjects.scroll
+        } == {pkg: sorted(subjects.disputed(pkg)) for pkg in subjects.scroll}
+
+
+def test_disputed_removed(fork_setup):
+    fork = fork_setup.fork()
+    fork.require("qcdb", "reference", "uhf", 1234)
+    okey = fork.remove("qcdb", "memory")
+
+    assert okey.value == 4000000000
+    assert list(fork.disputed("qcdb")) == ["REFERENCE"]
+    assert list(fork_setup.disputed("qcdb")) == ["MEMORY"]
+
+    # keys dropped without the Keywords knowing are skipped, too
+    fork_setup.scroll["QCDB"].pop("MEMORY")
+    assert fork_setup.disputed("qcdb") == {}
+
+
+def test_disputed_psi4_build_input():
+    from qcelemental.models import AtomicInput
+    from qcengine.config import get_config
+
+    from qcdb.programs.psi4.runner import QcdbPsi4Harness
+
+    subjects = Keywords()
+    qcdb.driver.pe.load_program_options(subjects)
+    subjects.require("qcdb", "scf_type", "pk", Keywords.mark_of_the_user)
+    atin = AtomicInput(
+        driver="energy",
+        model={"method": "hf", "basis": "cc-pvdz"},
+        molecule=qcdb.Molecule("He").to_schema(dtype=2),
+        extras={"qcdb:options": subjects.fork()},
+    )
+
+    input_data = QcdbPsi4Harness().qcdb_build_input(atin, get_config(task_config={"memory": 2, "ncores": 1}))
+
+    assert "MEMORY" not in input_data["keywords"]
+    assert input_data["keywords"]["SCF_TYPE"] == "PK"
+    assert "MEMORY" not in subjects.disputed("qcdb")
@@ -0,0 +1,82 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from qcengine.programs.util import PreservingDict
+
+import qcdb
+
+from .utils import *
+
+
+def mp2_components():
+    return PreservingDict(
+        {
+            "HF TOTAL ENERGY": Decimal("-76.0266327341"),
+            "MP2 SINGLES ENERGY": Decimal("0.0"),
+            "MP2 SAME-SPIN CORRELATION ENERGY": Decimal("-0.0534324101"),
+            "MP2 OPPOSITE-SPIN CORRELATION ENERGY": Decimal("-0.1511436208"),
+        }
+    )
+
+
+def test_build_out_chained():
+    """Totals need correlation energies that themselves need building, out of identity-list order."""
+
+    qcvars = mp2_components()
+    qcdb.qcvars.build_out(qcvars)
+
+    corl = Decimal("-0.0534324101") + Decimal("-0.1511436208")
+    assert compare_values(float(corl), float(qcvars["MP2 DOUBLES ENERGY"]), 10, "doubles")
+    assert compare_values(float(corl), float(qcvars["MP2 CORRELATION ENERGY"]), 10, "corl")
+    assert compare_values(-76.0266327341 + float(corl), float(qcvars["MP2 TOTAL ENERGY"]), 10, "total")
+    scs = Decimal(6) / Decimal(5) * Decimal("-0.1511436208") + Decimal(1) / Decimal(3) * Decimal("-0.0534324101")
+    assert compare_values(-76.0266327341 + float(scs), float(qcvars["SCS-MP2 TOTAL ENERGY"]), 10, "scs total")
+
+
+def test_build_out_reusable_solver():
+    solver = qcdb.qcvars.IdentitySolver(
+        [
+            {"form": "C", "func": sum, "args": ["A", "B"]},
+            {"form": "D", "func": sum, "args": ["C", Decimal(1)]},
+            {"form": "A", "func": lambda x: x[0] - x[1], "args": ["C", "B"]},
+        ]
+    )
+
+    for a in [1, 2]:
+        qcvars = PreservingDict({"A": a, "B": 10})
+        solver.solve(qcvars)
+        assert compare({"A": a, "B": 10, "C": a + 10, "D": a + 11}, {k: int(v) for k, v in qcvars.items()}, "solved")
+
+    qcvars = PreservingDict({"B": 10, "D": 5})
+    solver.solve(qcvars)
+    assert compare(["B", "D"], sorted(qcvars), "unsolvable untouched")
+
+
+def test_build_out_checks_given():
+    qcvars = mp2_components()
+    qcvars["MP2 CORRELATION ENERGY"] = Decimal("-0.3000000000")
+
+    with pytest.raises(ValueError):
+        qcdb.qcvars.build_out(qcvars)
+
+
+def test_certify_and_datumize():
+    qcvars = qcdb.qcvars.certify_and_datumize(
+        {
+            "SCS-MP2-VDW TOTAL ENERGY": Decimal("-76.2"),
+            "CURRENT HESSIAN": np.arange(36.0),
+            "MP2 TOTAL GRADIENT": np.arange(6.0),
+            "CI ROOT 12 TOTAL ENERGY": Decimal("-76.1"),
+        },
+        plump=True,
+        nat=2,
+    )
+
+    assert compare("10.1080/00268970802641242", qcvars["SCS-MP2-VDW TOTAL ENERGY"].doi, "doi")
+    assert compare((6, 6), qcvars["CURRENT HESSIAN"].data.shape, "hessian shape")
+    assert compare((2, 3), qcvars["MP2 TOTAL GRADIENT"].data.shape, "gradient shape")
+    assert compare("Eh", qcvars["CI ROOT 12 TOTAL ENERGY"].units, "templated name")
+
+    with pytest.raises(qcdb.ValidationError):
+        qcdb.qcvars.certify_and_datumize({"MP2.5 TOTAL ENERGYY": Decimal("-76.0")})
@@ -0,0 +1,92 @@
+import os
+
+import numpy as np
+import pytest
+from qcelemental.models import AtomicInput
+
+import qcdb
+from qcdb.driver import pe, result_cache
+
+from .utils import *
+
+
+def atomicinput(basis="cc-pvdz", shift=0.0, scf_type=None):
+    qmol = qcdb.Molecule(
+        """
+O 0 0 0
+H 0 0 1.8
+H 0 1.7 -0.5
+units bohr
+"""
+    )
+    qmol.update_geometry()
+    molschema = qmol.to_schema(dtype=2)
+    molschema["geometry"] = (np.array(molschema["geometry"]) + shift).tolist()
+
+    qcdb.driver.pe.clean_options()
+    qcdb.driver.pe.load_options()
+    if scf_type:
+        pe.nu_options.require("QCDB", "SCF_TYPE", scf_type, accession=1234)
+
+    return AtomicInput(
+        driver="energy",
+        model={"method": "hf", "basis": basis},
+        molecule=molschema,
+        extras={"qcdb:options": pe.nu_options},
+    )
+
+
+def fake_jobrec(ene):
+    return {"return_result": ene, "extras": {"qcdb:qcvars": {}, "qcdb:options": object()}}
+
+
+def test_key_stability(tmp_path):
+    cache = result_cache.ResultCache(tmp_path, geometry_tolerance=1.0e-6)
+
+    ref = cache.key(atomicinput(), "qcdb-psi4")
+
+    assert ref == cache.key(atomicinput(shift=1.0e-9), "qcdb-psi4")
+    assert ref != cache.key(atomicinput(shift=1.0e-3), "qcdb-psi4")
+    assert ref != cache.key(atomicinput(basis="cc-pvtz"), "qcdb-psi4")
+    assert ref != cache.key(atomicinput(scf_type="df"), "qcdb-psi4")
+    assert ref != cache.key(atomicinput(), "qcdb-cfour")
+
+
+def test_hit_miss(tmp_path):
+    cache = result_cache.ResultCache(tmp_path)
+
+    assert cache.get("abc") is None
+    cache.put("abc", fake_jobrec(-76.0))
+    jobrec = cache.get("abc")
+
+    assert compare_values(-76.0, jobrec["return_result"], 12, "cached energy")
+    assert "qcdb:options" not in jobrec["extras"]
+    assert cache.stats() | {"bytes": 0} == {"hits": 1, "misses": 1, "evictions": 0, "entries": 1, "bytes": 0}
+
+
+def test_lru_eviction(tmp_path):
+    cache = result_cache.ResultCache(tmp_path)
+    cache.put("first", fake_jobrec(-1.0))
+    cache.max_bytes = 2.5 * cache.stats()["bytes"]
+
+    cache.put("second", fake_jobrec(-2.0))
+    os.utime(cache._path("first"), (0, 0))
+    os.utime(cache._path("second"), (1, 1))
+    cache.get("first")  # touch, so "second" is now least recently used
+    cache.put("third", fake_jobrec(-3.0))
+
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("third") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 2
+
+
+def test_enable_disable(tmp_path):
+    cache = qcdb.enable_result_cache(tmp_path, max_bytes=2**20)
+    assert result_cache.active_cache is cache
+    assert cache.max_bytes == 2**20
+
+    qcdb.disable_result_cache()
+    assert result_cache.active_cache is None
+    assert os.path.isdir(tmp_path)
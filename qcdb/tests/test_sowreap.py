@@ -0,0 +1,127 @@
+import importlib
+import json
+import os
+
+import numpy as np
+import pytest
+import qcelemental as qcel
+
+import qcdb
+from qcdb.driver import pe, sowreap
+
+from .utils import *
+
+
+def findif_plan(ndisp=4):
+    rng = np.random.default_rng(11)
+    return {
+        "project_translations": True,
+        "reference": {"geometry": np.array([0.0, 0.0, 0.0, 0.0, 0.0, 1.4])},
+        "displacements": {f"{i}: -1": {"geometry": rng.random(6)} for i in range(ndisp)},
+    }
+
+
+@pytest.fixture
+def sowed(tmp_path):
+    pe.clean_options()
+    pe.load_options()
+    qcdb.set_options({"basis": "cc-pVDZ", "scf__d_convergence": 9, "scf_type": "pk"})
+    mol = qcdb.Molecule("H\nH 1 1.4\nunits bohr")
+    mol.update_geometry()
+
+    path = sowreap.sow("hf", mol, findif_plan(), str(tmp_path), keywords=pe.nu_options, package="psi4")
+
+    yield tmp_path, path
+    pe.clean_options()
+    pe.load_options()
+
+
+@pytest.fixture
+def fake_gradient(monkeypatch):
+    def gradient(name, molecule, return_wfn=False, **kwargs):
+        assert pe.nu_options.scroll["QCDB"]["SCF__D_CONVERGENCE"].value == 1.0e-9
+        geom = np.asarray(molecule.geometry(np_out=True))
+        qcvars = {
+            "CURRENT ENERGY": qcel.Datum("CURRENT ENERGY", "Eh", float(np.sum(geom))),
+            "CURRENT GRADIENT": qcel.Datum("CURRENT GRADIENT", "Eh/a0", 2.0 * geom),
+            "HF TOTAL ENERGY": qcel.Datum("HF TOTAL ENERGY", "Eh", float(np.sum(geom))),
+        }
+        return 2.0 * geom, {"qcvars": qcvars}
+
+    monkeypatch.setattr(importlib.import_module("qcdb.driver.gradient"), "gradient", gradient)
+
+
+def test_sow(sowed):
+    directory, path = sowed
+
+    with open(path) as handle:
+        manifest = json.load(handle)
+    assert manifest["method"] == "hf"
+    assert manifest["package"] == "psi4"
+    assert len(manifest["displacements"]) == 5
+    assert manifest["displacements"][0]["label"] == "reference"
+
+    atin = qcel.models.AtomicInput.parse_file(directory / "disp00003.in.json")
+    assert atin.driver == "gradient"
+    assert atin.model.basis == "CC-PVDZ"
+    assert atin.keywords["qcdb_scf__d_convergence"] == 1.0e-9
+    assert atin.keywords["qcdb_scf_type"] == "PK"
+    assert atin.extras["qcdb:displacement"] == "1: -1"
+    assert compare_arrays(findif_plan()["displacements"]["1: -1"]["geometry"], atin.molecule.geometry.ravel(), 12)
+
+
+def test_reap_missing(sowed, fake_gradient):
+    directory, _ = sowed
+
+    for n in [1, 2, 4]:
+        sowreap.compute_sown(str(directory / sowreap.input_filename(n)))
+
+    assert sowreap.missing_displacements(str(directory)) == ["disp00003.in.json", "disp00005.in.json"]
+    with pytest.raises(qcdb.MissingDisplacementsError) as err:
+        sowreap.reap(str(directory))
+    assert err.value.missing == ["disp00003.in.json", "disp00005.in.json"]
+
+
+def test_reap(sowed, fake_gradient):
+    directory, _ = sowed
+
+    for fl in sorted(os.listdir(directory)):
+        if fl.endswith(".in.json"):
+            sowreap.compute_sown(str(directory / fl))
+    atres = qcel.models.AtomicResult.parse_file(directory / "disp00001.out.json")
+    assert atres.success
+
+    plan, jobrec = sowreap.reap(str(directory))
+
+    assert sowreap.missing_displacements(str(directory)) == []
+    for disp in [plan["reference"], *plan["displacements"].values()]:
+        assert compare_values(np.sum(disp["geometry"]), disp["energy"], 12, "disp energy")
+        assert compare_arrays(2.0 * np.reshape(disp["geometry"], (-1, 3)), disp["gradient"], 12, "disp gradient")
+    assert plan["project_translations"] is True
+    assert compare_values(1.4, jobrec["qcvars"]["HF TOTAL ENERGY"].data, 12, "ref qcvar")
+    assert jobrec["qcvars"]["CURRENT GRADIENT"].data.shape == (2, 3)
+    assert jobrec["molecule"]["symbols"] == ["H", "H"]
+
+
+def test_reap_other_computation(sowed, fake_gradient):
+    directory, _ = sowed
+    for fl in sorted(os.listdir(directory)):
+        if fl.endswith(".in.json"):
+            sowreap.compute_sown(str(directory / fl))
+
+    mol = qcdb.Molecule("H 0 0 0\nH 0 0 1.4\nunits bohr\nno_com\nno_reorient")
+    mol.update_geometry()
+    plan, _ = sowreap.reap(str(directory), "HF", mol, package="psi4", derivfunc="gradient", irrep=-1)
+    assert compare_values(1.4, plan["reference"]["energy"], 12, "matching reap")
+
+    for args, kwargs, msg in [
+        (["mp2", mol], {}, "method 'mp2'"),
+        (["hf", mol], {"package": "cfour"}, "package 'cfour'"),
+        (["hf", mol], {"derivfunc": "energy"}, "driver 'energy'"),
+        (["hf", mol], {"irrep": 1}, "irrep 1"),
+        (["hf", qcdb.Molecule("H 0 0 0\nH 0 0 1.5\nunits bohr\nno_com\nno_reorient")], {}, "molecule"),
+        (["hf", qcdb.Molecule("He 0 0 0")], {}, "molecule"),
+    ]:
+        with pytest.raises(qcdb.ValidationError) as err:
+            sowreap.reap(str(directory), *args, **kwargs)
+        assert msg in str(err.value)
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+import qcelemental as qcel
+from qcelemental import Datum
+
+import qcdb
+
+from .utils import *
+
+
+def vibinfo_from_freqs(omega, nrt):
+    omega = np.asarray(omega, dtype=complex)
+    return {
+        "omega": Datum("frequency", "cm^-1", omega),
+        "theta_vib": Datum(
+            "char temp", "K", omega.real * 100 * qcel.constants.h * qcel.constants.c / qcel.constants.kb
+        ),
+        "TRV": Datum("translation/rotation/vibration", "", ["TR"] * nrt + ["V"] * (len(omega) - nrt), numeric=False),
+    }
+
+
+h2o = {
+    "vibinfos": vibinfo_from_freqs([0.0] * 6 + [1775.33, 4113.46, 4212.16], 6),
+    "multiplicity": 1,
+    "molecular_mass": 18.01056,
+    "E0": -76.0270535,
+    "sigma": 2,
+    "rot_const": np.array([27.26, 14.51, 9.47]),
+    "rotor_type": "RT_ASYMMETRIC_TOP",
+}
+co2 = {
+    "vibinfos": vibinfo_from_freqs([0.0] * 5 + [667.0, 667.0, 1333.0, 2349.0], 5),
+    "multiplicity": 1,
+    "molecular_mass": 43.98983,
+    "E0": -187.7,
+    "sigma": 2,
+    "rot_const": np.array([0.0, 0.39, 0.39]),
+    "rotor_type": "RT_LINEAR",
+}
+ts = {
+    "vibinfos": vibinfo_from_freqs([0.0] * 6 + [500.0j, 1200.0, 3000.0], 6),
+    "multiplicity": 2,
+    "molecular_mass": 30.0,
+    "E0": -100.0,
+    "sigma": 1,
+    "rot_const": np.array([2.0, 1.0, 0.8]),
+    "rotor_type": "RT_ASYMMETRIC_TOP",
+}
+
+temperatures = np.array([100.0, 298.15, 1500.0])
+pressures = np.array([1.0e4, 101325.0])
+
+
+@pytest.mark.parametrize("system", [h2o, co2, ts])
+def test_thermo_grid_vs_thermo(system):
+    grid = qcdb.vib.thermo_grid(T=temperatures, P=pressures, **system)
+
+    assert compare((3, 2), grid.shape, "grid shape")
+    for iT, T in enumerate(temperatures):
+        for iP, P in enumerate(pressures):
+            therminfo, _ = qcdb.vib.thermo(
+                system["vibinfos"], T=T, P=P, **{k: v for k, v in system.items() if k != "vibinfos"}
+            )
+            for field in qcdb.vib.thermo_dtype.names:
+                assert compare_values(therminfo[field].data, grid[field][iT, iP], 10, f"{field} at {T} K, {P} Pa")
+
+
+def test_thermo_grid_batch():
+    systems = [h2o, co2, ts]
+    batch = {key: [system[key] for system in systems] for key in h2o}
+
+    grid = qcdb.vib.thermo_grid(T=np.linspace(10.0, 3000.0, 50), P=pressures, **batch)
+
+    assert compare((3, 50, 2), grid.shape, "batch shape")
+    for imol, system in enumerate(systems):
+        ref = qcdb.vib.thermo_grid(T=np.linspace(10.0, 3000.0, 50), P=pressures, **system)
+        assert compare_values(ref["G_tot"], grid["G_tot"][imol], 12, f"member {imol} G")
+    # vibrations frozen out, not overflowing, at low temperature
+    assert np.all(np.isfinite(grid.view((float, len(qcdb.vib.thermo_dtype)))))
+    assert compare_values(0.0, grid["Cv_vib"][0, 0, 0], 10, "cold H2O Cv_vib")
+    # pressure enters only through the translational entropy
+    assert compare_values(grid["H_tot"][:, :, 0], grid["H_tot"][:, :, 1], 12, "H independent of P")
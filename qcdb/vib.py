@@ -7,9 +7,13 @@ import numpy as np
 import qcelemental as qcel
 from qcelemental import Datum
 
-from .molecule.libmintsmolecule import compute_atom_map
+from .driver.driver_findif import _orthonormalize, cdsalcs
+from .exceptions import ValidationError
+from .molecule.libmintsmolecule import LibmintsMolecule, compute_atom_map
 
 LINEAR_A_TOL = 1.0E-2  # tolerance (roughly max dev) for TR space
+UCONV_CM_1 = (np.sqrt(qcel.constants.na * qcel.constants.hartree2J * 1.0e19) /
+              (2 * np.pi * qcel.constants.c * qcel.constants.bohr2angstroms))  # sqrt(Eh/a0/a0/u) to cm^-1
 
 
 def compare_vibinfos(expected, computed, tol, label, verbose=1, forgive=None, required=None, toldict=None):
@@ -240,38 +244,27 @@ def _check_degen_modes(arr, freq, verbose=1):
 def _phase_cols_to_max_element(arr, tol=1.e-2, verbose=1):
     """Returns copy of 2D `arr` scaled such that, within cols, max(fabs)
     element is positive. If max(fabs) is pos/neg pair, scales so first
-    element (within `tol`) is positive.
+    element (within `tol`) is positive. A stack of 2D arrays is phased
+    matrix by matrix.
 
     """
-    arr2 = np.copy(arr)
+    absarr = np.absolute(arr)
 
-    rephasing = []
-    for v in range(arr.shape[1]):
-        vextreme = 0.0
-        iextreme = None
+    # find most extreme value, then the first index whose fabs equals that value, w/i tolerance
+    vextreme = np.max(absarr, axis=-2, keepdims=True)
+    iextreme = np.argmax((vextreme - absarr) < tol, axis=-2)
 
-        # find most extreme value
-        for varr in arr[:, v]:
-            vextreme = max(np.absolute(varr), vextreme)
-
-        # find the first index whose fabs equals that value, w/i tolerance
-        for iarr, varr in enumerate(arr[:, v]):
-            if (vextreme - np.absolute(varr)) < tol:
-                iextreme = iarr
-                break
-
-        sign = np.sign(arr[iextreme, v])
-        if sign == -1.:
-            rephasing.append(str(v))
-        arr2[:, v] *= sign
+    sign = np.sign(np.take_along_axis(arr, iextreme[..., None, :], axis=-2))
+    arr2 = arr * sign
 
+    rephasing = [str(v) for v in np.nonzero(sign.reshape(-1, arr.shape[-1]) == -1.)[-1]]
     if rephasing and verbose >= 2:
         print('Negative modes rephased:', ', '.join(rephasing))
 
     return arr2
 
 
-def harmonic_analysis(hess, geom, mass, basisset, irrep_labels, dipder=None, project_trans=True, project_rot=True):
+def harmonic_analysis(hess, geom, mass, molecule, irrep_labels, dipder=None, project_trans=True, project_rot=True):
     """Like so much other Psi4 goodness, originally by @andysim
 
     Parameters
@@ -282,8 +275,9 @@ def harmonic_analysis(hess, geom, mass, basisset, irrep_labels, dipder=None, pro
         (nat, 3) geometry [a0] at which Hessian computed.
     mass : ndarray of float
         (nat,) atomic masses [u].
-    basisset : psi4.core.BasisSet
-        Basis set object (can be dummy, e.g., STO-3G) for SALCs.
+    molecule : qcdb.Molecule
+        Molecule in the frame of `geom`, whose point group and atom map form the SALCs.
+        A psi4.core.BasisSet (can be dummy, e.g., STO-3G) is also accepted, in which case psi4 forms the SALCs.
     irrep_labels : list of str
         Irreducible representation labels.
     dipder : ndarray of float
@@ -342,8 +336,6 @@ def harmonic_analysis(hess, geom, mass, basisset, irrep_labels, dipder=None, pro
     >>> vibonly = filter_nonvib(vibinfo)
 
     """
-    from psi4 import core
-
     if (mass.shape[0] == geom.shape[0] == (hess.shape[0] // 3) == (hess.shape[1] // 3)) and (geom.shape[1] == 3):
         pass
     else:
@@ -356,12 +348,6 @@ def harmonic_analysis(hess, geom, mass, basisset, irrep_labels, dipder=None, pro
         ivrt = a.shape[0] - np.linalg.matrix_rank(a, tol=stol)
         return """  {:32} Symmetric? {}   Hermitian? {}   Lin Dep Dim? {:2}""".format(lbl + ':', symm, herm, ivrt)
 
-    def vec_in_space(vec, space, tol=1.0e-4):
-        merged = np.vstack((space, vec))
-        u, s, v = np.linalg.svd(merged)
-        return (s[-1] < tol)
-
-    vibinfo = {}
     text = []
 
     nat = len(mass)
@@ -377,15 +363,8 @@ def harmonic_analysis(hess, geom, mass, basisset, irrep_labels, dipder=None, pro
     nmwhess = hess.copy()
     text.append(mat_symm_info(nmwhess, lbl='non-mass-weighted Hessian') + ' (0)')
 
-    # get SALC object, possibly w/o trans & rot
-    mints = core.MintsHelper(basisset)
-    cdsalcs = mints.cdsalcs(0xFF, project_trans, project_rot)
-
-    Uh = collections.OrderedDict()
-    for h, lbl in enumerate(irrep_labels):
-        tmp = np.asarray(cdsalcs.matrix_irrep(h))
-        if tmp.size > 0:
-            Uh[lbl] = tmp
+    # get SALCs, possibly w/o trans & rot
+    Uh = _irrep_salcs(molecule, irrep_labels, mass, project_trans, project_rot)
 
     # form projector of translations and rotations
     space = ('T' if project_trans else '') + ('R' if project_rot else '')
@@ -410,9 +389,7 @@ def harmonic_analysis(hess, geom, mass, basisset, irrep_labels, dipder=None, pro
 
     idx = np.argsort(pre_force_constant_au)
     pre_force_constant_au = pre_force_constant_au[idx]
-    uconv_cm_1 = (np.sqrt(qcel.constants.na * qcel.constants.hartree2J * 1.0e19) /
-                  (2 * np.pi * qcel.constants.c * qcel.constants.bohr2angstroms))
-    pre_frequency_cm_1 = np.lib.scimath.sqrt(pre_force_constant_au) * uconv_cm_1
+    pre_frequency_cm_1 = np.lib.scimath.sqrt(pre_force_constant_au) * UCONV_CM_1
 
     pre_lowfreq = np.where(np.real(pre_frequency_cm_1) < 100.0)[0]
     pre_lowfreq = np.append(pre_lowfreq, np.arange(nrt_expected))  # catch at least nrt modes
@@ -430,6 +407,174 @@ def harmonic_analysis(hess, geom, mass, basisset, irrep_labels, dipder=None, pro
 
     #print('projhess = ', np.array_repr(mwhess_proj))
     force_constant_au, qL = np.linalg.eigh(mwhess_proj)
+    vibinfo = _vibinfo_from_modes(force_constant_au, qL, mass, TRspace, Uh, dipder)
+    frequency_cm_1 = vibinfo['omega'].data
+    active = vibinfo['TRV'].data
+
+    lowfreq = np.where(np.real(frequency_cm_1) < 100.0)[0]
+    lowfreq = np.append(lowfreq, np.arange(nrt_expected))  # catch at least nrt modes
+    for lf in set(lowfreq):
+        vlf = frequency_cm_1[lf]
+        if vlf.imag > vlf.real:
+            text.append('  post-proj low-frequency mode: {:9.4f}i [cm^-1] ({})'.format(vlf.imag, active[lf]))
+        else:
+            text.append('  post-proj low-frequency mode: {:9.4f}  [cm^-1] ({})'.format(vlf.real, active[lf]))
+    text.append('  post-proj  all modes:' + str(_format_omega(frequency_cm_1, 4)) + '\n')
+    if project_trans and not project_rot:
+        text.append(f'  Note that "Vibration"s include {nrt_expected - 3} un-projected rotation-like modes.')
+    elif not project_trans and not project_rot:
+        text.append(
+            f'  Note that "Vibration"s include {nrt_expected} un-projected rotation-like and translation-like modes.')
+
+    return vibinfo, '\n'.join(text)
+
+
+def harmonic_analysis_batch(hess,
+                            geom,
+                            mass,
+                            molecule,
+                            irrep_labels,
+                            dipder=None,
+                            project_trans=True,
+                            project_rot=True):
+    """Vibrational analysis of many Hessians of one molecule, or of one
+    Hessian under many sets of isotopic masses, as :py:func:`harmonic_analysis`.
+    The projector and SALCs are formed once per distinct mass vector, and all
+    members are diagonalized in one stacked eigensolve.
+
+    Parameters
+    ----------
+    hess : ndarray of float
+        (3*nat, 3*nat) or (nbatch, 3*nat, 3*nat) non-mass-weighted Hessian(s) in atomic units, [Eh/a0/a0].
+    geom : ndarray of float
+        (nat, 3) geometry [a0] at which Hessian(s) computed.
+    mass : ndarray of float
+        (nat,) or (nbatch, nat) atomic masses [u]. Irreps are only assigned where masses of
+        symmetry-equivalent atoms are alike.
+    molecule : qcdb.Molecule
+        Molecule in the frame of `geom`, as for :py:func:`harmonic_analysis`.
+    irrep_labels : list of str
+        Irreducible representation labels.
+    dipder : ndarray of float, optional
+        (3, 3 * nat) or (nbatch, 3, 3 * nat) dipole derivatives in atomic units.
+    project_trans : bool, optional
+        Idealized translations projected out of final vibrational analysis.
+    project_rot : bool, optional
+        Idealized rotations projected out of final vibrational analysis.
+
+    Returns
+    -------
+    list of dict
+        Dictionary of vibration Datum objects, as from :py:func:`harmonic_analysis`, for each of nbatch members.
+
+    Examples
+    --------
+    # H2O and D2O frequencies from one Hessian
+    >>> masses = [[15.99491462, 1.00782503, 1.00782503], [15.99491462, 2.01410178, 2.01410178]]
+    >>> h2o, d2o = harmonic_analysis_batch(hess, geom, masses, mol, mol.irrep_labels())
+
+    """
+    hess = np.asarray(hess, dtype=float)
+    geom = np.asarray(geom, dtype=float)
+    mass = np.asarray(mass, dtype=float)
+    nat = geom.shape[0]
+
+    if (hess.ndim in [2, 3] and hess.shape[-2:] == (3 * nat, 3 * nat) and mass.ndim in [1, 2]
+            and mass.shape[-1] == nat and geom.shape[1] == 3):
+        pass
+    else:
+        raise ValidationError(
+            f"""Dimension mismatch among mass ({mass.shape}), geometry ({geom.shape}), and Hessian ({hess.shape})""")
+
+    hess = hess.reshape(-1, 3 * nat, 3 * nat)
+    mass = mass.reshape(-1, nat)
+    nbatch = max(len(hess), len(mass))
+    if dipder is None or np.array(dipder).size == 0:
+        dipder = [None]
+    else:
+        dipder = np.asarray(dipder, dtype=float).reshape(-1, 3, 3 * nat)
+    if not all(len(arr) in [1, nbatch] for arr in [hess, mass, dipder]):
+        raise ValidationError(
+            f"""Batch size mismatch among mass ({len(mass)}), Hessian ({len(hess)}), and dipole derivatives ({len(dipder)})"""
+        )
+
+    # projectors & SALCs once per distinct set of masses
+    umass, minv = np.unique(mass, axis=0, return_inverse=True)
+    minv = np.broadcast_to(minv.ravel(), (nbatch, ))
+    hinv = np.broadcast_to(np.arange(len(hess)), (nbatch, ))
+
+    space = ('T' if project_trans else '') + ('R' if project_rot else '')
+    TRspaces = [_get_TR_space(m, geom, space=space, tol=LINEAR_A_TOL) for m in umass]
+    P = np.array([np.identity(3 * nat) - TRspace.T @ TRspace for TRspace in TRspaces])
+
+    # SALCs formed once w/ trans & rot, then projected for each set of masses
+    Uh_TR = _irrep_salcs(molecule, irrep_labels, umass[0], project_trans=False, project_rot=False)
+    Uhs = []
+    for Pm in P:
+        Uh = collections.OrderedDict()
+        for h, salcs in Uh_TR.items():
+            tmp = np.array(_orthonormalize(salcs @ Pm))
+            if tmp.size > 0:
+                Uh[h] = tmp
+        Uhs.append(Uh)
+
+    # mass-weight, project & solve together
+    sqrtmmminv = np.divide(1.0, np.repeat(np.sqrt(umass), 3, axis=1))[minv]
+    mwhess = sqrtmmminv[:, :, None] * hess[hinv] * sqrtmmminv[:, None, :]
+    mwhess_proj = P[minv] @ mwhess @ P[minv]
+    force_constant_au, qL = np.linalg.eigh(mwhess_proj)
+
+    return [
+        _vibinfo_from_modes(force_constant_au[b], qL[b], umass[minv[b]], TRspaces[minv[b]], Uhs[minv[b]],
+                            dipder[b % len(dipder)]) for b in range(nbatch)
+    ]
+
+
+def _irrep_salcs(molecule, irrep_labels, mass, project_trans=True, project_rot=True):
+    """Form the CdSALCs of `molecule`, possibly w/o trans & rot, as a dict of
+    (nsalc, 3 * nat) arrays keyed by label from `irrep_labels` for irreps with SALCs.
+
+    """
+    Uh = collections.OrderedDict()
+    if isinstance(molecule, LibmintsMolecule):
+        salcs = cdsalcs(molecule, project_translations=project_trans, project_rotations=project_rot, masses=mass)
+        for h, lbl in enumerate(irrep_labels):
+            tmp = np.array([salc for hsalc, salc in salcs if hsalc == h])
+            if tmp.size > 0:
+                Uh[lbl] = tmp
+
+    else:
+        from psi4 import core
+
+        mints = core.MintsHelper(molecule)
+        psi_cdsalcs = mints.cdsalcs(0xFF, project_trans, project_rot)
+
+        for h, lbl in enumerate(irrep_labels):
+            tmp = np.asarray(psi_cdsalcs.matrix_irrep(h))
+            if tmp.size > 0:
+                Uh[lbl] = tmp
+
+    return Uh
+
+
+def _vec_in_space(vecs, space, tol=1.0e-4):
+    """Whether each column of `vecs` does *not* add an extra dof to the
+    vector space spanned by the rows of `space`.
+
+    """
+    merged = np.concatenate((np.broadcast_to(space, (vecs.shape[1], ) + space.shape), vecs.T[:, None, :]), axis=1)
+    s = np.linalg.svd(merged, compute_uv=False)
+    return (s[:, -1] < tol)
+
+
+def _vibinfo_from_modes(force_constant_au, qL, mass, TRspace, Uh, dipder=None):
+    """Vibration Datum dictionary of :py:func:`harmonic_analysis` from the
+    eigenvalues `force_constant_au` [Eh/a0/a0/u] and eigenvectors `qL` of
+    the projected mass-weighted Hessian.
+
+    """
+    vibinfo = {}
+    sqrtmmminv = np.divide(1.0, np.repeat(np.sqrt(mass), 3))
 
     # expected order for vibrations is steepest downhill to steepest uphill
     idx = np.argsort(force_constant_au)
@@ -439,7 +584,7 @@ def harmonic_analysis(hess, geom, mass, basisset, irrep_labels, dipder=None, pro
     vibinfo['q'] = Datum('normal mode', 'a0 u^1/2', qL, comment='normalized mass-weighted')
 
     # frequency, LAB II.17
-    frequency_cm_1 = np.lib.scimath.sqrt(force_constant_au) * uconv_cm_1
+    frequency_cm_1 = np.lib.scimath.sqrt(force_constant_au) * UCONV_CM_1
     vibinfo['omega'] = Datum('frequency', 'cm^-1', frequency_cm_1)
 
     # degeneracies
@@ -448,11 +593,14 @@ def harmonic_analysis(hess, geom, mass, basisset, irrep_labels, dipder=None, pro
 
     # look among the symmetry subspaces h for one to which the normco
     #   of vib does *not* add an extra dof to the vector space
+    in_TR = _vec_in_space(qL, TRspace, 1.0e-4)
+    in_h = {h: _vec_in_space(qL, Uh[h], 1.0e-4) for h in Uh.keys()}
+
     active = []
     irrep_classification = []
     for idx, vib in enumerate(frequency_cm_1):
 
-        if vec_in_space(qL[:, idx], TRspace, 1.0e-4):
+        if in_TR[idx]:
             active.append('TR')
             irrep_classification.append(None)
 
@@ -460,7 +608,7 @@ def harmonic_analysis(hess, geom, mass, basisset, irrep_labels, dipder=None, pro
             active.append('V')
 
             for h in Uh.keys():
-                if vec_in_space(qL[:, idx], Uh[h], 1.0e-4):
+                if in_h[h][idx]:
                     irrep_classification.append(h)
                     break
             else:
@@ -473,21 +621,6 @@ def harmonic_analysis(hess, geom, mass, basisset, irrep_labels, dipder=None, pro
     vibinfo['TRV'] = Datum('translation/rotation/vibration', '', active, numeric=False)
     vibinfo['gamma'] = Datum('irreducible representation', '', irrep_classification, numeric=False)
 
-    lowfreq = np.where(np.real(frequency_cm_1) < 100.0)[0]
-    lowfreq = np.append(lowfreq, np.arange(nrt_expected))  # catch at least nrt modes
-    for lf in set(lowfreq):
-        vlf = frequency_cm_1[lf]
-        if vlf.imag > vlf.real:
-            text.append('  post-proj low-frequency mode: {:9.4f}i [cm^-1] ({})'.format(vlf.imag, active[lf]))
-        else:
-            text.append('  post-proj low-frequency mode: {:9.4f}  [cm^-1] ({})'.format(vlf.real, active[lf]))
-    text.append('  post-proj  all modes:' + str(_format_omega(frequency_cm_1, 4)) + '\n')
-    if project_trans and not project_rot:
-        text.append(f'  Note that "Vibration"s include {nrt_expected - 3} un-projected rotation-like modes.')
-    elif not project_trans and not project_rot:
-        text.append(
-            f'  Note that "Vibration"s include {nrt_expected} un-projected rotation-like and translation-like modes.')
-
     # general conversion factors, LAB II.11
     uconv_K = (qcel.constants.h * qcel.constants.na * 1.0e21) / (8 * np.pi * np.pi * qcel.constants.c)
     uconv_S = np.sqrt((qcel.constants.c * (2 * np.pi * qcel.constants.bohr2angstroms)**2) /
@@ -552,7 +685,7 @@ def harmonic_analysis(hess, geom, mass, basisset, irrep_labels, dipder=None, pro
     vib_temperature_K = frequency_cm_1.real * uconv_K
     vibinfo['theta_vib'] = Datum('char temp', 'K', vib_temperature_K)
 
-    return vibinfo, '\n'.join(text)
+    return vibinfo
 
 
 def _br(string):
@@ -788,6 +921,175 @@ def print_vibs(vibinfo, atom_lbl=None, normco='x', shortlong=True, **kwargs):
     return text
 
 
+_thermo_pieces = {
+    'S': ['elec', 'trans', 'rot', 'vib', 'tot'],
+    'Cv': ['elec', 'trans', 'rot', 'vib', 'tot'],
+    'Cp': ['elec', 'trans', 'rot', 'vib', 'tot'],
+    'ZPE': ['elec', 'trans', 'rot', 'vib', 'corr', 'tot'],
+    'E': ['elec', 'trans', 'rot', 'vib', 'corr', 'tot'],
+    'H': ['elec', 'trans', 'rot', 'vib', 'corr', 'tot'],
+    'G': ['elec', 'trans', 'rot', 'vib', 'corr', 'tot'],
+}
+thermo_dtype = np.dtype([(piece + '_' + term, float) for piece, terms in _thermo_pieces.items() for term in terms])
+
+
+def _thermo_theta_vib(vibinfo):
+    """Characteristic temperatures [K] of the real vibrations of `vibinfo`, warning of those excluded or ill-treated."""
+
+    vibonly = filter_nonvib(vibinfo)
+    omega_str = _format_omega(vibonly['omega'].data, decimals=4)
+
+    imagfreqidx = np.where(vibonly['omega'].data.imag > vibonly['omega'].data.real)[0]
+    if len(imagfreqidx):
+        print("Warning: thermodynamics relations excluded imaginary frequencies: {}".format(omega_str[imagfreqidx]))
+
+    filtered_theta_vib = np.delete(vibonly['theta_vib'].data, imagfreqidx, None)
+    filtered_omega_str = np.delete(omega_str, imagfreqidx, None)
+
+    lowfreqidx = np.where(filtered_theta_vib < 900.)[0]
+    if len(lowfreqidx):
+        print("Warning: used thermodynamics relations inappropriate for low-frequency modes: {}".format(
+            filtered_omega_str[lowfreqidx]))
+
+    ZPE_cm_1 = 1 / 2 * np.sum(vibonly['omega'].data.real)
+
+    return filtered_theta_vib, ZPE_cm_1
+
+
+def thermo_grid(vibinfos, T, P, multiplicity, molecular_mass, E0, sigma, rot_const, rotor_type=None):
+    """Perform thermochemical analysis as thermo() for one or many molecules over
+    grids of temperature and pressure at once.
+
+    Parameters
+    ----------
+    vibinfos : dict of vibration Datum or list of such dict
+        Results of Hessian analysis of a molecule or of each of `nmol` molecules.
+    T : float or array_like of float
+        (nT,) temperatures in [K].
+    P : float or array_like of float
+        (nP,) pressures in [Pa].
+    multiplicity, molecular_mass, E0, sigma : float or array_like of float
+        As for thermo(), either one value for all molecules or (nmol,) values.
+    rot_const : ndarray of floats
+        (3,) or (nmol, 3) rotational constants in [cm^-1].
+    rotor_type : str or list of str, optional
+        As for thermo(), either one value for all molecules or (nmol,) values.
+
+    Returns
+    -------
+    ndarray of thermo_dtype
+        (nmol, nT, nP) structured array, or (nT, nP) if `vibinfos` a single dict.
+        Fields are named as the entries of thermo() like ``G_tot`` and ``S_vib``
+        and have the same units, [mEh/K] for S, Cv, and Cp and [Eh] otherwise.
+
+    """
+    single = isinstance(vibinfos, dict)
+    if single:
+        vibinfos = [vibinfos]
+    nmol = len(vibinfos)
+
+    def per_mol(arg, ndim=0):
+        arg = np.asarray(arg)
+        return np.broadcast_to(arg, (nmol, ) + arg.shape[arg.ndim - ndim:])
+
+    T = np.atleast_1d(np.asarray(T, dtype=float))[None, :, None]  # (1, nT, 1)
+    P = np.atleast_1d(np.asarray(P, dtype=float))[None, None, :]  # (1, 1, nP)
+    multiplicity = per_mol(multiplicity)[:, None, None]
+    molecular_mass = per_mol(molecular_mass)[:, None, None]
+    E0 = per_mol(E0)[:, None, None]
+    sigma = per_mol(sigma)[:, None, None]
+    rot_const = per_mol(rot_const, 1).astype(float)
+    rotor_type = np.broadcast_to(np.asarray(rotor_type, dtype=object), (nmol, ))
+
+    sm = {}
+    zero = np.zeros((nmol, 1, 1))
+
+    # electronic
+    sm[('S', 'elec')] = np.log(multiplicity) + zero
+    for piece in ['Cv', 'Cp', 'ZPE', 'E', 'H']:
+        sm[(piece, 'elec')] = zero
+
+    # translational
+    beta = 1 / (qcel.constants.kb * T)
+    q_trans = (2.0 * np.pi * molecular_mass * qcel.constants.amu2kg /
+               (beta * qcel.constants.h * qcel.constants.h))**1.5 * qcel.constants.na / (beta * P)
+    sm[('S', 'trans')] = 5 / 2 + np.log(q_trans / qcel.constants.na)
+    sm[('Cv', 'trans')] = 3 / 2 + zero
+    sm[('Cp', 'trans')] = 5 / 2 + zero
+    sm[('ZPE', 'trans')] = zero
+    sm[('E', 'trans')] = 3 / 2 * T + zero
+    sm[('H', 'trans')] = 5 / 2 * T + zero
+
+    # rotational, S = n_rot * (1 + ln T) + ln(q_rot / T^n_rot) for n_rot = 0, 1, 3/2 of atom, linear, other
+    n_rot = np.zeros(nmol)
+    lnq_rot = np.zeros(nmol)
+    theta_rot = rot_const * 100 * qcel.constants.c * qcel.constants.h / qcel.constants.kb
+    for mol in range(nmol):
+        if rotor_type[mol] == "RT_ATOM":
+            pass
+        elif rotor_type[mol] == "RT_LINEAR":
+            n_rot[mol] = 1.0
+            lnq_rot[mol] = -math.log(sigma[mol, 0, 0] * theta_rot[mol, 1])
+        else:
+            n_rot[mol] = 3 / 2
+            lnq_rot[mol] = 0.5 * math.log(math.pi) - math.log(sigma[mol, 0, 0]) - 0.5 * np.sum(np.log(theta_rot[mol]))
+    n_rot = n_rot[:, None, None]
+    sm[('S', 'rot')] = n_rot * (1.0 + np.log(T)) + lnq_rot[:, None, None]
+    sm[('Cv', 'rot')] = n_rot + zero
+    sm[('Cp', 'rot')] = n_rot + zero
+    sm[('ZPE', 'rot')] = zero
+    sm[('E', 'rot')] = n_rot * T
+    sm[('H', 'rot')] = sm[('E', 'rot')]
+
+    # vibrational, each molecule's modes padded to a common length by infinitely stiff ones that contribute nothing
+    thetas = []
+    for vibinfo in vibinfos:
+        theta_vib, ZPE_cm_1 = _thermo_theta_vib(vibinfo)
+        assert (abs(ZPE_cm_1 - np.sum(theta_vib) / 2 * qcel.constants.R * qcel.constants.hartree2wavenumbers * 0.001 /
+                    qcel.constants.hartree2kJmol) < 0.1)
+        thetas.append(theta_vib)
+    theta_vib = np.full((nmol, max(len(theta) for theta in thetas)), np.inf)
+    for mol, theta in enumerate(thetas):
+        theta_vib[mol, :len(theta)] = theta
+
+    rT = theta_vib[:, None, None, :] / T[..., None]  # reduced temperature, (nmol, nT, 1, nmode)
+    finite = np.isfinite(theta_vib)[:, None, None, :]
+    with np.errstate(over='ignore', invalid='ignore'):
+        occupation = np.where(finite, 1 / np.expm1(rT), 0.0)
+        sm[('S', 'vib')] = np.sum(np.where(finite, rT * occupation - np.log(-np.expm1(-rT)), 0.0), axis=-1)
+        sm[('Cv', 'vib')] = np.sum(np.where(finite, (rT / 2 / np.sinh(rT / 2))**2, 0.0), axis=-1)
+    sm[('Cp', 'vib')] = sm[('Cv', 'vib')]
+    sm[('ZPE', 'vib')] = np.sum(np.where(np.isfinite(theta_vib), theta_vib, 0.0), axis=-1)[:, None, None] / 2
+    sm[('E', 'vib')] = sm[('ZPE', 'vib')] + np.sum(np.where(finite, theta_vib[:, None, None, :], 0.0) * occupation,
+                                                   axis=-1)
+    sm[('H', 'vib')] = sm[('E', 'vib')]
+
+    # compute Gibbs
+    for term in ['elec', 'trans', 'rot', 'vib']:
+        sm[('G', term)] = sm[('H', term)] - T * sm[('S', term)]
+
+    # convert to atomic units
+    # terms above are unitless (S, Cv, Cp) or in units of temperature (ZPE, E, H, G) as expressions are divided by R.
+    # R [Eh/K], computed as below, slightly diff in 7th sigfig from 3.1668114e-6 (k_B in [Eh/K])
+    #    value listed https://en.wikipedia.org/wiki/Boltzmann_constant
+    uconv_R_EhK = qcel.constants.R / qcel.constants.hartree2kJmol
+    grid = np.zeros((nmol, T.shape[1], P.shape[2]), dtype=thermo_dtype)
+    for piece, terms in _thermo_pieces.items():
+        uconv = uconv_R_EhK if piece in ['S', 'Cv', 'Cp'] else uconv_R_EhK * 0.001  # [mEh/K] <-- [] or [Eh] <-- [K]
+        for term in ['elec', 'trans', 'rot', 'vib']:
+            grid[piece + '_' + term] = sm[(piece, term)] * uconv
+
+        # sum corrections and totals
+        total = grid[piece + '_elec'] + grid[piece + '_trans'] + grid[piece + '_rot'] + grid[piece + '_vib']
+        if piece in ['S', 'Cv', 'Cp']:
+            grid[piece + '_tot'] = total
+        else:
+            grid[piece + '_corr'] = total
+            grid[piece + '_tot'] = E0 + total
+
+    return grid[0] if single else grid
+
+
 def thermo(vibinfo, T, P, multiplicity, molecular_mass, E0, sigma, rot_const, rotor_type=None):
     """Perform thermochemical analysis from vibrational output.
 
@@ -817,8 +1119,6 @@ def thermo(vibinfo, T, P, multiplicity, molecular_mass, E0, sigma, rot_const, ro
         Second is formatted presentation of analysis.
 
     """
-    sm = collections.defaultdict(float)
-
     # conditions
     therminfo = {}
     therminfo['E0'] = Datum('E0', 'Eh', E0)
@@ -827,91 +1127,9 @@ def thermo(vibinfo, T, P, multiplicity, molecular_mass, E0, sigma, rot_const, ro
     therminfo['T'] = Datum('temperature', 'K', T)
     therminfo['P'] = Datum('pressure', 'Pa', P)
 
-    # electronic
-    q_elec = multiplicity
-    sm[('S', 'elec')] = math.log(q_elec)
-
-    # translational
-    beta = 1 / (qcel.constants.kb * T)
-    q_trans = (2.0 * np.pi * molecular_mass * qcel.constants.amu2kg /
-               (beta * qcel.constants.h * qcel.constants.h))**1.5 * qcel.constants.na / (beta * P)
-    sm[('S', 'trans')] = 5 / 2 + math.log(q_trans / qcel.constants.na)
-    sm[('Cv', 'trans')] = 3 / 2
-    sm[('Cp', 'trans')] = 5 / 2
-    sm[('E', 'trans')] = 3 / 2 * T
-    sm[('H', 'trans')] = 5 / 2 * T
-
-    # rotational
-    if rotor_type == "RT_ATOM":
-        pass
-    elif rotor_type == "RT_LINEAR":
-        q_rot = 1. / (beta * sigma * 100 * qcel.constants.c * qcel.constants.h * rot_const[1])
-        sm[('S', 'rot')] = 1.0 + math.log(q_rot)
-        sm[('Cv', 'rot')] = 1
-        sm[('Cp', 'rot')] = 1
-        sm[('E', 'rot')] = T
-    else:
-        phi_A, phi_B, phi_C = rot_const * 100 * qcel.constants.c * qcel.constants.h / qcel.constants.kb
-        q_rot = math.sqrt(math.pi) * T**1.5 / (sigma * math.sqrt(phi_A * phi_B * phi_C))
-        sm[('S', 'rot')] = 3 / 2 + math.log(q_rot)
-        sm[('Cv', 'rot')] = 3 / 2
-        sm[('Cp', 'rot')] = 3 / 2
-        sm[('E', 'rot')] = 3 / 2 * T
-    sm[('H', 'rot')] = sm[('E', 'rot')]
-
-    # vibrational
-    vibonly = filter_nonvib(vibinfo)
-    ZPE_cm_1 = 1 / 2 * np.sum(vibonly['omega'].data.real)
-    omega_str = _format_omega(vibonly['omega'].data, decimals=4)
-
-    imagfreqidx = np.where(vibonly['omega'].data.imag > vibonly['omega'].data.real)[0]
-    if len(imagfreqidx):
-        print("Warning: thermodynamics relations excluded imaginary frequencies: {}".format(omega_str[imagfreqidx]))
-
-    filtered_theta_vib = np.delete(vibonly['theta_vib'].data, imagfreqidx, None)
-    filtered_omega_str = np.delete(omega_str, imagfreqidx, None)
-    rT = filtered_theta_vib / T  # reduced temperature
-
-    lowfreqidx = np.where(filtered_theta_vib < 900.)[0]
-    if len(lowfreqidx):
-        print("Warning: used thermodynamics relations inappropriate for low-frequency modes: {}".format(
-            filtered_omega_str[lowfreqidx]))
-
-    sm[('S', 'vib')] = np.sum(rT / np.expm1(rT) - np.log(1 - np.exp(-rT)))
-    sm[('Cv', 'vib')] = np.sum(np.exp(rT) * (rT / np.expm1(rT))**2)
-    sm[('Cp', 'vib')] = sm[('Cv', 'vib')]
-    sm[('ZPE', 'vib')] = np.sum(rT) * T / 2
-    sm[('E', 'vib')] = sm[('ZPE', 'vib')] + np.sum(rT * T / np.expm1(rT))
-    sm[('H', 'vib')] = sm[('E', 'vib')]
-
-    assert (abs(ZPE_cm_1 - sm[('ZPE', 'vib')] * qcel.constants.R * qcel.constants.hartree2wavenumbers * 0.001 /
-                qcel.constants.hartree2kJmol) < 0.1)
-
-    #real_vibs = np.ma.masked_where(vibinfo['omega'].data.imag > vibinfo['omega'].data.real, vibinfo['omega'].data)
-
-    # compute Gibbs
-    for term in ['elec', 'trans', 'rot', 'vib']:
-        sm[('G', term)] = sm[('H', term)] - T * sm[('S', term)]
-
-    # convert to atomic units
-    for term in ['elec', 'trans', 'rot', 'vib']:
-        # terms above are unitless (S, Cv, Cp) or in units of temperature (ZPE, E, H, G) as expressions are divided by R.
-        # R [Eh/K], computed as below, slightly diff in 7th sigfig from 3.1668114e-6 (k_B in [Eh/K])
-        #    value listed https://en.wikipedia.org/wiki/Boltzmann_constant
-        uconv_R_EhK = qcel.constants.R / qcel.constants.hartree2kJmol
-        for piece in ['S', 'Cv', 'Cp']:
-            sm[(piece, term)] *= uconv_R_EhK  # [mEh/K] <-- []
-        for piece in ['ZPE', 'E', 'H', 'G']:
-            sm[(piece, term)] *= uconv_R_EhK * 0.001  # [Eh] <-- [K]
-
-    # sum corrections and totals
-    for piece in ['S', 'Cv', 'Cp']:
-        for term in ['elec', 'trans', 'rot', 'vib']:
-            sm[(piece, 'tot')] += sm[(piece, term)]
-    for piece in ['ZPE', 'E', 'H', 'G']:
-        for term in ['elec', 'trans', 'rot', 'vib']:
-            sm[(piece, 'corr')] += sm[(piece, term)]
-        sm[(piece, 'tot')] = E0 + sm[(piece, 'corr')]
+    grid = thermo_grid(vibinfo, T, P, multiplicity, molecular_mass, E0, sigma, rot_const, rotor_type=rotor_type)
+    sm = collections.defaultdict(float)
+    sm.update((tuple(field.split('_')), float(grid[field][0, 0])) for field in thermo_dtype.names)
 
     terms = collections.OrderedDict()
     terms['elec'] = '  Electronic'